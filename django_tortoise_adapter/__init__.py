@@ -1,4 +1,48 @@
-from .bridge import run_async
-from .core import TortoiseManager, activate, patch_model
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["activate", "patch_model", "run_async", "TortoiseManager"]
+if TYPE_CHECKING:
+    from django_tortoise_adapter.bridge import (
+        run_async,
+        start_background_loop,
+        stop_background_loop,
+    )
+    from django_tortoise_adapter.concurrency import gather
+    from django_tortoise_adapter.core import TortoiseManager, activate, patch_model
+    from django_tortoise_adapter.loaders import use_dataloader
+    from django_tortoise_adapter.transactions import atomic
+
+__all__ = [
+    "TortoiseManager",
+    "activate",
+    "atomic",
+    "gather",
+    "patch_model",
+    "run_async",
+    "start_background_loop",
+    "stop_background_loop",
+    "use_dataloader",
+]
+
+# Imported on first access, so that importing the package (e.g. from
+# INSTALLED_APPS) doesn't import Tortoise
+_EXPORTS = {
+    "TortoiseManager": "django_tortoise_adapter.core",
+    "activate": "django_tortoise_adapter.core",
+    "atomic": "django_tortoise_adapter.transactions",
+    "gather": "django_tortoise_adapter.concurrency",
+    "patch_model": "django_tortoise_adapter.core",
+    "run_async": "django_tortoise_adapter.bridge",
+    "start_background_loop": "django_tortoise_adapter.bridge",
+    "stop_background_loop": "django_tortoise_adapter.bridge",
+    "use_dataloader": "django_tortoise_adapter.loaders",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -2,12 +2,20 @@
 ASGI wrapper for Django-Tortoise Adapter.
 """
 
+from contextlib import ExitStack
 from typing import Any
 
 from django.conf import settings
 from tortoise import Tortoise
 
-from django_tortoise_adapter.core import patch_model
+from django_tortoise_adapter.core import init_tortoise, patch_models
+from django_tortoise_adapter.instrumentation import (
+    QUERY_STATS_SCOPE_KEY,
+    QueryStats,
+    track_queries,
+)
+from django_tortoise_adapter.loaders import use_dataloader
+from django_tortoise_adapter.routers import sticky_after_write
 
 
 class TortoiseASGIWrapper:
@@ -25,29 +33,13 @@ class TortoiseASGIWrapper:
             while True:
                 message = await receive()
                 if message["type"] == "lifespan.startup":
-                    from django.apps import apps
+                    # 1. Translate models (apps filtered by the
+                    # TORTOISE_ADAPTER_APPS/EXCLUDE_APPS settings)
+                    patch_models(lazy=getattr(settings, "TORTOISE_ADAPTER_LAZY", False))
 
-                    # 1. Translate models
-                    for app_config in apps.get_app_configs():
-                        for model in app_config.get_models():
-                            patch_model(model)
-
-                    # 2. Init Tortoise
-                    # Default to in-memory sqlite if not configured
-                    db_url = "sqlite://:memory:"
-                    if (
-                        hasattr(settings, "TORTOISE_ORM")
-                        and "connections" in settings.TORTOISE_ORM
-                    ):
-                        db_url = settings.TORTOISE_ORM["connections"].get(
-                            "default", db_url
-                        )
-
-                    await Tortoise.init(
-                        db_url=db_url,
-                        modules={"models": ["django_tortoise_adapter.models"]},
-                        _enable_global_fallback=True,
-                    )
+                    # 2. Init Tortoise, connections are built from DATABASES
+                    # and TORTOISE_ORM (see config.get_tortoise_config)
+                    await init_tortoise(_enable_global_fallback=True)
                     await send({"type": "lifespan.startup.complete"})
 
                 elif message["type"] == "lifespan.shutdown":
@@ -55,8 +47,45 @@ class TortoiseASGIWrapper:
                     await send({"type": "lifespan.shutdown.complete"})
                     return
         else:
+            await self.handle(scope, receive, send)
+
+    async def handle(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        """
+        Runs the application within the per-request features enabled in the
+        settings.
+        """
+        with ExitStack() as stack:
+            if getattr(settings, "TORTOISE_ADAPTER_STICKY_AFTER_WRITE", False):
+                # Reads after a write of the request go to the write database
+                stack.enter_context(sticky_after_write())
+            if scope["type"] == "http" and getattr(
+                settings, "TORTOISE_ADAPTER_QUERY_STATS", False
+            ):
+                stats = stack.enter_context(track_queries())
+                # Available to the views as request.scope[QUERY_STATS_SCOPE_KEY]
+                scope = {**scope, QUERY_STATS_SCOPE_KEY: stats}
+                send = self._add_query_stats_headers(send, stats)
+            if scope["type"] == "http" and getattr(
+                settings, "TORTOISE_ADAPTER_DATALOADER", False
+            ):
+                # Batches the get(pk=...) lookups of the request
+                stack.enter_context(use_dataloader())
             await self.application(scope, receive, send)
 
+    @staticmethod
+    def _add_query_stats_headers(send: Any, stats: QueryStats) -> Any:
+        async def send_with_headers(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    *message.get("headers", []),
+                    (b"x-tortoise-query-count", str(stats.count).encode()),
+                    (b"x-tortoise-query-time", f"{stats.duration:.6f}".encode()),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        return send_with_headers
+
 
 def get_asgi_application() -> TortoiseASGIWrapper:
     """
@@ -1,22 +1,91 @@
+import asyncio
+import threading
 from typing import Any, TypeVar
 
 from asgiref.sync import async_to_sync
 
 T = TypeVar("T")
 
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_thread: threading.Thread | None = None
+_background_lock = threading.Lock()
+
+
+def start_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Starts a long-lived event loop in a daemon thread (only once per process).
+
+    Once started, run_async submits every awaitable to this loop, so the
+    Tortoise connections opened through it stay bound to a single loop and
+    sync callers (e.g. WSGI threads) don't pay for loop setup on every call.
+    """
+    global _background_loop, _background_thread  # pylint: disable=global-statement
+
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="django-tortoise-adapter-loop",
+                daemon=True,
+            )
+            thread.start()
+            _background_loop = loop
+            _background_thread = thread
+        return _background_loop
+
+
+def stop_background_loop() -> None:
+    """
+    Stops the background event loop started by start_background_loop, if any.
+    """
+    global _background_loop, _background_thread  # pylint: disable=global-statement
+
+    with _background_lock:
+        loop, thread = _background_loop, _background_thread
+        _background_loop = None
+        _background_thread = None
+
+    if loop is None or thread is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Returns the background event loop if it has been started.
+    """
+    return _background_loop
+
 
 def run_async(awaitable: Any) -> Any:
     """
     Helper to run an async awaitable synchronously using asgiref.
+
+    If the background loop is running, the awaitable is executed there instead.
     """
 
-    import asyncio
+    async def wrapper() -> Any:
+        return await awaitable
+
+    background_loop = _background_loop
 
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
         loop = None
 
+    if background_loop is not None:
+        if loop is background_loop:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError(
+                "run_async cannot be called from the background event loop thread."
+            )
+        return asyncio.run_coroutine_threadsafe(wrapper(), background_loop).result()
+
     if loop and loop.is_running():
         import nest_asyncio  # type: ignore[import-not-found, import-untyped]
 
@@ -26,7 +95,4 @@ def run_async(awaitable: Any) -> Any:
         # If it's a future or other awaitable
         return loop.run_until_complete(asyncio.ensure_future(awaitable))
 
-    async def wrapper() -> Any:
-        return await awaitable
-
     return async_to_sync(wrapper)()
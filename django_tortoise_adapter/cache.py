@@ -0,0 +1,188 @@
+"""
+Opt-in query result cache for TortoiseManager/TortoiseQuerySet.
+
+Entries are namespaced by model; every write through the manager bumps the
+namespace generation, which invalidates all the entries of that model at once.
+Readers read the generation before running the query and store the result
+only if it is still current, so a result read while a write was running is
+never stored under the generation of that write.
+"""
+
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+# Returned by the backends when a key is not cached
+MISSING = object()
+
+DEFAULT_MAXSIZE = 1024
+
+
+class ResultCacheBackend(ABC):
+    """
+    Base class of the result cache backends.
+    """
+
+    @abstractmethod
+    async def get_generation(self, namespace: str) -> int:
+        """
+        Returns the current generation of the namespace.
+        """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str, generation: int | None = None) -> Any:
+        """
+        Returns the cached value or MISSING, in the given generation (the
+        current one if None).
+        """
+
+    @abstractmethod
+    async def set(
+        self, namespace: str, key: str, value: Any, generation: int | None = None
+    ) -> None:
+        """
+        Stores the value in the current generation, unless it is not the
+        given one anymore (the namespace was invalidated in the meantime).
+        """
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> None:
+        """
+        Invalidates every entry of the namespace.
+        """
+
+
+class LocMemResultCache(ResultCacheBackend):
+    """
+    In-process LRU cache with an optional time to live (in seconds).
+
+    Cached model instances are shared between the callers, so they
+    must not be modified.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float | None = None):
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, int, str], tuple[float | None, Any]]
+        self._entries = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def get(self, namespace: str, key: str, generation: int | None = None) -> Any:
+        if generation is None:
+            generation = await self.get_generation(namespace)
+        entry_key = (namespace, generation, key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[entry_key]
+            return MISSING
+        self._entries.move_to_end(entry_key)
+        return value
+
+    async def set(
+        self, namespace: str, key: str, value: Any, generation: int | None = None
+    ) -> None:
+        current = await self.get_generation(namespace)
+        if generation is not None and generation != current:
+            return
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        entry_key = (namespace, current, key)
+        self._entries[entry_key] = (expires_at, value)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        # Entries of older generations can't be read anymore, drop them now
+        for entry_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[entry_key]
+
+
+class DjangoResultCache(ResultCacheBackend):
+    """
+    Stores the results in one of Django's CACHES, so they can be shared
+    between processes. Values must be picklable for most Django backends.
+    """
+
+    def __init__(
+        self,
+        alias: str = "default",
+        ttl: float | None = None,
+        key_prefix: str = "django_tortoise_adapter",
+    ) -> None:
+        self.alias = alias
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self) -> Any:
+        # pylint: disable=import-outside-toplevel
+        from django.core.cache import caches
+
+        return caches[self.alias]
+
+    def _get_generation_key(self, namespace: str) -> str:
+        return f"{self.key_prefix}:{namespace}:generation"
+
+    def _get_key(self, namespace: str, key: str, generation: int) -> str:
+        return f"{self.key_prefix}:{namespace}:{generation}:{key}"
+
+    async def get_generation(self, namespace: str) -> int:
+        generation = await self.cache.aget(self._get_generation_key(namespace), 0)
+        return int(generation)
+
+    async def get(self, namespace: str, key: str, generation: int | None = None) -> Any:
+        if generation is None:
+            generation = await self.get_generation(namespace)
+        return await self.cache.aget(self._get_key(namespace, key, generation), MISSING)
+
+    async def set(
+        self, namespace: str, key: str, value: Any, generation: int | None = None
+    ) -> None:
+        current = await self.get_generation(namespace)
+        if generation is not None and generation != current:
+            return
+        await self.cache.aset(self._get_key(namespace, key, current), value, self.ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        generation_key = self._get_generation_key(namespace)
+        # Generation keys never expire, only the entries do
+        if await self.cache.aadd(generation_key, 1, None):
+            return
+        try:
+            await self.cache.aincr(generation_key)
+        except ValueError:
+            # Evicted between add and incr
+            await self.cache.aset(generation_key, 1, None)
+
+
+def get_result_cache_key(*parts: Any) -> str:
+    """
+    Returns a compact, stable key for the given query description.
+    """
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def get_result_cache_from_settings(options: dict[str, Any]) -> ResultCacheBackend:
+    """
+    Builds a backend from a TORTOISE_RESULT_CACHE entry, e.g.
+    {"maxsize": 1000, "ttl": 30} or {"cache_alias": "default", "ttl": 30}.
+    """
+    if "cache_alias" in options:
+        return DjangoResultCache(alias=options["cache_alias"], ttl=options.get("ttl"))
+    return LocMemResultCache(
+        maxsize=options.get("maxsize", DEFAULT_MAXSIZE), ttl=options.get("ttl")
+    )
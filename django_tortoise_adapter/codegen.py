@@ -0,0 +1,180 @@
+"""
+Ahead-of-time generation of the Tortoise models.
+
+`manage.py tortoise_codegen` writes the translated models to a Python
+module (TORTOISE_ADAPTER_MODELS_MODULE), with a fingerprint of the Django
+models they were translated from. When that fingerprint still matches,
+activate() and TortoiseASGIWrapper import the generated models instead of
+translating the Django models in every process.
+"""
+
+import functools
+import hashlib
+import importlib
+import logging
+from typing import Any
+
+import tortoise
+from django.conf import settings
+from django.db import models as django_models
+from django.db.migrations.serializer import (  # type: ignore[attr-defined]
+    DeconstructableSerializer,
+)
+
+from django_tortoise_adapter.translator import TortoiseTranslator
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the translation changes, so that older modules are regenerated
+CODEGEN_VERSION = 2
+
+HEADER = """\
+# Generated by `manage.py tortoise_codegen` from the Django models, do not edit.
+# Regenerate it when the models change: outdated models are not used.
+"""
+
+
+def _describe(value: Any) -> Any:
+    # Stable description of a deconstructed value (no object addresses)
+    if isinstance(value, (list, tuple)):
+        return [_describe(item) for item in value]
+    if isinstance(value, dict):
+        return sorted((str(key), _describe(item)) for key, item in value.items())
+    if isinstance(value, functools.partial):
+        return [_describe(value.func), _describe(value.args), _describe(value.keywords)]
+    if hasattr(value, "deconstruct") and not isinstance(value, type):
+        return _describe(value.deconstruct())
+    if callable(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+def get_fingerprint(django_models_list: list[type[django_models.Model]]) -> str:
+    """
+    Returns a hash of what the translation of the models depends on: their
+    fields, tables, indexes and constraints.
+    """
+    state = [CODEGEN_VERSION, tortoise.__version__]
+    for django_model in sorted(django_models_list, key=lambda model: model._meta.label):
+        meta = django_model._meta  # pylint: disable=protected-access
+        state.append(
+            [
+                meta.label,
+                django_model.__name__,
+                meta.db_table,
+                [field.deconstruct() for field in [*meta.fields, *meta.many_to_many]],
+                meta.unique_together,
+                meta.indexes,
+                meta.constraints,
+            ]
+        )
+    return hashlib.sha256(repr(_describe(state)).encode()).hexdigest()
+
+
+def _generate_model(tortoise_model: type[Any], imports: set[str]) -> str:
+    meta = tortoise_model._meta  # pylint: disable=protected-access
+    lines = [f"class {tortoise_model.__name__}(tortoise.models.Model):"]
+    # Freshly translated, so only the declared fields (Tortoise adds the
+    # "<fk>_id" fields and the reverse relations when initialized)
+    for name, field in meta.fields_map.items():
+        string, field_imports = DeconstructableSerializer.serialize_deconstructed(
+            *field.deconstruct()
+        )
+        imports.update(field_imports)
+        lines.append(f"    {name} = {string}")
+
+    lines.extend(["", "    class Meta:", f"        table = {meta.db_table!r}"])
+    for option in ("unique_together", "indexes"):
+        values = []
+        for value in getattr(meta, option):
+            if hasattr(value, "deconstruct"):
+                string, value_imports = (
+                    DeconstructableSerializer.serialize_deconstructed(
+                        *value.deconstruct()
+                    )
+                )
+                imports.update(value_imports)
+                values.append(string)
+            else:
+                values.append(repr(tuple(value)))
+        if values:
+            lines.append(f"        {option} = ({', '.join(values)},)")
+    return "\n".join(lines)
+
+
+def generate_module(django_models_list: list[type[django_models.Model]]) -> str:
+    """
+    Returns the source of a module defining the Tortoise translations of the
+    models, their FINGERPRINT and MODELS (the Tortoise models by Django label).
+
+    Models that can't be translated (or whose options, e.g. a lambda default,
+    can't be written out) are left out, and are translated when activated.
+    """
+    imports = {"import tortoise.models"}
+    classes = []
+    labels = []
+    for django_model in django_models_list:
+        try:
+            tortoise_model = TortoiseTranslator.translate_model(django_model)
+            classes.append(_generate_model(tortoise_model, imports))
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Could not generate %s", django_model._meta.label, exc_info=True
+            )
+            continue
+        labels.append((django_model._meta.label, tortoise_model.__name__))
+
+    models = "".join(f"    {label!r}: {name},\n" for label, name in labels)
+    return "\n".join(
+        [
+            HEADER,
+            *sorted(imports),
+            "",
+            f"FINGERPRINT = {get_fingerprint(django_models_list)!r}",
+            *(f"\n\n{source}" for source in classes),
+            "",
+            "",
+            "MODELS = {",
+            f"{models}}}",
+            "",
+        ]
+    )
+
+
+def load_generated_models(
+    django_models_list: list[type[django_models.Model]],
+    module_name: str | None = None,
+) -> dict[str, type[Any]]:
+    """
+    Imports the generated module (TORTOISE_ADAPTER_MODELS_MODULE by default)
+    and registers its models, if it was generated from these Django models.
+
+    Returns the Tortoise models by Django label, or an empty dict if there is
+    no up to date module: the models must then be translated.
+    """
+    if module_name is None:
+        module_name = getattr(settings, "TORTOISE_ADAPTER_MODELS_MODULE", None)
+    if module_name is None:
+        return {}
+
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        logger.warning(
+            "Could not import the generated models %s, run "
+            "`manage.py tortoise_codegen`",
+            module_name,
+            exc_info=True,
+        )
+        return {}
+    if getattr(module, "FINGERPRINT", None) != get_fingerprint(django_models_list):
+        logger.warning(
+            "The generated models %s are out of date, run `manage.py tortoise_codegen`",
+            module_name,
+        )
+        return {}
+
+    generated: dict[str, type[Any]] = module.MODELS
+    for tortoise_model in generated.values():
+        TortoiseTranslator.register_model(tortoise_model)
+    return generated
@@ -0,0 +1,150 @@
+"""
+Cache of compiled (parameterized) SQL for TortoiseQuerySet.
+"""
+
+import datetime
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
+from decimal import Decimal
+from typing import Any
+
+# Filter values whose type alone determines the generated SQL
+CACHEABLE_VALUE_TYPES = (
+    bool,
+    int,
+    float,
+    str,
+    Decimal,
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+    uuid.UUID,
+    type(None),
+)
+
+# Lookups whose only parameter is the field's database value
+CACHEABLE_LOOKUPS = ("", "exact", "not", "gt", "gte", "lt", "lte")
+
+# Stored for query shapes whose parameters could not be reproduced
+UNCACHEABLE = ""
+
+DEFAULT_MAXSIZE = 512
+
+
+class CompiledQueryCache:
+    """
+    A thread-safe LRU cache mapping a query shape to its parameterized SQL.
+
+    A query shape is everything that determines the SQL text but not the
+    parameter values: the model, the filter keys and value types, the
+    ordering and whether the query is limited. Along with the SQL, it maps
+    to the position of every parameter (see get_param_order).
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # Lookups of shapes stored as UNCACHEABLE
+        self.uncacheable = 0
+        self._entries: OrderedDict[Hashable, tuple[str, tuple[int, ...]]]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, shape: Hashable) -> tuple[str, tuple[int, ...]] | None:
+        """
+        Returns the SQL and parameter order of the shape, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(shape)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(shape)
+            if entry[0] == UNCACHEABLE:
+                self.uncacheable += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def set(self, shape: Hashable, sql: str, param_order: tuple[int, ...] = ()) -> None:
+        with self._lock:
+            self._entries[shape] = (sql, param_order)
+            self._entries.move_to_end(shape)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.uncacheable = 0
+
+
+compiled_query_cache = CompiledQueryCache()
+
+
+def get_param_order(
+    params: list[Any], built_params: list[Any] | None
+) -> tuple[int, ...] | None:
+    """
+    Returns the index in params of every parameter of the built query (e.g.
+    OFFSET before LIMIT on MSSQL), or None if they are not the same values.
+
+    The params must be pairwise distinct, or the position of equal values
+    would be ambiguous.
+    """
+    if built_params is None or len(built_params) != len(params):
+        return None
+    order = []
+    for value in built_params:
+        index = next(
+            (
+                index
+                for index, param in enumerate(params)
+                if type(param) is type(value) and param == value
+            ),
+            None,
+        )
+        if index is None:
+            # Transformed by Tortoise
+            return None
+        order.append(index)
+    return tuple(order)
+
+
+def has_distinct_params(params: list[Any]) -> bool:
+    # Equal values (including 1 and True) can't be told apart in the SQL
+    return len(set(params)) == len(params)
+
+
+def get_filter_params(
+    tortoise_model: type[Any], filter_kwargs: dict[str, Any]
+) -> list[Any] | None:
+    """
+    Returns the query parameters for the given filters in the order Tortoise
+    emits them, or None if they can't be derived without building the query.
+    """
+    meta = tortoise_model._meta
+    params: list[Any] = []
+    for key, value in filter_kwargs.items():
+        if not isinstance(value, CACHEABLE_VALUE_TYPES):
+            return None
+        field_name, _, lookup = key.partition("__")
+        if lookup not in CACHEABLE_LOOKUPS:
+            return None
+        if field_name == "pk":
+            field_name = meta.pk_attr
+        if field_name not in meta.fields_db_projection:
+            return None
+        if value is None:
+            # Compiled to IS NULL / IS NOT NULL, no parameter
+            continue
+        params.append(meta.fields_map[field_name].to_db_value(value, None))
+    return params
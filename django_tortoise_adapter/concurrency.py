@@ -0,0 +1,116 @@
+"""
+Concurrent queries with a bounded number of connections in use.
+
+gather() runs independent queries (e.g. the count() and filter() calls of a
+dashboard) at the same time on the connection pool, so that the latency is
+that of the slowest query instead of their sum.
+"""
+
+import asyncio
+import inspect
+import weakref
+from collections.abc import Awaitable
+from contextlib import AsyncExitStack
+from typing import Any
+
+from django.conf import settings
+
+# Semaphore of TORTOISE_ADAPTER_GATHER_LIMIT, per event loop
+_global_semaphores: weakref.WeakKeyDictionary[Any, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_global_semaphore() -> asyncio.Semaphore | None:
+    limit = getattr(settings, "TORTOISE_ADAPTER_GATHER_LIMIT", None)
+    if limit is None:
+        return None
+    loop = asyncio.get_running_loop()
+    semaphore = _global_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _global_semaphores[loop] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def _run(
+    awaitable: Awaitable[Any],
+    semaphores: list[asyncio.Semaphore],
+    failed: asyncio.Event,
+) -> Any:
+    async with AsyncExitStack() as stack:
+        for semaphore in semaphores:
+            await stack.enter_async_context(semaphore)
+        if failed.is_set():
+            # Don't start queries waiting for the slot of the failed one
+            raise asyncio.CancelledError
+        try:
+            return await awaitable
+        except Exception:
+            failed.set()
+            raise
+
+
+async def gather(
+    *awaitables: Awaitable[Any],
+    limit: int | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[Any]:
+    """
+    Runs the queries concurrently and returns their results, in order:
+
+        questions, count = await gather(
+            Question.objects.filter(...),
+            Choice.objects.count(),
+            limit=4,
+        )
+
+    :param limit: Maximum number of these queries running at once.
+    :param semaphore: Semaphore shared with other calls (e.g. one per
+        database) that every query acquires.
+
+    Every call also shares the TORTOISE_ADAPTER_GATHER_LIMIT setting, the
+    maximum number of queries run by all the gather() calls at once, e.g.
+    below the size of the connection pool.
+
+    If a query fails, the others are cancelled and the exception is raised,
+    and cancelling gather() cancels all of them. Inside atomic(), the queries
+    share the connection of the transaction and run one after the other.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("Limit must be a positive integer.")
+    semaphores = [
+        semaphore
+        for semaphore in (
+            asyncio.Semaphore(limit) if limit is not None else None,
+            semaphore,
+            # Acquired last, so that waiting for the per-call limits doesn't
+            # hold slots of the other calls
+            _get_global_semaphore(),
+        )
+        if semaphore is not None
+    ]
+    failed = asyncio.Event()
+    tasks = [
+        asyncio.ensure_future(_run(awaitable, semaphores, failed))
+        for awaitable in awaitables
+    ]
+    if not tasks:
+        return []
+
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # Cancels the other queries when one failed or gather() is cancelled
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+        for awaitable in awaitables:
+            # Queries cancelled before they started were never awaited
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+
+    for task in tasks:
+        exception = None if task.cancelled() else task.exception()
+        if exception is not None:
+            raise exception
+    return [task.result() for task in tasks]
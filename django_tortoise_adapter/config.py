@@ -0,0 +1,161 @@
+"""
+Builds the Tortoise configuration from Django's settings.
+
+Every entry point (activate, TortoiseASGIWrapper) goes through
+get_tortoise_config, so the connections and pool settings are the same
+whatever the way the adapter is started.
+"""
+
+from typing import Any
+
+from django.conf import settings
+
+# Tortoise app label of the translated models
+TORTOISE_APP_LABEL = "models"
+
+# Module the translated models are registered into
+MODELS_MODULE = "django_tortoise_adapter.models"
+
+SQLITE = "tortoise.backends.sqlite"
+ASYNCPG = "tortoise.backends.asyncpg"
+MYSQL = "tortoise.backends.mysql"
+
+ENGINES = {
+    "django.db.backends.sqlite3": SQLITE,
+    "django.contrib.gis.db.backends.spatialite": SQLITE,
+    "django.db.backends.postgresql": ASYNCPG,
+    "django.contrib.gis.db.backends.postgis": ASYNCPG,
+    "django.db.backends.mysql": MYSQL,
+    "django.contrib.gis.db.backends.mysql": MYSQL,
+}
+
+DEFAULT_PORTS = {ASYNCPG: 5432, MYSQL: 3306}
+
+# Lowest bound-parameter limit among the supported backends (SQLite < 3.32),
+# which bounds the size of the batched queries
+MAX_QUERY_PARAMS = 999
+
+# Django OPTIONS understood by the async drivers, with their names there
+OPTIONS = {
+    SQLITE: {},
+    ASYNCPG: {
+        "sslmode": "ssl",
+        "application_name": "application_name",
+        "connect_timeout": "timeout",
+    },
+    MYSQL: {
+        "charset": "charset",
+        "init_command": "init_command",
+        "connect_timeout": "connect_timeout",
+    },
+}
+
+# Pool settings (TORTOISE_ADAPTER_POOLS). They are ignored by the drivers that
+# don't support them, so the same settings can be used with every engine.
+# Other keys are passed as they are to the driver.
+POOL_SETTINGS = ("min_size", "max_size", "max_lifetime", "statement_cache_size")
+
+# Names of the pool settings in each driver
+POOL_OPTIONS = {
+    SQLITE: {},
+    ASYNCPG: {
+        "min_size": "minsize",
+        "max_size": "maxsize",
+        # Idle connections are closed after this many seconds
+        "max_lifetime": "max_inactive_connection_lifetime",
+        "statement_cache_size": "statement_cache_size",
+    },
+    MYSQL: {
+        "min_size": "minsize",
+        "max_size": "maxsize",
+        # Connections are recycled after this many seconds
+        "max_lifetime": "pool_recycle",
+    },
+}
+
+
+def get_connection_config(
+    database: dict[str, Any], pool: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Translates one entry of Django's DATABASES (and its pool settings) to a
+    Tortoise connection.
+    """
+    engine = ENGINES.get(database.get("ENGINE", ""))
+    if engine is None:
+        raise ValueError(
+            f"Database engine {database.get('ENGINE')!r} is not supported."
+        )
+
+    credentials: dict[str, Any]
+    if engine == SQLITE:
+        credentials = {"file_path": str(database.get("NAME") or ":memory:")}
+    else:
+        credentials = {
+            "host": database.get("HOST") or "localhost",
+            "port": int(database.get("PORT") or DEFAULT_PORTS[engine]),
+            "user": database.get("USER") or None,
+            "password": database.get("PASSWORD") or None,
+            "database": database.get("NAME"),
+        }
+
+    for option, value in database.get("OPTIONS", {}).items():
+        if option in OPTIONS[engine]:
+            credentials[OPTIONS[engine][option]] = value
+
+    for option, value in (pool or {}).items():
+        if option in POOL_OPTIONS[engine]:
+            credentials[POOL_OPTIONS[engine][option]] = value
+        elif option not in POOL_SETTINGS:
+            credentials[option] = value
+
+    return {"engine": engine, "credentials": credentials}
+
+
+def get_tortoise_config(
+    db_url: str | None = None,
+    databases: dict[str, dict[str, Any]] | None = None,
+    pools: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """
+    Returns the Tortoise configuration, with a connection per database alias.
+
+    :param db_url: URL of the default connection, overriding DATABASES.
+    :param databases: Defaults to settings.DATABASES. Aliases whose engine
+        has no async driver in Tortoise are skipped.
+    :param pools: Pool settings per alias (min_size, max_size, max_lifetime,
+        statement_cache_size or any driver option), defaults to the
+        TORTOISE_ADAPTER_POOLS setting.
+
+    Connections declared in settings.TORTOISE_ORM["connections"] take
+    precedence over the ones built from DATABASES.
+    """
+    if databases is None:
+        databases = getattr(settings, "DATABASES", {})
+    if pools is None:
+        pools = getattr(settings, "TORTOISE_ADAPTER_POOLS", {})
+
+    connections: dict[str, Any] = {}
+    for alias, database in databases.items():
+        if database.get("ENGINE") not in ENGINES:
+            continue
+        connections[alias] = get_connection_config(database, pools.get(alias))
+
+    connections.update(getattr(settings, "TORTOISE_ORM", {}).get("connections", {}))
+    if db_url is not None:
+        connections["default"] = db_url
+    if "default" not in connections:
+        raise ValueError(
+            "No default connection: configure a supported database engine "
+            "in DATABASES or pass a db_url."
+        )
+
+    return {
+        "connections": connections,
+        "apps": {
+            TORTOISE_APP_LABEL: {
+                "models": [MODELS_MODULE],
+                "default_connection": "default",
+            }
+        },
+    }
@@ -1,74 +1,1028 @@
+import copy
+import threading
+import warnings
+import weakref
+from collections import namedtuple
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Any
 
 from django.apps import apps as django_apps
+from django.conf import settings
 from django.db import models as django_models
-from tortoise import Tortoise
+from tortoise import Tortoise, connections
+from tortoise.exceptions import DoesNotExist, IntegrityError, MultipleObjectsReturned
+from tortoise.transactions import in_transaction
 
-from django_tortoise_adapter.bridge import run_async
+from django_tortoise_adapter.bridge import run_async, start_background_loop
+from django_tortoise_adapter.cache import (
+    DEFAULT_MAXSIZE,
+    MISSING,
+    LocMemResultCache,
+    ResultCacheBackend,
+    get_result_cache_from_settings,
+    get_result_cache_key,
+)
+from django_tortoise_adapter.codegen import load_generated_models
+from django_tortoise_adapter.compiler import (
+    UNCACHEABLE,
+    compiled_query_cache,
+    get_filter_params,
+    get_param_order,
+    has_distinct_params,
+)
+from django_tortoise_adapter.config import (
+    MAX_QUERY_PARAMS,
+    TORTOISE_APP_LABEL,
+    get_tortoise_config,
+)
+from django_tortoise_adapter.expressions import (
+    get_aggregates,
+    to_insert_value,
+    to_tortoise_aggregate,
+    to_tortoise_expression,
+    to_tortoise_lookup,
+)
+from django_tortoise_adapter.instrumentation import (
+    describe_query,
+    enable_slow_query_log,
+    instrument,
+)
+from django_tortoise_adapter.loaders import get_dataloader
+from django_tortoise_adapter.routers import db_for_read, db_for_write, mark_written
+from django_tortoise_adapter.schema import check_schemas, generate_schemas_if_changed
+from django_tortoise_adapter.transactions import get_atomic_aliases, on_commit
 from django_tortoise_adapter.translator import TortoiseTranslator
 
+# Same default as Django's QuerySet.iterator()
+DEFAULT_CHUNK_SIZE = 2000
+
+# get() fetches at most this many rows to detect MultipleObjectsReturned
+MAX_GET_RESULTS = 2
+
+# Serializes the lazy translation and registration of models
+_lazy_lock = threading.RLock()
+
+# TortoiseManager of every patched model, by Tortoise model
+_managers: "weakref.WeakKeyDictionary[type[Any], TortoiseManager]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_batch_size(batch_size: int | None, params_per_obj: int) -> int:
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+    # Sized to the parameter limit when no explicit batch_size is given
+    if batch_size is None:
+        return max(1, MAX_QUERY_PARAMS // max(1, params_per_obj))
+    return batch_size
+
+
+def _get_db_field_names(tortoise_model: type[Any]) -> list[str]:
+    # Fields backed by a column, in declaration order (ForeignKeys as <name>_id)
+    meta = tortoise_model._meta
+    return [field for field in meta.fields_map if field in meta.fields_db_projection]
+
+
+def _to_tortoise_field_name(tortoise_model: type[Any], field_name: str) -> str:
+    # ForeignKeys are selected/updated through their column (e.g. question_id)
+    meta = tortoise_model._meta
+    if field_name in meta.fk_fields or field_name in meta.o2o_fields:
+        return str(meta.fields_map[field_name].source_field)
+    return field_name
+
+
+def _is_related_lookup(tortoise_model: type[Any], lookup: str) -> bool:
+    # Whether the lookup (e.g. "choice__votes" or "-question__text") reads
+    # another table, either through a JOIN or a subquery
+    parts = to_tortoise_lookup(tortoise_model, lookup.lstrip("-")).split("__")
+    meta = tortoise_model._meta
+    if parts[0] not in meta.fetch_fields:
+        return False
+    # Only the column of a ForeignKey itself is read from this table
+    return len(parts) > 1 or parts[0] not in (meta.fk_fields | meta.o2o_fields)
+
+
+def _get_expression_lookups(expression: Any) -> list[str]:
+    # The fields read by an aggregate, including the lookups of its filter
+    lookups: list[str] = [
+        source.name  # type: ignore[attr-defined]
+        for source in expression.get_source_expressions()
+        if isinstance(source, django_models.F)
+    ]
+    filters = [getattr(expression, "filter", None)]
+    while filters:
+        node = filters.pop()
+        if isinstance(node, django_models.Q):
+            children: list[Any] = node.children
+            for child in children:
+                if isinstance(child, django_models.Q):
+                    filters.append(child)
+                else:
+                    lookups.append(child[0])
+    return lookups
+
+
+def _to_column_name(tortoise_model: type[Any], field_name: str) -> str:
+    meta = tortoise_model._meta
+    if field_name == "pk":
+        field_name = meta.pk_attr
+    field_name = _to_tortoise_field_name(tortoise_model, field_name)
+    if field_name not in meta.fields_db_projection:
+        raise ValueError(f"{tortoise_model.__name__} has no field {field_name!r}.")
+    return str(meta.fields_db_projection[field_name])
+
+
+def _get_create_params(
+    kwargs: dict[str, Any], defaults: dict[str, Any] | None
+) -> dict[str, Any]:
+    # Same as Django: lookups (e.g. name__iexact) are not fields to set
+    params = {key: value for key, value in kwargs.items() if "__" not in key}
+    for key, value in (defaults or {}).items():
+        params[key] = value() if callable(value) else value
+    return params
+
 
 class TortoiseQuerySet:
     """
     A proxy QuerySet that delegates to Tortoise.
+
+    Like Django's, it is lazy and immutable: every chaining method returns
+    a new QuerySet, so a base QuerySet can be safely reused.
     """
 
-    def __init__(self, tortoise_model: type[Any]) -> None:
+    def __init__(
+        self,
+        tortoise_model: type[Any],
+        result_cache: ResultCacheBackend | None = None,
+        model: type[django_models.Model] | None = None,
+    ) -> None:
         self.tortoise_model = tortoise_model
+        # Django model, used to route the queries
+        self.model = model
+        self._result_cache = result_cache
+        # Connection set by using(), None to route the query
+        self._db_alias: str | None = None
         self._filter_kwargs: dict[str, Any] = {}
-        self._order_args: list[str] = []
+        self._order_args: tuple[str, ...] = ()
+        self._select_related: tuple[str, ...] = ()
+        self._prefetch_related: tuple[Any, ...] = ()
+        # values()/values_list() projection: None means model instances
+        self._values_fields: tuple[str, ...] | None = None
+        self._values_list = False
+        self._flat = False
+        self._named = False
+        # only()/defer() column projection
+        self._only_fields: frozenset[str] | None = None
+        self._deferred_fields: frozenset[str] = frozenset()
+        # annotate() aggregates: (alias, Django expression, Tortoise function)
+        self._annotations: tuple[tuple[str, Any, Any], ...] = ()
+        # LIMIT/OFFSET window set by slicing, limit() or offset()
+        self._offset = 0
+        self._limit: int | None = None
+
+    def _clone(self) -> "TortoiseQuerySet":
+        # Every other attribute is immutable, so a shallow copy is enough
+        clone = copy.copy(self)
+        clone._filter_kwargs = dict(self._filter_kwargs)
+        return clone
+
+    def _is_sliced(self) -> bool:
+        return bool(self._offset) or self._limit is not None
 
     def filter(self, **kwargs: Any) -> "TortoiseQuerySet":
-        self._filter_kwargs.update(kwargs)
-        return self
+        clone = self._clone()
+        clone._filter_kwargs.update(kwargs)
+        return clone
 
     def order_by(self, *args: str) -> "TortoiseQuerySet":
-        self._order_args.extend(args)
-        return self
+        """
+        Orders by the given fields, replacing any previous ordering.
+        """
+        clone = self._clone()
+        clone._order_args = args
+        return clone
 
     def all(self) -> "TortoiseQuerySet":
+        return self._clone()
+
+    def select_related(self, *fields: str | None) -> "TortoiseQuerySet":
+        """
+        Follows the given ForeignKeys (Django "__" lookups allowed) with JOINs.
+
+        Without arguments, follows every ForeignKey of the model;
+        select_related(None) clears the list.
+        """
+        clone = self._clone()
+        if fields == (None,):
+            clone._select_related = ()
+        elif not fields:
+            meta = self.tortoise_model._meta
+            clone._select_related = tuple(sorted(meta.fk_fields | meta.o2o_fields))
+        else:
+            clone._select_related += tuple(str(field) for field in fields)
+        return clone
+
+    def prefetch_related(self, *lookups: Any) -> "TortoiseQuerySet":
+        """
+        Loads the given relations (Django "__" lookups allowed) with one
+        additional IN query per relation. prefetch_related(None) clears the list.
+        """
+        clone = self._clone()
+        if lookups == (None,):
+            clone._prefetch_related = ()
+        else:
+            clone._prefetch_related += lookups
+        return clone
+
+    def values(self, *fields: str) -> "TortoiseQuerySet":
+        """
+        Returns dicts with the given fields instead of model instances.
+        Only those columns are selected and no model is instantiated.
+        """
+        clone = self._clone()
+        clone._values_fields = fields
+        clone._values_list = False
+        clone._flat = False
+        clone._named = False
+        return clone
+
+    def values_list(
+        self, *fields: str, flat: bool = False, named: bool = False
+    ) -> "TortoiseQuerySet":
+        """
+        Returns tuples (or single values if flat, namedtuples if named) with the
+        given fields instead of model instances.
+        """
+        if flat and named:
+            raise TypeError("'flat' and 'named' can't be used together.")
+        if flat and len(fields) > 1:
+            raise TypeError(
+                "'flat' is not valid when values_list is called with more than "
+                "one field."
+            )
+        clone = self._clone()
+        clone._values_fields = fields
+        clone._values_list = True
+        clone._flat = flat
+        clone._named = named
+        return clone
+
+    def only(self, *fields: str) -> "TortoiseQuerySet":
+        """
+        Loads only the given fields (plus the primary key) from the database.
+
+        Unlike Django, the other fields are not loaded lazily when accessed.
+        """
+        if fields == (None,):
+            raise TypeError("Cannot pass None as an argument to only().")
+        clone = self._clone()
+        clone._only_fields = frozenset(
+            _to_tortoise_field_name(self.tortoise_model, field) for field in fields
+        )
+        clone._deferred_fields = frozenset()
+        return clone
+
+    def defer(self, *fields: str | None) -> "TortoiseQuerySet":
+        """
+        Does not load the given fields from the database.
+        defer(None) clears the list of deferred fields.
+        """
+        clone = self._clone()
+        if fields == (None,):
+            clone._deferred_fields = frozenset()
+        else:
+            clone._deferred_fields |= {
+                _to_tortoise_field_name(self.tortoise_model, str(field))
+                for field in fields
+            }
+        return clone
+
+    def _get_only_fields(self) -> list[str] | None:
+        if self._only_fields is None and not self._deferred_fields:
+            return None
+        pk_attr = self.tortoise_model._meta.pk_attr
+        return [
+            field
+            for field in _get_db_field_names(self.tortoise_model)
+            if field == pk_attr
+            or (
+                (self._only_fields is None or field in self._only_fields)
+                and field not in self._deferred_fields
+            )
+        ]
+
+    def _translate_aggregates(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[tuple[str, Any, Any], ...]:
+        return tuple(
+            (alias, expression, to_tortoise_aggregate(self.tortoise_model, expression))
+            for alias, expression in get_aggregates(args, kwargs).items()
+        )
+
+    def annotate(self, *args: Any, **kwargs: Any) -> "TortoiseQuerySet":
+        """
+        Annotates every row with Django aggregates (Count, Sum, Avg, Min and
+        Max), e.g. annotate(Count("choice")) over a reverse ForeignKey.
+        Filtering on an annotation filters the groups (HAVING).
+        """
+        annotations = self._translate_aggregates(args, kwargs)
+        aliases = {alias for alias, _, _ in self._annotations}
+        for alias, _, _ in annotations:
+            if alias in aliases:
+                raise ValueError(f"The annotation {alias!r} is already set.")
+        clone = self._clone()
+        clone._annotations = self._annotations + annotations
+        return clone
+
+    async def aggregate(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """
+        Returns a dict of the given Django aggregates over the whole
+        QuerySet, computed by the database in a single query.
+        """
+        if self._is_sliced():
+            raise TypeError("Cannot aggregate a sliced QuerySet.")
+        if self._annotations:
+            raise TypeError("Cannot aggregate over annotate().")
+        annotations = self._translate_aggregates(args, kwargs)
+        if not annotations:
+            return {}
+        clone = self._clone()
+        clone._annotations = annotations
+        clone._order_args = ()
+        clone._select_related = ()
+        clone._prefetch_related = ()
+        clone._values_fields = None
+        clone._only_fields = None
+        clone._deferred_fields = frozenset()
+        return await clone._cached(  # type: ignore[no-any-return]
+            "aggregate", TortoiseQuerySet._aggregate_uncached
+        )
+
+    def _build_aggregate_query(self) -> Any:
+        aliases = [alias for alias, _, _ in self._annotations]
+        query = self._build_queryset().values(*aliases)
+        query._choose_db_if_not_chosen()
+        query._make_query()
+        # Tortoise groups by the model's columns as soon as there is a join
+        # (e.g. across a reverse relation), which would aggregate every row
+        # separately
+        query.query._groupbys = []
+        return query
+
+    async def _aggregate_uncached(self) -> dict[str, Any]:
+        rows = await self._build_aggregate_query()._execute()
+        if not rows:
+            return {alias: None for alias, _, _ in self._annotations}
+        return dict(rows[0])
+
+    def using(self, alias: str | None) -> "TortoiseQuerySet":
+        """
+        Runs the query on the given connection instead of the routed one.
+        """
+        clone = self._clone()
+        clone._db_alias = alias
+        return clone
+
+    def _get_db(self) -> Any:
+        """
+        Returns the connection to read from: the one set by using(), the one
+        chosen by the routers or Tortoise's default if the Django model is
+        unknown.
+        """
+        if self._db_alias is not None:
+            return connections.get(self._db_alias)
+        if self.model is not None:
+            return connections.get(db_for_read(self.model))
+        return self.tortoise_model._choose_db()
+
+    def _get_write_db(self) -> Any:
+        """
+        Returns the connection to write to (the one set by using() or chosen
+        by the routers), and pins the following reads of the request to it
+        (see sticky_after_write).
+        """
+        mark_written()
+        if self._db_alias is not None:
+            return connections.get(self._db_alias)
+        if self.model is not None:
+            return connections.get(db_for_write(self.model))
+        return self.tortoise_model._choose_db(for_write=True)
+
+    def limit(self, limit: int) -> "TortoiseQuerySet":
+        if limit < 0:
+            raise ValueError("Limit should be non-negative number.")
+        clone = self._clone()
+        clone._limit = limit
+        return clone
+
+    def offset(self, offset: int) -> "TortoiseQuerySet":
+        if offset < 0:
+            raise ValueError("Offset should be non-negative number.")
+        clone = self._clone()
+        clone._offset = offset
+        return clone
+
+    def __getitem__(self, key: int | slice) -> Any:
+        """
+        Slicing (qs[40:60]) returns a new QuerySet limited with LIMIT/OFFSET.
+        Indexing (qs[3]) returns an awaitable resolving to that single object.
+        """
+        if not isinstance(key, (int, slice)):
+            raise TypeError(
+                f"QuerySet indices must be integers or slices, not "
+                f"{type(key).__name__}."
+            )
+        if isinstance(key, int):
+            if key < 0:
+                raise ValueError("Negative indexing is not supported.")
+            return self[key : key + 1]._get_single_item()
+
+        if (key.start is not None and key.start < 0) or (
+            key.stop is not None and key.stop < 0
+        ):
+            raise ValueError("Negative indexing is not supported.")
+        if key.step not in (None, 1):
+            raise ValueError("Slice steps are not supported.")
+
+        clone = self._clone()
+        # Slices are relative to the current window, as in Django
+        start = key.start or 0
+        clone._offset = self._offset + start
+        if key.stop is not None:
+            clone._limit = max(0, key.stop - start)
+        if self._limit is not None:
+            remaining = max(0, self._limit - start)
+            clone._limit = (
+                remaining if clone._limit is None else min(clone._limit, remaining)
+            )
+        return clone
+
+    async def _get_single_item(self) -> Any:
+        results = await self
+        if not results:
+            raise IndexError("QuerySet index out of range.")
+        return results[0]
+
+    def _get_tortoise_filters(self) -> dict[str, Any]:
+        # F() expressions are kept as Django ones for the result cache keys
+        return {
+            key: to_tortoise_expression(self.tortoise_model, value)
+            for key, value in self._filter_kwargs.items()
+        }
+
+    def _build_queryset(self, db: Any = None) -> Any:
+        if db is None:
+            db = self._get_db()
+        qs = self.tortoise_model.all().using_db(db)
+        # Annotated first, so that filters on annotations become HAVING
+        if self._annotations:
+            qs = qs.annotate(
+                **{alias: function for alias, _, function in self._annotations}
+            )
+        if self._filter_kwargs:
+            qs = qs.filter(**self._get_tortoise_filters())
+        if self._order_args:
+            qs = qs.order_by(*self._order_args)
+        if self._offset:
+            qs = qs.offset(self._offset)
+        if self._limit is not None:
+            qs = qs.limit(self._limit)
+        only_fields = self._get_only_fields()
+        # values()/values_list() already select their own columns
+        if only_fields is not None and self._values_fields is None:
+            qs = qs.only(*only_fields)
+        if self._select_related:
+            qs = qs.select_related(*self._select_related)
+        if self._prefetch_related:
+            qs = qs.prefetch_related(*self._prefetch_related)
+        return qs
+
+    def _get_query_shape(self, db: Any) -> tuple[Any, ...] | None:
+        """
+        Returns the key of this query in the compiled query cache, or None
+        if its SQL can't be reused with other parameter values.
+        """
+        if (
+            self._select_related
+            or self._prefetch_related
+            or self._only_fields is not None
+            or self._deferred_fields
+            or self._annotations
+        ):
+            return None
+        filters = tuple(
+            (key, type(value)) for key, value in self._filter_kwargs.items()
+        )
+        return (
+            self.tortoise_model,
+            type(db),
+            filters,
+            self._order_args,
+            bool(self._offset),
+            self._limit is not None,
+        )
+
+    def _get_query_params(self) -> list[Any] | None:
+        params = get_filter_params(self.tortoise_model, self._filter_kwargs)
+        if params is None:
+            return None
+        if self._limit is not None:
+            params.append(self._limit)
+        if self._offset:
+            params.append(self._offset)
+        return params
+
+    async def _fetch_instances(self) -> list[Any]:
+        """
+        Fetches model instances reusing the compiled SQL of previous queries
+        with the same shape, so the Tortoise query is only built on a miss.
+        """
+        db = self._get_db()
+        shape = self._get_query_shape(db)
+        params = self._get_query_params() if shape is not None else None
+        if shape is None or params is None:
+            return await self._build_queryset(db)  # type: ignore[no-any-return]
+
+        compiled = compiled_query_cache.get(shape)
+        if compiled is None:
+            qs = self._build_queryset(db)
+            if not has_distinct_params(params):
+                # Wait for a query of this shape whose parameters can be
+                # located in the SQL (e.g. not qs[5:10], limit == offset)
+                return await qs  # type: ignore[no-any-return]
+            qs.sql()  # Builds qs.query
+            # Older Tortoise versions inline the parameters in the SQL
+            get_parameterized_sql = getattr(qs.query, "get_parameterized_sql", None)
+            built_sql, built_params = (
+                get_parameterized_sql() if get_parameterized_sql else ("", None)
+            )
+            param_order = get_param_order(params, built_params)
+            if param_order is None:
+                # Tortoise transforms these parameters, always build the query
+                compiled_query_cache.set(shape, UNCACHEABLE)
+                return await qs  # type: ignore[no-any-return]
+            compiled_query_cache.set(shape, built_sql, param_order)
+            compiled = built_sql, param_order
+
+        sql, param_order = compiled
+        if sql == UNCACHEABLE:
+            return await self._build_queryset(db)  # type: ignore[no-any-return]
+        _, rows = await db.execute_query(sql, [params[i] for i in param_order])
+        return [self.tortoise_model._init_from_db(**row) for row in rows]
+
+    def _get_result_cache_key(self, operation: str) -> str:
+        return get_result_cache_key(
+            operation,
+            self._db_alias,
+            sorted(self._filter_kwargs.items()),
+            self._order_args,
+            self._select_related,
+            self._prefetch_related,
+            self._values_fields,
+            self._values_list,
+            self._flat,
+            self._named,
+            None if self._only_fields is None else sorted(self._only_fields),
+            sorted(self._deferred_fields),
+            [(alias, repr(expression)) for alias, expression, _ in self._annotations],
+            self._offset,
+            self._limit,
+        )
+
+    async def _cached(
+        self, operation: str, fetch: Callable[["TortoiseQuerySet"], Awaitable[Any]]
+    ) -> Any:
+        """
+        Returns the result of awaiting fetch(self) through the result cache,
+        if it is enabled for the model.
+        """
+        # Routed once, so the cache key names the connection of the query
+        qs = self._route_read()
+        # Inside atomic(), results may never be committed. Replicas may lag
+        # behind the writes, which would then not invalidate their results
+        if (
+            self._result_cache is None
+            or get_atomic_aliases()
+            or self._reads_other_models()
+            or not qs._reads_write_db()
+        ):
+            return await qs._run(operation, fetch)
+        namespace = self.tortoise_model._meta.db_table
+        key = qs._get_result_cache_key(operation)
+        # Read before the query: if a write invalidates the namespace while
+        # it runs, its (possibly outdated) result is not stored
+        generation = await self._result_cache.get_generation(namespace)
+        result = await self._result_cache.get(namespace, key, generation)
+        if result is MISSING:
+            result = await qs._run(operation, fetch)
+            await self._result_cache.set(namespace, key, result, generation)
+        return result
+
+    def _route_read(self) -> "TortoiseQuerySet":
+        """
+        Returns the QuerySet on the connection the routers chose for its
+        reads, unless set by using().
+        """
+        if self._db_alias is None and self.model is not None:
+            return self.using(db_for_read(self.model))
         return self
 
+    def _reads_write_db(self) -> bool:
+        """
+        Returns whether the (routed) QuerySet reads from the connection its
+        model is written to.
+        """
+        if self._db_alias is None or self.model is None:
+            return True
+        return self._db_alias == db_for_write(self.model)
+
+    def _reads_other_models(self) -> bool:
+        """
+        Returns whether the query reads the tables of other models, whose
+        writes don't invalidate the cached results of this one.
+        """
+        if self._select_related or self._prefetch_related:
+            return True
+        lookups = [
+            *self._filter_kwargs,
+            *self._order_args,
+            *(self._values_fields or ()),
+        ]
+        for _, expression, _ in self._annotations:
+            lookups.extend(_get_expression_lookups(expression))
+        return any(
+            _is_related_lookup(self.tortoise_model, lookup) for lookup in lookups
+        )
+
+    async def _run(
+        self, operation: str, fetch: Callable[["TortoiseQuerySet"], Awaitable[Any]]
+    ) -> Any:
+        # Routed once, so all the queries of the evaluation (and the
+        # instrumentation) use the same connection
+        qs = self._route_read()
+        return await instrument(
+            fetch(qs),
+            self.tortoise_model,
+            operation,
+            db=qs._get_db(),
+            describe=partial(qs._describe, operation),
+        )
+
+    def _describe(self, operation: str) -> tuple[str, list[Any] | None]:
+        """
+        Returns the SQL and parameters of the given operation (for the
+        instrumentation, which only calls it when needed).
+        """
+        if operation == "aggregate":
+            query = self._build_aggregate_query()
+            return query.query.get_parameterized_sql()  # type: ignore[no-any-return]
+        qs = self._build_queryset()
+        if operation == "count":
+            return describe_query(qs.count())
+        if operation == "exists":
+            if self._is_sliced():
+                pk_attr = self.tortoise_model._meta.pk_attr
+                return describe_query(qs.limit(1).values_list(pk_attr, flat=True))
+            return describe_query(qs.exists())
+        if self._values_fields is None:
+            return describe_query(qs)
+        return describe_query(self._build_values_query(qs))
+
+    async def _invalidate_caches(self, cascade: bool = False) -> None:
+        """
+        Drops the cached results and loaded objects (see loaders) of the
+        model after a write.
+
+        With cascade (after a delete), also drops those of the models
+        referencing it, whose rows the database may have deleted or updated
+        (on_delete is left to the database constraints).
+        """
+        loader = get_dataloader()
+        if loader is not None:
+            loader.invalidate(self.tortoise_model)
+        if self._result_cache is not None:
+            invalidate = partial(
+                self._result_cache.invalidate, self.tortoise_model._meta.db_table
+            )
+            await invalidate()
+            # Until the transaction of the write commits, other connections
+            # read (and may cache) the previous rows: invalidate again then
+            for alias in self._get_transaction_aliases():
+                on_commit(invalidate, alias)
+        if cascade:
+            await _invalidate_related_caches(self.tortoise_model, {self.tortoise_model})
+
+    def _get_transaction_aliases(self) -> frozenset[str]:
+        """
+        Returns the aliases of the atomic() blocks the writes of the
+        QuerySet run in.
+        """
+        aliases = get_atomic_aliases()
+        if self._db_alias is not None:
+            return aliases & {self._db_alias}
+        if self.model is not None:
+            return aliases & {db_for_write(self.model)}
+        return aliases
+
+    async def _fetch(self) -> Any:
+        return await self._cached("fetch", TortoiseQuerySet._fetch_uncached)
+
+    async def _fetch_uncached(self) -> Any:
+        """
+        Evaluates the QuerySet applying the values()/values_list() projection,
+        if any.
+        """
+        if self._values_fields is None:
+            return await self._fetch_instances()
+        results = await self._build_values_query(self._build_queryset())
+        if not self._named:
+            return results
+        field_names = self._values_fields or _get_db_field_names(self.tortoise_model)
+        row_cls = namedtuple("Row", field_names)  # type: ignore[misc]
+        return [row_cls(*row) for row in results]
+
+    def _build_values_query(self, qs: Any) -> Any:
+        """
+        Applies the values()/values_list() projection to the Tortoise query.
+        """
+        # ForeignKeys are selected through their column, under their name
+        fields = {
+            name: _to_tortoise_field_name(self.tortoise_model, name)
+            for name in self._values_fields or ()
+        }
+        if not self._values_list:
+            return qs.values(**fields)
+        return qs.values_list(*fields.values(), flat=self._flat)
+
     async def count(self) -> int:
-        return await self.tortoise_model.filter(  # type: ignore[no-any-return]
-            **self._filter_kwargs
-        ).count()
+        return await self._cached(  # type: ignore[no-any-return]
+            "count", TortoiseQuerySet._count_uncached
+        )
+
+    async def _count_uncached(self) -> int:
+        return await self._build_queryset().count()  # type: ignore[no-any-return]
+
+    async def exists(self) -> bool:
+        """
+        Returns whether the QuerySet has any row with a SELECT 1 ... LIMIT 1.
+        """
+        return await self._cached(  # type: ignore[no-any-return]
+            "exists", TortoiseQuerySet._exists_uncached
+        )
+
+    async def _exists_uncached(self) -> bool:
+        if not self._is_sliced():
+            return await self._build_queryset().exists()  # type: ignore[no-any-return]
+        if self._limit == 0:
+            return False
+        # EXISTS ignores OFFSET, so look for a single row inside the window
+        pk_attr = self.tortoise_model._meta.pk_attr
+        rows = await self._build_queryset().limit(1).values_list(pk_attr, flat=True)
+        return bool(rows)
 
     async def first(self) -> Any | None:
-        return await self.tortoise_model.filter(**self._filter_kwargs).first()
+        results = await self[:1]
+        return results[0] if results else None
 
     async def get(self, **kwargs: Any) -> Any:
-        self._filter_kwargs.update(kwargs)
-        return await self.tortoise_model.get(**self._filter_kwargs)
+        loader = get_dataloader()
+        if loader is not None and self._is_loadable(kwargs):
+            alias = db_for_read(self.model)
+            pk = next(iter(kwargs.values()))
+            return await loader.load(self.tortoise_model, alias, pk)
+        results = await self.filter(**kwargs)[:MAX_GET_RESULTS]
+        if not results:
+            raise DoesNotExist(self.tortoise_model)
+        if len(results) > 1:
+            raise MultipleObjectsReturned(self.tortoise_model)
+        return results[0]
 
-    def __await__(self) -> Any:
-        qs = self.tortoise_model.filter(**self._filter_kwargs)
+    def _is_loadable(self, kwargs: dict[str, Any]) -> bool:
+        """
+        Returns whether get(**kwargs) is a plain primary key lookup that the
+        dataloader can batch.
+        """
+        if len(kwargs) != 1 or self.model is None:
+            return False
+        ((lookup, value),) = kwargs.items()
+        pk_attr = self.tortoise_model._meta.pk_attr
+        if lookup.removesuffix("__exact") not in ("pk", pk_attr):
+            return False
+        return not (
+            # using() and atomic() read specific rows from a specific
+            # connection, and the batch runs in its own task
+            self._db_alias is not None
+            or get_atomic_aliases()
+            or self._filter_kwargs
+            or self._values_fields is not None
+            or self._select_related
+            or self._prefetch_related
+            or self._only_fields is not None
+            or self._deferred_fields
+            or self._annotations
+            or self._is_sliced()
+            or value is None
+            or hasattr(value, "resolve_expression")
+        )
+
+    def _check_writable(self, operation: str) -> None:
+        if self._is_sliced():
+            raise TypeError(f"Cannot {operation} a sliced QuerySet.")
+        if self._annotations:
+            raise TypeError(f"Cannot {operation} an annotated QuerySet.")
+
+    async def update(self, **kwargs: Any) -> int:
+        """
+        Updates every matching row with a single UPDATE ... WHERE and
+        returns the number of rows matched.
+
+        Values can be F() expressions, e.g. update(votes=F("votes") + 1)
+        increments atomically, without reading the rows.
+        """
+        self._check_writable("update")
+        if not kwargs:
+            return 0
+        values = {
+            name: to_tortoise_expression(self.tortoise_model, value)
+            for name, value in kwargs.items()
+        }
+        db = self._get_write_db()
+        query = (
+            self.tortoise_model.filter(**self._get_tortoise_filters())
+            .using_db(db)
+            .update(**values)
+        )
+        updated = await instrument(
+            query,
+            self.tortoise_model,
+            "update",
+            db=db,
+            describe=partial(describe_query, query),
+            count_rows=lambda updated: updated,
+        )
+        await self._invalidate_caches()
+        return updated  # type: ignore[no-any-return]
+
+    async def delete(self) -> int:
+        """
+        Deletes every matching row with a single DELETE ... WHERE and
+        returns the number of rows deleted.
+
+        Unlike Django, related objects are not collected: on_delete is left
+        to the database constraints, and no signals are sent.
+        """
+        self._check_writable("delete")
+        db = self._get_write_db()
+        query = (
+            self.tortoise_model.filter(**self._get_tortoise_filters())
+            .using_db(db)
+            .delete()
+        )
+        deleted = await instrument(
+            query,
+            self.tortoise_model,
+            "delete",
+            db=db,
+            describe=partial(describe_query, query),
+            count_rows=lambda deleted: deleted,
+        )
+        await self._invalidate_caches(cascade=True)
+        return deleted  # type: ignore[no-any-return]
+
+    async def in_bulk(
+        self, id_list: list[Any] | None = None, *, field_name: str = "pk"
+    ) -> dict[Any, Any]:
+        """
+        Returns a dictionary mapping each of the given IDs to the object with
+        that ID. If id_list isn't provided, evaluates the entire QuerySet.
+        Large id lists are split into several IN queries.
+        """
+        if self._values_fields is not None:
+            raise TypeError("in_bulk() cannot be used with values() or values_list().")
+        if self._is_sliced():
+            raise TypeError("Cannot use 'limit' or 'offset' with in_bulk().")
+        if id_list is None:
+            return {getattr(obj, field_name): obj for obj in await self}
+
+        id_list = list(id_list)
+        batch_size = _get_batch_size(None, 1)
+        results: dict[Any, Any] = {}
+        for start in range(0, len(id_list), batch_size):
+            batch = id_list[start : start + batch_size]
+            objs = await self.filter(**{f"{field_name}__in": batch})
+            results.update({getattr(obj, field_name): obj for obj in objs})
+        return results
+
+    def iterator(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+        """
+        Streams the results in chunks of ``chunk_size`` rows.
+
+        Unordered querysets (including values()/values_list() and sliced
+        ones) are paginated by primary key (keyset pagination), so every
+        chunk is an index range scan regardless of the table size. Ordered
+        querysets fall back to LIMIT/OFFSET pagination to preserve the
+        requested order, with the primary key as a tiebreaker so that no row
+        is skipped or repeated between chunks.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be strictly positive.")
         if self._order_args:
-            qs = qs.order_by(*self._order_args)
-        return qs.all().__await__()  # type: ignore[no-any-return]
+            return self._offset_iterator(chunk_size)
+        return self._keyset_iterator(chunk_size)
 
-    def __aiter__(self) -> Any:
-        async def iterator() -> Any:
-            qs = self.tortoise_model.filter(**self._filter_kwargs)
-            if self._order_args:
-                qs = qs.order_by(*self._order_args)
-            results = await qs.all()
-            for res in results:
-                yield res
+    async def _keyset_iterator(self, chunk_size: int) -> Any:
+        pk_attr = self.tortoise_model._meta.pk_attr
+        qs = self.order_by(pk_attr)
+        convert = None
+        if self._values_fields is not None:
+            # Fetched as dicts including the primary key, which the rows
+            # may not carry, then converted
+            fields = self._values_fields or tuple(
+                _get_db_field_names(self.tortoise_model)
+            )
+            qs = qs.values(*fields, *(() if pk_attr in fields else (pk_attr,)))
+            convert = self._get_values_converter(fields)
+
+        remaining = self._limit
+        chunk = await qs[:chunk_size]._fetch_chunk()
+        while True:
+            for row in chunk:
+                yield row if convert is None else convert(row)
+            if remaining is not None:
+                remaining -= len(chunk)
+            if len(chunk) < chunk_size or remaining == 0:
+                return
+            last_pk = chunk[-1].pk if convert is None else chunk[-1][pk_attr]
+            # The window's offset only applies to the first chunk
+            next_qs = qs.filter(**{f"{pk_attr}__gt": last_pk}).offset(0)
+            if remaining is not None:
+                next_qs = next_qs.limit(remaining)
+            chunk = await next_qs[:chunk_size]._fetch_chunk()
+
+    async def _fetch_chunk(self) -> Any:
+        # Like Django's iterator(), which bypasses the QuerySet cache: the
+        # chunks of a large table would fill the result cache
+        return await self._run("fetch", TortoiseQuerySet._fetch_uncached)
+
+    def _get_values_converter(
+        self, fields: tuple[str, ...]
+    ) -> Callable[[dict[str, Any]], Any]:
+        """
+        Returns a function converting the dicts fetched by _keyset_iterator
+        to the rows of the values()/values_list() projection.
+        """
+        if not self._values_list:
+            return lambda row: {name: row[name] for name in fields}
+        if self._flat:
+            return lambda row: row[fields[0]]
+        if self._named:
+            row_cls = namedtuple("Row", fields)  # type: ignore[misc]
+            return lambda row: row_cls(*(row[name] for name in fields))
+        return lambda row: tuple(row[name] for name in fields)
 
-        return iterator()
+    async def _offset_iterator(self, chunk_size: int) -> Any:
+        pk_attr = self.tortoise_model._meta.pk_attr
+        qs = self
+        if not {arg.lstrip("-") for arg in self._order_args} & {"pk", pk_attr}:
+            qs = self.order_by(*self._order_args, pk_attr)
+        offset = 0
+        while True:
+            chunk = await qs[offset : offset + chunk_size]._fetch_chunk()
+            for row in chunk:
+                yield row
+            if len(chunk) < chunk_size:
+                return
+            offset += chunk_size
+
+    def __await__(self) -> Any:
+        return self._fetch().__await__()
+
+    def __aiter__(self) -> Any:
+        return self.iterator()
 
     def __iter__(self) -> Any:
         # bridge for legacy sync support
-        async def fetch() -> list[Any]:
-            return await self.tortoise_model.filter(  # type: ignore[no-any-return]
-                **self._filter_kwargs
-            ).all()
-
-        results = run_async(fetch())
+        results = run_async(self._fetch())
         return iter(results)
 
 
+async def _invalidate_related_caches(
+    tortoise_model: type[Any], seen: set[type[Any]]
+) -> None:
+    # The models referencing the model, and those referencing them in turn
+    meta = tortoise_model._meta
+    for name in meta.backward_fk_fields | meta.backward_o2o_fields:
+        related_model = meta.fields_map[name].related_model
+        if related_model in seen:
+            continue
+        seen.add(related_model)
+        manager = _managers.get(related_model)
+        if manager is not None:
+            await manager.get_queryset()._invalidate_caches()
+        await _invalidate_related_caches(related_model, seen)
+
+
 class TortoiseManager(django_models.Manager):
     """
     A Manager that proxies calls to Tortoise.
@@ -77,86 +1031,618 @@ class TortoiseManager(django_models.Manager):
     def __init__(self, tortoise_model: type[Any]) -> None:
         super().__init__()
         self.tortoise_model = tortoise_model
+        self.result_cache: ResultCacheBackend | None = None
 
     def get_queryset(self) -> TortoiseQuerySet:  # type: ignore[override]
-        return TortoiseQuerySet(self.tortoise_model)
+        return TortoiseQuerySet(
+            self.tortoise_model, result_cache=self.result_cache, model=self.model
+        )
+
+    def _get_write_db(self) -> Any:
+        return self.get_queryset()._get_write_db()
+
+    def enable_cache(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float | None = None,
+        backend: ResultCacheBackend | None = None,
+    ) -> None:
+        """
+        Caches the results of the queries of this model.
+
+        By default, results are kept in an in-process LRU cache of maxsize
+        entries for ttl seconds (forever if None). Pass a backend (e.g.
+        DjangoResultCache) to store them elsewhere. Writes through this
+        manager invalidate every cached result of the model.
+        """
+        if backend is None:
+            backend = LocMemResultCache(maxsize=maxsize, ttl=ttl)
+        self.result_cache = backend
+
+    def disable_cache(self) -> None:
+        self.result_cache = None
+
+    async def _invalidate_caches(self) -> None:
+        await self.get_queryset()._invalidate_caches()
+
+    def _get_write_queryset(self) -> TortoiseQuerySet:
+        # Reads that decide a write must see the latest rows: they go to the
+        # write connection and bypass the result cache
+        qs = TortoiseQuerySet(self.tortoise_model, model=self.model)
+        return qs.using(self._get_write_db().connection_name)
+
+    async def get_or_create(  # type: ignore[override]
+        self, defaults: dict[str, Any] | None = None, **kwargs: Any
+    ) -> tuple[Any, bool]:
+        """
+        Returns (object, created): the object matching kwargs, or a new one
+        created from kwargs and defaults.
+
+        A single SELECT when the object exists. The INSERT runs in a
+        savepoint, so if a concurrent request created the object first, its
+        IntegrityError is caught and the object fetched instead.
+        """
+        qs = self._get_write_queryset()
+        try:
+            return await qs.get(**kwargs), False
+        except DoesNotExist:
+            return await self._create_or_get(qs, kwargs, defaults)
+
+    async def _create_or_get(
+        self,
+        qs: TortoiseQuerySet,
+        kwargs: dict[str, Any],
+        defaults: dict[str, Any] | None,
+    ) -> tuple[Any, bool]:
+        params = _get_create_params(kwargs, defaults)
+        try:
+            async with in_transaction(qs._db_alias):
+                return await self.create(**params), True
+        except IntegrityError:
+            try:
+                return await qs.get(**kwargs), False
+            except DoesNotExist:
+                pass
+            raise
+
+    async def update_or_create(  # type: ignore[override]
+        self,
+        defaults: dict[str, Any] | None = None,
+        create_defaults: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> tuple[Any, bool]:
+        """
+        Returns (object, created): the object matching kwargs updated with
+        defaults, or a new one created from kwargs and create_defaults
+        (defaults if not given).
+
+        Runs in a transaction. The object is updated with a set-based UPDATE
+        by primary key, so defaults can use F() expressions.
+        """
+        qs = self._get_write_queryset()
+        if create_defaults is None:
+            create_defaults = defaults
+        async with in_transaction(qs._db_alias):
+            try:
+                obj = await qs.get(**kwargs)
+            except DoesNotExist:
+                obj, created = await self._create_or_get(qs, kwargs, create_defaults)
+                if created:
+                    return obj, True
+            values = _get_create_params({}, defaults)
+            if not values:
+                return obj, False
+            await qs.filter(pk=obj.pk).update(**values)
+            await self._invalidate_caches()
+            if any(hasattr(value, "resolve_expression") for value in values.values()):
+                # Computed by the database
+                return await qs.get(pk=obj.pk), False
+            for name, value in values.items():
+                setattr(obj, name, value)
+            return obj, False
 
     async def create(self, **kwargs: Any) -> Any:  # type: ignore[override]
-        return await self.tortoise_model.create(**kwargs)
+        values = {name: to_insert_value(value) for name, value in kwargs.items()}
+        db = self._get_write_db()
+        obj = await instrument(
+            self.tortoise_model.create(using_db=db, **values),
+            self.tortoise_model,
+            "create",
+            db=db,
+            count_rows=lambda _: 1,
+        )
+        await self._invalidate_caches()
+        return obj
 
     def all(self) -> TortoiseQuerySet:  # type: ignore[override]
         return self.get_queryset().all()
 
+    async def update(self, **kwargs: Any) -> int:  # type: ignore[override]
+        return await self.get_queryset().update(**kwargs)
+
+    def using(self, alias: str | None) -> TortoiseQuerySet:  # type: ignore[override]
+        return self.get_queryset().using(alias)
+
     def filter(  # type: ignore[override]
         self, *args: Any, **kwargs: Any
     ) -> TortoiseQuerySet:
         return self.get_queryset().filter(*args, **kwargs)
 
+    def values(self, *fields: str) -> TortoiseQuerySet:  # type: ignore[override]
+        return self.get_queryset().values(*fields)
+
+    def values_list(  # type: ignore[override]
+        self, *fields: str, flat: bool = False, named: bool = False
+    ) -> TortoiseQuerySet:
+        return self.get_queryset().values_list(*fields, flat=flat, named=named)
+
+    def only(self, *fields: str) -> TortoiseQuerySet:  # type: ignore[override]
+        return self.get_queryset().only(*fields)
+
+    def defer(self, *fields: str | None) -> TortoiseQuerySet:  # type: ignore[override]
+        return self.get_queryset().defer(*fields)
+
+    def annotate(  # type: ignore[override]
+        self, *args: Any, **kwargs: Any
+    ) -> TortoiseQuerySet:
+        return self.get_queryset().annotate(*args, **kwargs)
+
+    async def aggregate(  # type: ignore[override]
+        self, *args: Any, **kwargs: Any
+    ) -> dict[str, Any]:
+        return await self.get_queryset().aggregate(*args, **kwargs)
+
+    def select_related(  # type: ignore[override]
+        self, *fields: str | None
+    ) -> TortoiseQuerySet:
+        return self.get_queryset().select_related(*fields)
+
+    def prefetch_related(  # type: ignore[override]
+        self, *lookups: Any
+    ) -> TortoiseQuerySet:
+        return self.get_queryset().prefetch_related(*lookups)
+
     async def count(self) -> int:  # type: ignore[override]
         return await self.get_queryset().count()
 
+    async def exists(self) -> bool:  # type: ignore[override]
+        return await self.get_queryset().exists()
+
     async def get(self, *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
         return await self.get_queryset().get(*args, **kwargs)
 
     async def first(self) -> Any | None:  # type: ignore[override]
         return await self.get_queryset().first()
 
+    def iterator(  # type: ignore[override]
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Any:
+        return self.get_queryset().iterator(chunk_size=chunk_size)
+
+    async def in_bulk(  # type: ignore[override]
+        self, id_list: list[Any] | None = None, *, field_name: str = "pk"
+    ) -> dict[Any, Any]:
+        return await self.get_queryset().in_bulk(id_list, field_name=field_name)
+
+    def _to_tortoise_instance(self, obj: Any) -> Any:
+        """
+        Converts a Django model instance to an (unsaved) Tortoise one.
+        Tortoise instances are returned untouched.
+        """
+        if isinstance(obj, self.tortoise_model):
+            return obj
+        fields_map = self.tortoise_model._meta.fields_map
+        kwargs: dict[str, Any] = {}
+        for field in obj._meta.concrete_fields:
+            if field.attname not in fields_map:
+                continue
+            value = getattr(obj, field.attname)
+            if field.primary_key and value is None:
+                continue
+            kwargs[field.attname] = value
+        return self.tortoise_model(**kwargs)
+
+    async def bulk_create(  # type: ignore[override]
+        self,
+        objs: list[Any],
+        batch_size: int | None = None,
+        ignore_conflicts: bool = False,
+        update_conflicts: bool = False,
+        update_fields: list[str] | None = None,
+        unique_fields: list[str] | None = None,
+    ) -> list[Any]:
+        """
+        Inserts the given objects in batches of batch_size rows.
+
+        Accepts Django or Tortoise instances and returns the Tortoise ones.
+        If batch_size is not given, it is derived from the number of columns
+        so every statement stays under the backend's parameter limit.
+
+        With update_conflicts, rows conflicting on unique_fields get their
+        update_fields updated instead (INSERT ... ON CONFLICT DO UPDATE, or
+        ON DUPLICATE KEY UPDATE on MySQL, which ignores unique_fields).
+        """
+        if ignore_conflicts and update_conflicts:
+            raise ValueError(
+                "ignore_conflicts and update_conflicts are mutually exclusive."
+            )
+        tortoise_objs = [self._to_tortoise_instance(obj) for obj in objs]
+        if not tortoise_objs:
+            return tortoise_objs
+        columns = len(self.tortoise_model._meta.db_fields)
+        db = self._get_write_db()
+        on_conflict, conflict_updates = None, None
+        if update_conflicts:
+            on_conflict, conflict_updates = self._get_upsert_columns(
+                db, update_fields, unique_fields
+            )
+        query = self.tortoise_model.bulk_create(
+            tortoise_objs,
+            batch_size=_get_batch_size(batch_size, columns),
+            ignore_conflicts=ignore_conflicts,
+            update_fields=conflict_updates,
+            on_conflict=on_conflict,
+            using_db=db,
+        )
+        await instrument(
+            query,
+            self.tortoise_model,
+            "bulk_create",
+            db=db,
+            describe=partial(describe_query, query),
+            count_rows=lambda _: len(tortoise_objs),
+        )
+        await self._invalidate_caches()
+        return tortoise_objs
+
+    def _get_upsert_columns(
+        self,
+        db: Any,
+        update_fields: list[str] | None,
+        unique_fields: list[str] | None,
+    ) -> tuple[list[str], list[str]]:
+        if not update_fields:
+            raise ValueError(
+                "Fields that will be updated when a row insertion fails on "
+                "conflicts must be provided."
+            )
+        if unique_fields:
+            on_conflict = [
+                _to_column_name(self.tortoise_model, f) for f in unique_fields
+            ]
+        elif db.capabilities.dialect == "mysql":
+            # Not part of MySQL's statement, but required by Tortoise
+            on_conflict = [_to_column_name(self.tortoise_model, "pk")]
+        else:
+            raise ValueError(
+                "Unique fields that can trigger the upsert must be provided."
+            )
+        return on_conflict, [
+            _to_column_name(self.tortoise_model, field) for field in update_fields
+        ]
+
+    async def bulk_update(  # type: ignore[override]
+        self,
+        objs: list[Any],
+        fields: list[str],
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Updates the given fields of the given objects in batches of batch_size
+        objects (one UPDATE ... CASE statement per batch).
+
+        Returns the number of rows matched.
+        """
+        if not fields:
+            raise ValueError("Field names must be given to bulk_update().")
+        tortoise_objs = [self._to_tortoise_instance(obj) for obj in objs]
+        if not tortoise_objs:
+            return 0
+        tortoise_fields = [
+            _to_tortoise_field_name(self.tortoise_model, name) for name in fields
+        ]
+        # Every field adds a WHEN/THEN pair per object, plus the pk in the IN list
+        params_per_obj = 2 * len(tortoise_fields) + 1
+        db = self._get_write_db()
+        query = self.tortoise_model.bulk_update(
+            tortoise_objs,
+            fields=tortoise_fields,
+            batch_size=_get_batch_size(batch_size, params_per_obj),
+            using_db=db,
+        )
+        updated = await instrument(
+            query,
+            self.tortoise_model,
+            "bulk_update",
+            db=db,
+            describe=partial(describe_query, query),
+            count_rows=lambda updated: updated,
+        )
+        await self._invalidate_caches()
+        return updated  # type: ignore[no-any-return]
+
+
+def get_models_to_translate(
+    apps: list[str] | None = None, exclude_apps: list[str] | None = None
+) -> list[type[django_models.Model]]:
+    """
+    Returns the Django models to translate, filtered by app label.
+
+    :param apps: App labels to translate (all the installed apps by default).
+    :param exclude_apps: App labels to skip.
+
+    Both default to the TORTOISE_ADAPTER_APPS and TORTOISE_ADAPTER_EXCLUDE_APPS
+    settings. Models of other apps are still translated when a selected model
+    relates to them, because Tortoise can't resolve the relation otherwise.
+    """
+    if apps is None:
+        apps = getattr(settings, "TORTOISE_ADAPTER_APPS", None)
+    if exclude_apps is None:
+        exclude_apps = getattr(settings, "TORTOISE_ADAPTER_EXCLUDE_APPS", None)
+
+    selected = [
+        model
+        for app_config in django_apps.get_app_configs()
+        if (apps is None or app_config.label in apps)
+        and (not exclude_apps or app_config.label not in exclude_apps)
+        for model in app_config.get_models()
+    ]
+    return _with_related_models(selected)
+
+
+def _get_related_models(
+    django_model: type[django_models.Model],
+) -> list[type[django_models.Model]]:
+    # Targets of the forward relations, which must be registered first
+    meta = django_model._meta  # pylint: disable=protected-access
+    return [
+        field.related_model
+        for field in [*meta.fields, *meta.many_to_many]
+        if field.is_relation and isinstance(field.related_model, type)
+    ]
+
+
+def _with_related_models(
+    django_models_list: list[type[django_models.Model]],
+) -> list[type[django_models.Model]]:
+    result: list[type[django_models.Model]] = []
+    pending = list(django_models_list)
+    while pending:
+        model = pending.pop(0)
+        if model in result:
+            continue
+        result.append(model)
+        pending.extend(_get_related_models(model))
+    return result
+
 
 async def activate_async(
     _modules: list[str],
-    db_url: str = "sqlite://:memory:",
-    generate_schemas: bool = True,
+    db_url: str | None = None,
+    generate_schemas: bool | str = True,
+    lazy: bool = False,
+    apps: list[str] | None = None,
+    exclude_apps: list[str] | None = None,
 ) -> None:
     """
     Activates Tortoise backend (Async).
 
     :param _modules: Unused parameter, kept for compatibility.
-    :param db_url: Database URL for Tortoise.
-    :param generate_schemas: Whether to generate schemas.
+    :param db_url: Database URL of the default connection. By default the
+        connections are built from DATABASES (see config.get_tortoise_config).
+    :param generate_schemas: Whether to generate schemas. "if_changed" only
+        generates them when the translated schema changed since the last
+        start (see schema.generate_schemas_if_changed), and "check" only logs
+        the differences between the Tortoise models and the Django migrations
+        (see schema.check_schemas), without touching the schema.
+    :param lazy: Whether to translate each model the first time its manager is
+        accessed instead of now (see install_lazy_manager).
+    :param apps: App labels whose models are translated (see
+        get_models_to_translate).
+    :param exclude_apps: App labels whose models are not translated.
     """
+    if isinstance(generate_schemas, str) and generate_schemas not in (
+        "if_changed",
+        "check",
+    ):
+        raise ValueError(f"Unknown generate_schemas mode {generate_schemas!r}.")
+    if lazy and generate_schemas:
+        raise ValueError(
+            "Schemas can't be generated for lazily translated models, "
+            "pass generate_schemas=False and manage them with Django migrations."
+        )
+
     # 1. Translate models first so they exist in django_tortoise_adapter.models
 
     # We need to translate BEFORE initializing Tortoise because Tortoise
     # looks for classes in the module
-    for app_config in django_apps.get_app_configs():
-        for model in app_config.get_models():
-            patch_model(model)
+    patch_models(apps=apps, exclude_apps=exclude_apps, lazy=lazy)
 
     # 2. Init Tortoise pointing to our registry
-    await Tortoise.init(
-        db_url=db_url, modules={"models": ["django_tortoise_adapter.models"]}
-    )
+    await init_tortoise(db_url=db_url)
 
     # 3. Generate schema
-    if generate_schemas:
+    if generate_schemas == "if_changed":
+        await generate_schemas_if_changed()
+    elif generate_schemas == "check":
+        check_schemas()
+    elif generate_schemas:
         await Tortoise.generate_schemas(safe=True)
 
 
+async def init_tortoise(db_url: str | None = None, **kwargs: Any) -> None:
+    """
+    Initializes Tortoise with the models translated so far. Lazy models
+    translated afterwards are registered on first access.
+
+    Also enables the slow query log if TORTOISE_ADAPTER_SLOW_QUERY_THRESHOLD
+    (in seconds) is set.
+    """
+    with warnings.catch_warnings():
+        # In lazy mode the registry may still be empty
+        warnings.filterwarnings("ignore", "Module .* has no models", RuntimeWarning)
+        await Tortoise.init(config=get_tortoise_config(db_url=db_url), **kwargs)
+
+    slow_query_threshold = getattr(
+        settings, "TORTOISE_ADAPTER_SLOW_QUERY_THRESHOLD", None
+    )
+    if slow_query_threshold is not None:
+        enable_slow_query_log(slow_query_threshold)
+
+
 def activate(
     _modules: list[str],
-    db_url: str = "sqlite://:memory:",
-    generate_schemas: bool = True,
+    db_url: str | None = None,
+    generate_schemas: bool | str = True,
+    background_loop: bool = False,
+    lazy: bool = False,
+    apps: list[str] | None = None,
+    exclude_apps: list[str] | None = None,
 ) -> None:
     """
     Activates Tortoise backend (Sync wrapper).
+
+    :param background_loop: Whether to start a dedicated event loop thread that
+        owns the Tortoise connections and serves every sync call (see
+        bridge.start_background_loop). Recommended for WSGI deployments.
     """
+    if background_loop:
+        start_background_loop()
     run_async(
-        activate_async(_modules, db_url=db_url, generate_schemas=generate_schemas)
+        activate_async(
+            _modules,
+            db_url=db_url,
+            generate_schemas=generate_schemas,
+            lazy=lazy,
+            apps=apps,
+            exclude_apps=exclude_apps,
+        )
     )
 
 
-def patch_model(django_model: type[django_models.Model]) -> None:
+def patch_models(
+    apps: list[str] | None = None,
+    exclude_apps: list[str] | None = None,
+    lazy: bool = False,
+) -> None:
+    """
+    Translates the selected models (see get_models_to_translate), or installs
+    a lazy manager on them.
+
+    Outside of lazy mode, the models generated ahead of time by
+    `manage.py tortoise_codegen` are used when they are up to date (see
+    codegen.load_generated_models).
+    """
+    models_to_translate = get_models_to_translate(apps=apps, exclude_apps=exclude_apps)
+    generated = {} if lazy else load_generated_models(models_to_translate)
+    for model in models_to_translate:
+        label = model._meta.label  # pylint: disable=protected-access
+        if lazy:
+            install_lazy_manager(model)
+        elif label in generated:
+            patch_model(model, generated[label])
+        else:
+            patch_model(model)
+
+
+def patch_model(
+    django_model: type[django_models.Model], tortoise_model: type[Any] | None = None
+) -> TortoiseManager | None:
+    """
+    Replaces the manager of the Django model by a TortoiseManager of its
+    Tortoise translation, or of the given (generated) Tortoise model.
+    """
     # Translate
     try:
-        tortoise_cls = TortoiseTranslator.translate_model(django_model)
+        tortoise_cls = tortoise_model or TortoiseTranslator.translate_model(
+            django_model
+        )
     except Exception:  # pylint: disable=broad-exception-caught
         # print(f"Skipping {django_model.__name__}: {e}")
-        return
+        return None
 
     # Patch Manager
     manager = TortoiseManager(tortoise_cls)
     # pylint: disable=attribute-defined-outside-init
     manager.model = django_model
+    _managers[tortoise_cls] = manager
+
+    # Per-model result cache policy, keyed by "app_label.ModelName"
+    cache_options = getattr(settings, "TORTOISE_RESULT_CACHE", {}).get(
+        django_model._meta.label  # pylint: disable=protected-access
+    )
+    if cache_options is not None:
+        manager.enable_cache(backend=get_result_cache_from_settings(cache_options))
 
     # Patching 'objects' is the standard way users access the manager
-    setattr(django_model, "objects", manager)
+    django_model.objects = manager  # type: ignore[attr-defined]
+    return manager
+
+
+class LazyTortoiseManager:
+    """
+    Descriptor installed as `objects` in lazy mode.
+
+    The first access translates the model (and the not yet translated models
+    it relates to), registers it in Tortoise if Tortoise is already initialized
+    and replaces the descriptor by the TortoiseManager.
+    """
+
+    def __init__(self, django_model: type[django_models.Model], original: Any) -> None:
+        self.model = django_model
+        # Restored if the model can't be translated
+        self.original = original
+
+    def __get__(self, instance: Any, owner: type[django_models.Model]) -> Any:
+        with _lazy_lock:
+            if self.model.__dict__.get("objects") is self:
+                _translate_lazily(self.model)
+        return self.model.objects
+
+    def restore(self) -> None:
+        if self.original is None:
+            delattr(self.model, "objects")
+        else:
+            self.model.objects = self.original  # type: ignore[attr-defined]
+
+
+def install_lazy_manager(django_model: type[django_models.Model]) -> None:
+    """
+    Defers the translation of the model to the first access to its manager.
+    """
+    original = django_model.__dict__.get("objects")
+    if isinstance(original, (LazyTortoiseManager, TortoiseManager)):
+        return
+    lazy_manager = LazyTortoiseManager(django_model, original)
+    django_model.objects = lazy_manager  # type: ignore[attr-defined]
+
+
+def _translate_lazily(django_model: type[django_models.Model]) -> None:
+    # Related models are translated together so that the relations of the
+    # whole group can be resolved at once (they may be cyclic)
+    tortoise_models = []
+    for model in _with_related_models([django_model]):
+        lazy_manager = model.__dict__.get("objects")
+        if not isinstance(lazy_manager, LazyTortoiseManager):
+            continue
+        manager = patch_model(model)
+        if manager is None:
+            lazy_manager.restore()
+        else:
+            tortoise_models.append(manager.tortoise_model)
+
+    if tortoise_models and Tortoise._inited:  # pylint: disable=protected-access
+        _register_tortoise_models(tortoise_models)
+
+
+def _register_tortoise_models(tortoise_models: list[type[Any]]) -> None:
+    # Same steps as Tortoise.init for models created after it ran: the models
+    # already initialized are skipped when resolving the relations
+    # pylint: disable=protected-access
+    registry = Tortoise.apps[TORTOISE_APP_LABEL]
+    for tortoise_model in tortoise_models:
+        tortoise_model._meta.app = TORTOISE_APP_LABEL
+        tortoise_model._meta.default_connection = "default"
+        registry[tortoise_model.__name__] = tortoise_model
+    Tortoise._init_relations()
+    Tortoise._build_initial_querysets()
@@ -0,0 +1,177 @@
+"""
+Translation of Django query expressions to Tortoise ones.
+"""
+
+from typing import Any
+
+from django.db import models as django_models
+from django.db.models.expressions import Combinable, CombinedExpression, Star
+from tortoise import functions as tortoise_functions
+from tortoise.expressions import CombinedExpression as TortoiseCombinedExpression
+from tortoise.expressions import Connector
+from tortoise.expressions import Expression as TortoiseExpression
+from tortoise.expressions import F as TortoiseF
+from tortoise.expressions import Q as TortoiseQ
+from tortoise.expressions import Value as TortoiseValue
+
+AGGREGATES = {
+    django_models.Count: tortoise_functions.Count,
+    django_models.Sum: tortoise_functions.Sum,
+    django_models.Avg: tortoise_functions.Avg,
+    django_models.Min: tortoise_functions.Min,
+    django_models.Max: tortoise_functions.Max,
+}
+
+CONNECTORS = {
+    Combinable.ADD: Connector.add,
+    Combinable.SUB: Connector.sub,
+    Combinable.MUL: Connector.mul,
+    Combinable.DIV: Connector.div,
+    Combinable.MOD: Connector.mod,
+    Combinable.POW: Connector.pow,
+}
+
+
+def to_tortoise_lookup(tortoise_model: Any, lookup: str, column: bool = False) -> str:
+    """
+    Translates a Django lookup (e.g. "choice__votes__gt") to its Tortoise
+    equivalent: reverse relations are named by their related_name, which
+    defaults to "<model>_set" in the translated models (see
+    TortoiseTranslator) instead of "<model>".
+
+    With column=True, a lookup ending with a ForeignKey is translated to its
+    column (e.g. "question_id"), as Tortoise functions can't take relations.
+    """
+    parts = lookup.split("__")
+    model = tortoise_model
+    for index, part in enumerate(parts):
+        fields_map = model._meta.fields_map
+        if part not in fields_map and f"{part}_set" in fields_map:
+            part = parts[index] = f"{part}_set"
+        field = fields_map.get(part)
+        if field is None:
+            # pk, a lookup (gt, in, ...) or an annotation
+            break
+        if column and index == len(parts) - 1 and part in model._meta.fk_fields:
+            parts[index] = field.source_field
+        model = getattr(field, "related_model", None)
+        if model is None:
+            break
+    return "__".join(parts)
+
+
+def to_tortoise_q(tortoise_model: Any, q: Any) -> Any:
+    """
+    Translates a Django Q object (and the Q objects nested in it).
+    """
+    children = [
+        (
+            to_tortoise_q(tortoise_model, child)
+            if isinstance(child, django_models.Q)
+            else TortoiseQ(**{to_tortoise_lookup(tortoise_model, child[0]): child[1]})
+        )
+        for child in q.children
+    ]
+    join_type = "OR" if q.connector == django_models.Q.OR else "AND"
+    tortoise_q = TortoiseQ(*children, join_type=join_type)
+    return ~tortoise_q if q.negated else tortoise_q
+
+
+def to_tortoise_expression(tortoise_model: Any, value: Any) -> Any:
+    """
+    Translates a Django F() expression, or arithmetic over F() and Value(),
+    to a Tortoise expression (e.g. votes=F("votes") + 1). Other values are
+    returned unchanged.
+    """
+    if isinstance(value, django_models.F):
+        name = to_tortoise_lookup(
+            tortoise_model, value.name, column=True  # type: ignore[attr-defined]
+        )
+        if "__" in name:
+            raise TypeError(
+                f"F() expressions across relations are not supported: {value!r}."
+            )
+        return TortoiseF(name)
+    if isinstance(value, django_models.Value):
+        return value.value
+    if isinstance(value, CombinedExpression):
+        connector = CONNECTORS.get(value.connector)
+        if connector is None:
+            raise TypeError(f"Unsupported operator {value.connector!r} in {value!r}.")
+        lhs = to_tortoise_expression(tortoise_model, value.lhs)
+        if not isinstance(lhs, TortoiseExpression):
+            lhs = TortoiseValue(lhs)
+        return TortoiseCombinedExpression(
+            lhs, connector, to_tortoise_expression(tortoise_model, value.rhs)
+        )
+    if hasattr(value, "resolve_expression"):
+        raise TypeError(f"Unsupported expression: {value!r}.")
+    return value
+
+
+def to_insert_value(value: Any) -> Any:
+    """
+    Returns the value of a Value() expression. As in Django, other
+    expressions can't be inserted, as there is no row to refer to yet.
+    """
+    if isinstance(value, django_models.Value):
+        return value.value
+    if hasattr(value, "resolve_expression"):
+        raise ValueError(
+            f"Failed to insert expression {value!r}: F() expressions can only "
+            "be used to update, not to insert."
+        )
+    return value
+
+
+def to_tortoise_aggregate(tortoise_model: Any, expression: Any) -> Any:
+    """
+    Translates one of Django's Count, Sum, Avg, Min and Max aggregates of a
+    field (including the fields of related models) to a Tortoise function.
+    """
+    function = next(
+        (
+            tortoise_function
+            for django_aggregate, tortoise_function in AGGREGATES.items()
+            if isinstance(expression, django_aggregate)
+        ),
+        None,
+    )
+    if function is None:
+        raise TypeError(f"Unsupported aggregate: {expression!r}.")
+
+    source: Any = expression.get_source_expressions()[0]
+    if isinstance(source, Star):
+        field = tortoise_model._meta.pk_attr
+    elif isinstance(source, django_models.F):
+        name = source.name  # type: ignore[attr-defined]
+        field = to_tortoise_lookup(tortoise_model, name, column=True)
+    else:
+        raise TypeError(f"Only aggregates of fields are supported: {expression!r}.")
+
+    kwargs: dict[str, Any] = {"distinct": bool(getattr(expression, "distinct", False))}
+    if expression.filter is not None:
+        kwargs["_filter"] = to_tortoise_q(tortoise_model, expression.filter)
+    aggregate = function(field, **kwargs)
+    if getattr(expression, "default", None) is not None:
+        return tortoise_functions.Coalesce(aggregate, expression.default)
+    return aggregate
+
+
+def get_aggregates(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the aggregates of an annotate()/aggregate() call by alias.
+    Positional ones are named like in Django (e.g. "choice__count").
+    """
+    aggregates: dict[str, Any] = {}
+    for expression in args:
+        try:
+            alias = expression.default_alias
+        except (AttributeError, TypeError) as exc:
+            raise TypeError("Complex aggregates require an alias.") from exc
+        aggregates[alias] = expression
+    for alias, expression in kwargs.items():
+        if alias in aggregates:
+            raise ValueError(f"The alias {alias!r} is used more than once.")
+        aggregates[alias] = expression
+    return aggregates
@@ -0,0 +1,79 @@
+"""
+Tortoise fields storing values like their Django counterparts, for the
+types whose Tortoise column or format differs from Django's.
+"""
+
+import datetime
+from typing import Any
+from uuid import UUID
+
+from tortoise import fields as tortoise_fields
+
+
+def _get_dialect(field: Any) -> str:
+    # Dialect of the model's connection, as Tortoise fields have no
+    # per-dialect value conversion (only SQL types)
+    return str(field.model._meta.db.capabilities.dialect)
+
+
+class HexUUIDField(tortoise_fields.UUIDField):
+    """
+    UUID field stored like Django's: natively on PostgreSQL, and as 32 hex
+    digits (without dashes) in a CHAR(32) column elsewhere.
+    """
+
+    SQL_TYPE = "CHAR(32)"
+
+    class _db_postgres:  # pylint: disable=invalid-name,too-few-public-methods
+        SQL_TYPE = "UUID"
+
+    def to_db_value(self, value: Any, instance: Any) -> str | None:
+        if value is None:
+            return None
+        uuid = value if isinstance(value, UUID) else UUID(str(value))
+        return uuid.hex
+
+
+class IntervalField(tortoise_fields.TimeDeltaField):
+    """
+    Duration field stored like Django's DurationField: an INTERVAL on
+    PostgreSQL, and a BIGINT of microseconds elsewhere.
+    """
+
+    class _db_postgres:  # pylint: disable=invalid-name,too-few-public-methods
+        SQL_TYPE = "INTERVAL"
+
+    def to_db_value(self, value: Any, instance: Any) -> Any:
+        if _get_dialect(self) == "postgres":
+            self.validate(value)
+            return value
+        return super().to_db_value(value, instance)
+
+
+class NaiveTimeField(tortoise_fields.TimeField):
+    """
+    Time field without time zone, like Django's TimeField (Tortoise's is a
+    TIMETZ on PostgreSQL and follows its use_tz setting).
+    """
+
+    class _db_postgres:  # pylint: disable=invalid-name,too-few-public-methods
+        SQL_TYPE = "TIME"
+
+    def to_python_value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return datetime.time.fromisoformat(value)
+        return value
+
+    def to_db_value(self, value: Any, instance: Any) -> Any:
+        # Only for model instances, not for filters on the class
+        if hasattr(instance, "_saved_in_db") and (
+            self.auto_now
+            or (self.auto_now_add and getattr(instance, self.model_field_name) is None)
+        ):
+            value = datetime.datetime.now().time()
+            setattr(instance, self.model_field_name, value)
+        self.validate(value)
+        if value is not None and _get_dialect(self) == "sqlite":
+            # ISO 8601 text, like Django (SQLite has no time type)
+            return value.isoformat()
+        return value
@@ -0,0 +1,263 @@
+"""
+Instrumentation of the queries run by TortoiseQuerySet and TortoiseManager.
+
+Every query is reported as a QueryEvent to the registered listeners and to
+the QueryStats of the current request, if any, including the queries that
+fail or are cancelled (e.g. by a timeout). When there are neither, queries
+are awaited directly and nothing is measured.
+
+An event covers one manager or QuerySet operation, not one SQL statement:
+the additional queries of prefetch_related, the batches of bulk_create and
+bulk_update, and the savepoints of get_or_create are part of the event of
+the operation that issued them.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Key of the QueryStats in the ASGI scope (see TortoiseASGIWrapper)
+QUERY_STATS_SCOPE_KEY = "django_tortoise_adapter.query_stats"
+
+_NOT_DESCRIBED = object()
+
+
+class QueryEvent:
+    """
+    A query run through the adapter.
+
+    :param model: Tortoise model class.
+    :param operation: e.g. "fetch", "count", "exists", "create".
+    :param connection: Name of the Tortoise connection, if known.
+    :param duration: Seconds spent awaiting the query.
+    :param rows: Rows returned or written, None if not meaningful or if
+        the query failed.
+    :param exception: Exception raised by the query, if it failed or was
+        cancelled.
+
+    sql and params_shape are only built when accessed, so listeners that
+    don't need them don't pay for it.
+    """
+
+    __slots__ = (
+        "_describe",
+        "_description",
+        "connection",
+        "duration",
+        "exception",
+        "model",
+        "operation",
+        "rows",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        model: type[Any],
+        operation: str,
+        connection: str | None,
+        duration: float,
+        rows: int | None,
+        describe: Callable[[], tuple[str, list[Any] | None]] | None = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        self.model = model
+        self.operation = operation
+        self.connection = connection
+        self.duration = duration
+        self.rows = rows
+        self.exception = exception
+        self._describe = describe
+        self._description: Any = _NOT_DESCRIBED
+
+    def _get_description(self) -> tuple[str | None, list[Any] | None]:
+        if self._description is _NOT_DESCRIBED:
+            self._description = (None, None)
+            if self._describe is not None:
+                try:
+                    self._description = self._describe()
+                # Describing is best effort: whatever building the query
+                # raises must not reach the listener reading sql
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.debug(
+                        "Could not describe %s query", self.operation, exc_info=True
+                    )
+        return self._description  # type: ignore[no-any-return]
+
+    @property
+    def sql(self) -> str | None:
+        return self._get_description()[0]
+
+    @property
+    def params_shape(self) -> tuple[str, ...] | None:
+        """
+        Type names of the query parameters (their values are not exposed).
+        """
+        params = self._get_description()[1]
+        if params is None:
+            return None
+        return tuple(type(param).__name__ for param in params)
+
+
+class QueryStats:
+    """
+    Number of queries and seconds spent in them, e.g. during a request.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+    def record(self, event: QueryEvent) -> None:
+        self.count += 1
+        self.duration += event.duration
+
+
+_listeners: list[Callable[[QueryEvent], None]] = []
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "django_tortoise_adapter_query_stats", default=None
+)
+
+_slow_query_listener: Callable[[QueryEvent], None] | None = None
+
+
+def add_query_listener(listener: Callable[[QueryEvent], None]) -> None:
+    """
+    Calls listener with a QueryEvent after every query.
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_query_listener(listener: Callable[[QueryEvent], None]) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Counts and times the queries run inside the block.
+    """
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def get_query_stats() -> QueryStats | None:
+    """
+    Returns the stats of the current track_queries() block (e.g. the
+    request, see TortoiseASGIWrapper), if any.
+    """
+    return _query_stats.get()
+
+
+def enable_slow_query_log(threshold: float) -> None:
+    """
+    Logs a warning with the SQL of every query slower than threshold seconds.
+    """
+    global _slow_query_listener  # pylint: disable=global-statement
+
+    disable_slow_query_log()
+
+    def log_slow_query(event: QueryEvent) -> None:
+        if event.duration >= threshold:
+            logger.warning(
+                "Slow query (%.3fs) %s.%s%s: %s",
+                event.duration,
+                event.model.__name__,
+                event.operation,
+                (
+                    ""
+                    if event.exception is None
+                    else f" failed with {type(event.exception).__name__}"
+                ),
+                event.sql,
+            )
+
+    _slow_query_listener = log_slow_query
+    add_query_listener(log_slow_query)
+
+
+def disable_slow_query_log() -> None:
+    global _slow_query_listener  # pylint: disable=global-statement
+
+    if _slow_query_listener is not None:
+        remove_query_listener(_slow_query_listener)
+        _slow_query_listener = None
+
+
+def describe_query(query: Any) -> tuple[str, list[Any] | None]:
+    """
+    Returns the SQL of a Tortoise query and its parameters, if the Tortoise
+    version doesn't inline them.
+    """
+    sql = query.sql()
+    get_parameterized_sql = getattr(
+        getattr(query, "query", None), "get_parameterized_sql", None
+    )
+    if get_parameterized_sql is None:
+        return sql, None
+    return sql, get_parameterized_sql()[1]
+
+
+def _count_rows(result: Any) -> int | None:
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return None
+
+
+async def instrument(  # pylint: disable=too-many-arguments
+    awaitable: Awaitable[Any],
+    model: type[Any],
+    operation: str,
+    *,
+    db: Any = None,
+    describe: Callable[[], tuple[str, list[Any] | None]] | None = None,
+    count_rows: Callable[[Any], int | None] = _count_rows,
+) -> Any:
+    """
+    Awaits a query, reporting it to the listeners and the current stats,
+    whether it succeeds or not.
+    """
+    stats = _query_stats.get()
+    if not _listeners and stats is None:
+        return await awaitable
+
+    start = time.perf_counter()
+    rows = None
+    exception = None
+    try:
+        result = await awaitable
+        rows = count_rows(result)
+        return result
+    except BaseException as exc:
+        # Including cancellations, e.g. by a timeout
+        exception = exc
+        raise
+    finally:
+        event = QueryEvent(
+            model,
+            operation,
+            getattr(db, "connection_name", None),
+            time.perf_counter() - start,
+            rows,
+            describe,
+            exception,
+        )
+        if stats is not None:
+            stats.record(event)
+        # Listeners may remove themselves
+        for listener in _listeners.copy():
+            try:
+                listener(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Query listener %r failed", listener)
@@ -0,0 +1,136 @@
+"""
+Request-scoped batching of get(pk=...) lookups (a "DataLoader").
+
+Inside use_dataloader() (e.g. every request, see TortoiseASGIWrapper),
+the primary keys looked up with get(pk=...) during one event loop
+iteration are fetched together with a single WHERE pk IN (...) query. The
+loaded objects are kept in an identity map, so looking up the same object
+again in the block returns the same instance without a query. Writes
+through the adapter drop the identity map of their model.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any
+
+from tortoise import connections
+from tortoise.exceptions import DoesNotExist
+
+from django_tortoise_adapter.config import MAX_QUERY_PARAMS
+from django_tortoise_adapter.instrumentation import describe_query, instrument
+
+# (Tortoise model, connection alias)
+LoaderKey = tuple[type[Any], str]
+
+
+class DataLoader:
+    """
+    Coalesces the primary key lookups of a model made in the same event
+    loop iteration, and remembers their results.
+    """
+
+    def __init__(self) -> None:
+        # Loaded objects by primary key, None for missing rows
+        self._loaded: dict[LoaderKey, dict[Any, Any]] = {}
+        # Primary keys to fetch in the next batch, and their waiters
+        self._pending: dict[LoaderKey, dict[Any, asyncio.Future[Any]]] = {}
+        # Running batches (the event loop only keeps weak references)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, tortoise_model: type[Any], alias: str, pk: Any) -> Any:
+        """
+        Returns the object with the given primary key, raising DoesNotExist
+        if there is none.
+        """
+        key = (tortoise_model, alias)
+        pk = tortoise_model._meta.pk.to_python_value(pk)
+        loaded = self._loaded.get(key, {})
+        if pk in loaded:
+            obj = loaded[pk]
+        else:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = {}
+                asyncio.get_running_loop().call_soon(self._dispatch, key)
+            future = pending.get(pk)
+            if future is None:
+                future = pending[pk] = asyncio.get_running_loop().create_future()
+            # Cancelling a waiter must not cancel the others of the same pk
+            obj = await asyncio.shield(future)
+        if obj is None:
+            raise DoesNotExist(tortoise_model)
+        return obj
+
+    def invalidate(self, tortoise_model: type[Any]) -> None:
+        for key in list(self._loaded):
+            if key[0] is tortoise_model:
+                del self._loaded[key]
+
+    def _dispatch(self, key: LoaderKey) -> None:
+        pending = self._pending.pop(key)
+        task = asyncio.get_running_loop().create_task(self._fetch(key, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(
+        self, key: LoaderKey, pending: dict[Any, asyncio.Future[Any]]
+    ) -> None:
+        tortoise_model, alias = key
+        db = connections.get(alias)
+        found: dict[Any, Any] = {}
+        pks = list(pending)
+        try:
+            for start in range(0, len(pks), MAX_QUERY_PARAMS):
+                query = tortoise_model.filter(
+                    pk__in=pks[start : start + MAX_QUERY_PARAMS]
+                ).using_db(db)
+                objs = await instrument(
+                    query,
+                    tortoise_model,
+                    "load",
+                    db=db,
+                    describe=partial(describe_query, query),
+                )
+                found.update((obj.pk, obj) for obj in objs)
+        except asyncio.CancelledError:
+            for future in pending.values():
+                future.cancel()
+            raise
+        # Not swallowed: every waiter of the batch gets the query's error
+        # pylint: disable-next=broad-exception-caught
+        except Exception as exc:  # noqa: BLE001
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        loaded = self._loaded.setdefault(key, {})
+        for pk, future in pending.items():
+            loaded[pk] = found.get(pk)
+            if not future.done():
+                future.set_result(loaded[pk])
+
+
+_dataloader: ContextVar[DataLoader | None] = ContextVar(
+    "django_tortoise_adapter_dataloader", default=None
+)
+
+
+@contextmanager
+def use_dataloader() -> Iterator[DataLoader]:
+    """
+    Batches and caches the get(pk=...) lookups made inside the block.
+    """
+    loader = DataLoader()
+    token = _dataloader.set(loader)
+    try:
+        yield loader
+    finally:
+        _dataloader.reset(token)
+
+
+def get_dataloader() -> DataLoader | None:
+    return _dataloader.get()
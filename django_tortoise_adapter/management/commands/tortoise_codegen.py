@@ -0,0 +1,73 @@
+import importlib.util
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from django_tortoise_adapter.codegen import generate_module
+from django_tortoise_adapter.core import get_models_to_translate
+
+
+class Command(BaseCommand):
+    help = (
+        "Writes the Tortoise translations of the Django models to the module of "
+        "TORTOISE_ADAPTER_MODELS_MODULE, which activate() then imports instead "
+        "of translating the models at startup."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--output",
+            help="Path of the module to write (by default, the file of "
+            "TORTOISE_ADAPTER_MODELS_MODULE).",
+        )
+        parser.add_argument(
+            "--apps",
+            nargs="+",
+            help="App labels to translate (TORTOISE_ADAPTER_APPS by default).",
+        )
+        parser.add_argument(
+            "--exclude-apps",
+            nargs="+",
+            help="App labels to skip (TORTOISE_ADAPTER_EXCLUDE_APPS by default).",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error if the module is out of date, without "
+            "writing it.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = Path(options["output"] or self.get_default_output())
+        source = generate_module(
+            get_models_to_translate(
+                apps=options["apps"], exclude_apps=options["exclude_apps"]
+            )
+        )
+
+        current = path.read_text(encoding="utf-8") if path.exists() else None
+        if options["check"]:
+            if current != source:
+                raise CommandError(f"{path} is out of date.")
+            self.stdout.write(f"{path} is up to date.")
+        elif current == source:
+            self.stdout.write(f"{path} is up to date.")
+        else:
+            path.write_text(source, encoding="utf-8")
+            self.stdout.write(self.style.SUCCESS(f"Wrote {path}."))
+
+    @staticmethod
+    def get_default_output() -> str:
+        module_name = getattr(settings, "TORTOISE_ADAPTER_MODELS_MODULE", None)
+        if module_name is None:
+            raise CommandError("Set TORTOISE_ADAPTER_MODELS_MODULE or pass --output.")
+        # The module may not exist yet, but its package must
+        package_name, _, name = module_name.rpartition(".")
+        if not package_name:
+            return f"{name}.py"
+        spec = importlib.util.find_spec(package_name)
+        if spec is None or not spec.submodule_search_locations:
+            raise CommandError(f"Package {package_name} not found, pass --output.")
+        return str(Path(next(iter(spec.submodule_search_locations))) / f"{name}.py")
@@ -0,0 +1,126 @@
+"""
+Chooses the Tortoise connection of each query.
+
+Reads and writes are routed with the same routers as Django's ORM
+(DATABASE_ROUTERS, or TORTOISE_ADAPTER_ROUTERS to use different ones), and
+the alias they return is the name of the Tortoise connection built from
+that entry of DATABASES (see config.get_tortoise_config).
+"""
+
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db import router as django_router
+from django.db.utils import ConnectionRouter
+
+from django_tortoise_adapter.transactions import get_atomic_aliases
+
+
+class StickyState:  # pylint: disable=too-few-public-methods
+    """
+    Tracks whether the current request has written to the database.
+    """
+
+    def __init__(self) -> None:
+        self.written = False
+
+
+_sticky_state: ContextVar[StickyState | None] = ContextVar(
+    "django_tortoise_adapter_sticky_state", default=None
+)
+
+# TORTOISE_ADAPTER_ROUTERS and the router built from it
+_router: tuple[Any, ConnectionRouter] | None = None
+
+
+def get_router() -> ConnectionRouter:
+    """
+    Returns Django's router, or one built from TORTOISE_ADAPTER_ROUTERS.
+    """
+    global _router  # pylint: disable=global-statement
+
+    routers = getattr(settings, "TORTOISE_ADAPTER_ROUTERS", None)
+    if routers is None:
+        return django_router
+    if _router is None or _router[0] != routers:
+        _router = (routers, ConnectionRouter(routers))
+    return _router[1]
+
+
+def db_for_read(model: Any, **hints: Any) -> str:
+    """
+    Returns the alias to read the model from.
+
+    Once the current request has written (see sticky_after_write), reads
+    go to the write database so they see their own writes. So do reads
+    inside an atomic() block on the write database.
+    """
+    state = _sticky_state.get()
+    if state is not None and state.written:
+        return db_for_write(model, **hints)
+    atomic_aliases = get_atomic_aliases()
+    if atomic_aliases:
+        alias = db_for_write(model, **hints)
+        if alias in atomic_aliases:
+            return alias
+    return str(get_router().db_for_read(model, **hints) or DEFAULT_DB_ALIAS)
+
+
+def db_for_write(model: Any, **hints: Any) -> str:
+    """
+    Returns the alias to write the model to.
+    """
+    return str(get_router().db_for_write(model, **hints) or DEFAULT_DB_ALIAS)
+
+
+def mark_written() -> None:
+    """
+    Pins the following reads of the current request to the write database,
+    if sticky_after_write is enabled.
+    """
+    state = _sticky_state.get()
+    if state is not None:
+        state.written = True
+
+
+@contextmanager
+def sticky_after_write() -> Iterator[None]:
+    """
+    Routes every read after the first write of the block to the write
+    database. Nested blocks share the state of the outermost one.
+    """
+    if _sticky_state.get() is not None:
+        yield
+        return
+    token = _sticky_state.set(StickyState())
+    try:
+        yield
+    finally:
+        _sticky_state.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends writes to the default database and reads to one of the replicas
+    listed in the TORTOISE_ADAPTER_REPLICAS setting, picked at random.
+
+    Can be used in DATABASE_ROUTERS or TORTOISE_ADAPTER_ROUTERS.
+    """
+
+    def db_for_read(self, model: Any, **hints: Any) -> str:
+        replicas = getattr(settings, "TORTOISE_ADAPTER_REPLICAS", [])
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        return str(random.choice(replicas))  # nosec B311
+
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        # The replicas hold the same data as the primary
+        return True
@@ -0,0 +1,133 @@
+"""
+Schema generation that only runs when the translated schema changed, and
+a check of the Tortoise models against the Django migrations.
+
+generate_schemas_if_changed() stores a hash of the schema DDL of every
+connection in a one-row table, so that warm starts only read it instead of
+running a CREATE TABLE/INDEX IF NOT EXISTS per model and index.
+"""
+
+import hashlib
+import logging
+from typing import Any
+
+from django.db.migrations.loader import MigrationLoader
+from tortoise import Tortoise, connections
+from tortoise.exceptions import OperationalError
+from tortoise.transactions import in_transaction
+from tortoise.utils import generate_schema_for_client, get_schema_sql
+
+from django_tortoise_adapter.config import TORTOISE_APP_LABEL
+
+logger = logging.getLogger(__name__)
+
+# Holds the fingerprint of the last schema generated on the connection
+SCHEMA_TABLE = "tortoise_adapter_schema"
+
+
+def get_schema_fingerprint(connection: Any) -> str | None:
+    """
+    Returns a hash of the DDL Tortoise generates for the connection, or None
+    if it has no models (e.g. a read replica).
+    """
+    schema_sql = get_schema_sql(connection, safe=True)
+    if not schema_sql.strip():
+        return None
+    return hashlib.sha256(schema_sql.encode()).hexdigest()
+
+
+async def _get_stored_fingerprint(connection: Any) -> str | None:
+    try:
+        _, rows = await connection.execute_query(
+            f"SELECT fingerprint FROM {SCHEMA_TABLE}"
+        )
+    except OperationalError:
+        # No schema generated by this mode yet
+        return None
+    return str(rows[0][0]) if rows else None
+
+
+async def _store_fingerprint(connection: Any, fingerprint: str) -> None:
+    async with in_transaction(connection.connection_name) as transaction:
+        await transaction.execute_script(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_TABLE} "
+            "(fingerprint VARCHAR(64) NOT NULL)"
+        )
+        await transaction.execute_query(f"DELETE FROM {SCHEMA_TABLE}")
+        # A hex digest, safe to inline
+        await transaction.execute_query(
+            f"INSERT INTO {SCHEMA_TABLE} (fingerprint) VALUES ('{fingerprint}')"
+        )
+
+
+async def generate_schemas_if_changed() -> list[str]:
+    """
+    Generates the schemas (safely, like Tortoise.generate_schemas) of the
+    connections whose translated schema changed since the last run.
+    Connections without models, like read replicas, are not touched.
+
+    Returns the names of these connections.
+    """
+    generated = []
+    for connection in connections.all():
+        fingerprint = get_schema_fingerprint(connection)
+        if fingerprint is None:
+            continue
+        if await _get_stored_fingerprint(connection) == fingerprint:
+            continue
+        await generate_schema_for_client(connection, safe=True)
+        await _store_fingerprint(connection, fingerprint)
+        generated.append(connection.connection_name)
+    return generated
+
+
+def get_schema_drift(state: Any = None) -> list[str]:
+    """
+    Compares the tables and columns of the Tortoise models with the Django
+    migrations (the migration files, not the database), and returns the
+    differences: tables or columns used by Tortoise that the migrations
+    don't create, e.g. when makemigrations wasn't run after a model change.
+
+    Columns of the migrations that Tortoise doesn't use (e.g. fields that
+    aren't translated) are not reported.
+
+    :param state: ProjectState to compare with, the state after every
+        migration by default.
+    """
+    if state is None:
+        state = MigrationLoader(None, ignore_no_migrations=True).project_state()
+    columns_by_table = {
+        model._meta.db_table: {
+            field.column for field in model._meta.local_concrete_fields
+        }
+        for model in state.apps.get_models()
+    }
+
+    drift = []
+    for tortoise_model in Tortoise.apps[TORTOISE_APP_LABEL].values():
+        meta = tortoise_model._meta  # pylint: disable=protected-access
+        columns = columns_by_table.get(meta.db_table)
+        if columns is None:
+            drift.append(
+                f"Table {meta.db_table} of {tortoise_model.__name__} is not in "
+                "the migrations."
+            )
+            continue
+        drift.extend(
+            f"Column {meta.db_table}.{column} of {tortoise_model.__name__} is not "
+            "in the migrations."
+            for column in meta.fields_db_projection.values()
+            if column not in columns
+        )
+    return drift
+
+
+def check_schemas(state: Any = None) -> list[str]:
+    """
+    Logs a warning for every difference found by get_schema_drift, without
+    touching the schema, and returns them.
+    """
+    drift = get_schema_drift(state)
+    for message in drift:
+        logger.warning(message)
+    return drift
@@ -0,0 +1,326 @@
+"""
+Benchmarks TortoiseManager against Django's sync ORM and Django's async
+(a*) methods on the polls models.
+
+Run it from this directory. By default it uses a temporary SQLite database;
+set the same DB_* and TORTOISE_DB_URL variables as the e2e web service to
+benchmark another database (see the benchmark service of
+docker-compose.e2e.yml):
+
+    python benchmark.py --rows 100 1000 --concurrency 1 10 --output out.json
+
+Results (throughput and latency percentiles per backend, operation, row
+count and concurrency level) are printed and saved as JSON, so the files of
+two releases can be diffed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Any
+
+BACKENDS = ("django_sync", "django_async", "tortoise")
+OPERATIONS = ("create", "get", "filter", "iterate", "count")
+
+
+def configure_environment() -> None:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(
+        0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+    )
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "polls_project.settings")
+    if "DB_ENGINE" not in os.environ:
+        # Both ORMs must use the same database file
+        path = os.path.join(tempfile.mkdtemp(), "benchmark.sqlite3")
+        os.environ["DB_NAME"] = path
+        os.environ["TORTOISE_DB_URL"] = f"sqlite://{path}"
+        # Tortoise switches SQLite to WAL, which is persistent: do it up front
+        # so that Django's writes are not measured with a different journal
+        with closing(sqlite3.connect(path)) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+
+
+def summarize(
+    backend: str,
+    operation: str,
+    rows: int,
+    concurrency: int,
+    latencies: list[float],
+    total: float,
+) -> dict[str, Any]:
+    """
+    Returns the throughput (operations per second) and the latency
+    percentiles (in milliseconds) of a run.
+    """
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "backend": backend,
+        "operation": operation,
+        "rows": rows,
+        "concurrency": concurrency,
+        "operations": len(latencies),
+        "seconds": total,
+        "throughput": len(latencies) / total if total else 0.0,
+        "latency_ms": {
+            "p50": percentiles[49] * 1000,
+            "p90": percentiles[89] * 1000,
+            "p99": percentiles[98] * 1000,
+            "max": max(latencies) * 1000,
+        },
+    }
+
+
+def run_sync(
+    operation: Callable[[int], Any], count: int, concurrency: int
+) -> tuple[list[float], float]:
+    def timed(index: int) -> float:
+        start = time.perf_counter()
+        operation(index)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(count)))
+    return latencies, time.perf_counter() - start
+
+
+async def run_async(
+    operation: Callable[[int], Awaitable[Any]], count: int, concurrency: int
+) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    indexes = iter(range(count))
+
+    async def worker() -> None:
+        for index in indexes:
+            start = time.perf_counter()
+            await operation(index)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+def get_operation_counts(rows: int, repeat: int) -> dict[str, int]:
+    # Iterating and counting read the whole table, so they run fewer times
+    return {
+        "create": rows,
+        "get": rows,
+        "filter": rows,
+        "iterate": repeat,
+        "count": repeat,
+    }
+
+
+def get_sync_operations(pks: list[int]) -> dict[str, Callable[[int], Any]]:
+    # pylint: disable=import-outside-toplevel
+    from polls.models import Question  # type: ignore[import-not-found]
+
+    manager = Question._default_manager  # The Django one
+
+    return {
+        "create": lambda i: manager.create(question_text=f"Question {i}"),
+        "get": lambda i: manager.get(pk=random.choice(pks)),
+        "filter": lambda i: list(manager.filter(question_text=f"Question {i}")),
+        "iterate": lambda i: sum(1 for _ in manager.all().iterator()),
+        "count": lambda i: manager.count(),
+    }
+
+
+def get_async_operations(
+    backend: str, pks: list[int]
+) -> dict[str, Callable[[int], Awaitable[Any]]]:
+    # pylint: disable=import-outside-toplevel
+    from polls.models import Question  # type: ignore[import-not-found]
+
+    if backend == "tortoise":
+        manager: Any = Question.objects
+
+        async def iterate() -> int:
+            return len([question async for question in manager.all()])
+
+        return {
+            "create": lambda i: manager.create(question_text=f"Question {i}"),
+            "get": lambda i: manager.get(pk=random.choice(pks)),
+            "filter": lambda i: manager.filter(question_text=f"Question {i}"),
+            "iterate": lambda i: iterate(),
+            "count": lambda i: manager.count(),
+        }
+
+    django_manager = Question._default_manager
+
+    async def filter_questions(i: int) -> list[Any]:
+        return [q async for q in django_manager.filter(question_text=f"Question {i}")]
+
+    async def iterate_django() -> int:
+        return len([question async for question in django_manager.all()])
+
+    return {
+        "create": lambda i: django_manager.acreate(question_text=f"Question {i}"),
+        "get": lambda i: django_manager.aget(pk=random.choice(pks)),
+        "filter": filter_questions,
+        "iterate": lambda i: iterate_django(),
+        "count": lambda i: django_manager.acount(),
+    }
+
+
+def reset_table() -> None:
+    # pylint: disable=import-outside-toplevel
+    from polls.models import Choice, Question  # type: ignore[import-not-found]
+
+    Choice._default_manager.all().delete()
+    Question._default_manager.all().delete()
+
+
+def get_pks() -> list[int]:
+    # pylint: disable=import-outside-toplevel
+    from polls.models import Question  # type: ignore[import-not-found]
+
+    return list(Question._default_manager.values_list("pk", flat=True))
+
+
+def benchmark_sync(
+    rows_list: Iterable[int], concurrency_list: Iterable[int], repeat: int
+) -> list[dict[str, Any]]:
+    results = []
+    for rows in rows_list:
+        for concurrency in concurrency_list:
+            reset_table()
+            counts = get_operation_counts(rows, repeat)
+            pks: list[int] = []
+            for operation in OPERATIONS:
+                if operation == "get":
+                    pks.extend(get_pks())
+                function = get_sync_operations(pks)[operation]
+                latencies, total = run_sync(function, counts[operation], concurrency)
+                results.append(
+                    summarize(
+                        "django_sync", operation, rows, concurrency, latencies, total
+                    )
+                )
+    return results
+
+
+async def benchmark_async(
+    backends: Iterable[str],
+    rows_list: Iterable[int],
+    concurrency_list: Iterable[int],
+    repeat: int,
+) -> list[dict[str, Any]]:
+    # pylint: disable=import-outside-toplevel
+    from asgiref.sync import sync_to_async
+    from tortoise import Tortoise
+
+    from django_tortoise_adapter.core import activate_async
+
+    await activate_async([], generate_schemas=False, apps=["polls"])
+    results = []
+    try:
+        for backend in backends:
+            for rows in rows_list:
+                for concurrency in concurrency_list:
+                    await sync_to_async(reset_table)()
+                    counts = get_operation_counts(rows, repeat)
+                    pks: list[int] = []
+                    for operation in OPERATIONS:
+                        if operation == "get":
+                            pks.extend(await sync_to_async(get_pks)())
+                        function = get_async_operations(backend, pks)[operation]
+                        latencies, total = await run_async(
+                            function, counts[operation], concurrency
+                        )
+                        results.append(
+                            summarize(
+                                backend, operation, rows, concurrency, latencies, total
+                            )
+                        )
+    finally:
+        await Tortoise.close_connections()
+    return results
+
+
+def get_metadata() -> dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    from importlib.metadata import PackageNotFoundError, version
+
+    import django
+    from django.conf import settings
+
+    try:
+        adapter_version = version("django-tortoise-adapter")
+    except PackageNotFoundError:
+        adapter_version = None
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "django": django.get_version(),
+        "tortoise": version("tortoise-orm"),
+        "adapter": adapter_version,
+        "database": settings.DATABASES["default"]["ENGINE"],
+    }
+
+
+def print_results(results: list[dict[str, Any]]) -> None:
+    print(
+        f"{'backend':<14}{'operation':<10}{'rows':>7}{'conc':>6}"
+        f"{'ops/s':>11}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+    )
+    for result in results:
+        latency = result["latency_ms"]
+        print(
+            f"{result['backend']:<14}{result['operation']:<10}"
+            f"{result['rows']:>7}{result['concurrency']:>6}"
+            f"{result['throughput']:>11.1f}{latency['p50']:>9.2f}"
+            f"{latency['p90']:>9.2f}{latency['p99']:>9.2f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    configure_environment()
+    # pylint: disable=import-outside-toplevel
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", verbosity=0)
+    random.seed(args.seed)
+
+    results = []
+    if "django_sync" in args.backends:
+        results += benchmark_sync(args.rows, args.concurrency, args.repeat)
+    async_backends = [b for b in args.backends if b != "django_sync"]
+    if async_backends:
+        results += asyncio.run(
+            benchmark_async(async_backends, args.rows, args.concurrency, args.repeat)
+        )
+
+    print_results(results)
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump({"metadata": get_metadata(), "results": results}, output, indent=2)
+    print(f"Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
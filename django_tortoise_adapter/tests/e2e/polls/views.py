@@ -1,5 +1,6 @@
 import json
 
+from django.db.models import F
 from django.http import HttpRequest, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 
@@ -29,9 +30,7 @@ async def async_get_question(request: HttpRequest, question_text: str) -> JsonRe
 
 @csrf_exempt
 async def async_list_questions(request: HttpRequest) -> JsonResponse:
-    questions = []
-    async for q in Question.objects.all():
-        questions.append(q.question_text)
+    questions = await Question.objects.values_list("question_text", flat=True)
     return JsonResponse({"questions": questions})
 
 
@@ -44,3 +43,13 @@ async def async_create_choice(request: HttpRequest, question_id: int) -> JsonRes
     q = await Question.objects.get(pk=question_id)
     c = await Choice.objects.create(question=q, choice_text="Not much", votes=0)
     return JsonResponse({"id": c.pk, "choice_text": c.choice_text})
+
+
+@csrf_exempt
+async def async_vote(request: HttpRequest, choice_id: int) -> JsonResponse:
+    # A single atomic UPDATE, concurrent votes are not lost
+    updated = await Choice.objects.filter(pk=choice_id).update(votes=F("votes") + 1)
+    if not updated:
+        return JsonResponse({"error": "Choice not found"}, status=404)
+    votes = await Choice.objects.values_list("votes", flat=True).get(pk=choice_id)
+    return JsonResponse({"id": choice_id, "votes": votes})
@@ -10,4 +10,5 @@ urlpatterns = [
         views.async_create_choice,
         name="create_choice",
     ),
+    path("choice/<int:choice_id>/vote/", views.async_vote, name="vote"),
 ]
@@ -58,6 +58,27 @@ class TestPollsE2E(unittest.TestCase):
             data = json.loads(response.read().decode())
             self.assertEqual(data["question_text"], question_text)
 
+    def test_4_vote(self) -> None:
+        question_text = f"Vote Question {self.unique_suffix}"
+        payload = json.dumps({"question_text": question_text}).encode()
+        req = urllib.request.Request(f"{BASE_URL}/create/", data=payload, method="POST")
+        req.add_header("Content-Type", "application/json")
+        with urllib.request.urlopen(req) as response:
+            q_id = json.loads(response.read().decode())["id"]
+
+        req = urllib.request.Request(f"{BASE_URL}/{q_id}/choice/create/", method="POST")
+        with urllib.request.urlopen(req) as response:
+            c_id = json.loads(response.read().decode())["id"]
+
+        for expected in (1, 2):
+            req = urllib.request.Request(
+                f"{BASE_URL}/choice/{c_id}/vote/", method="POST"
+            )
+            with urllib.request.urlopen(req) as response:
+                self.assertEqual(response.status, 200)
+                data = json.loads(response.read().decode())
+                self.assertEqual(data["votes"], expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import unittest
+
+from django_tortoise_adapter.bridge import (
+    get_background_loop,
+    run_async,
+    start_background_loop,
+    stop_background_loop,
+)
+
+
+async def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestRunAsync(unittest.TestCase):
+    def test_run_async_without_loop(self) -> None:
+        self.assertNotEqual(
+            run_async(current_thread_name()), "django-tortoise-adapter-loop"
+        )
+
+
+class TestBackgroundLoop(unittest.TestCase):
+    def tearDown(self) -> None:
+        stop_background_loop()
+
+    def test_start_is_idempotent(self) -> None:
+        loop = start_background_loop()
+        self.assertIs(start_background_loop(), loop)
+        self.assertIs(get_background_loop(), loop)
+        self.assertTrue(loop.is_running())
+
+    def test_run_async_uses_background_loop(self) -> None:
+        start_background_loop()
+        self.assertEqual(
+            run_async(current_thread_name()), "django-tortoise-adapter-loop"
+        )
+
+    def test_run_async_reuses_the_same_loop(self) -> None:
+        loop = start_background_loop()
+
+        async def running_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        self.assertIs(run_async(running_loop()), loop)
+        self.assertIs(run_async(running_loop()), loop)
+
+    def test_run_async_propagates_exceptions(self) -> None:
+        start_background_loop()
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            run_async(fail())
+
+    def test_run_async_from_background_loop_raises(self) -> None:
+        loop = start_background_loop()
+
+        async def nested() -> None:
+            run_async(current_thread_name())
+
+        future = asyncio.run_coroutine_threadsafe(nested(), loop)
+        with self.assertRaises(RuntimeError):
+            future.result()
+
+    def test_stop(self) -> None:
+        loop = start_background_loop()
+        stop_background_loop()
+        self.assertIsNone(get_background_loop())
+        self.assertTrue(loop.is_closed())
+        # Stopping twice is a no-op
+        stop_background_loop()
@@ -0,0 +1,163 @@
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+import django
+from django.conf import settings
+
+# Configure Django settings before using the cache framework
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+from django.core.cache import caches
+
+from django_tortoise_adapter.cache import (
+    MISSING,
+    DjangoResultCache,
+    LocMemResultCache,
+    ResultCacheBackend,
+    get_result_cache_from_settings,
+    get_result_cache_key,
+)
+
+
+class TestResultCacheBackend(unittest.TestCase):
+    def test_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            ResultCacheBackend()  # type: ignore[abstract]
+
+        class IncompleteCache(ResultCacheBackend):
+            async def get(
+                self, namespace: str, key: str, generation: Any = None
+            ) -> Any:
+                return MISSING
+
+        # Fails when instantiated, not on the first query
+        with self.assertRaises(TypeError):
+            IncompleteCache()  # type: ignore[abstract]
+
+
+class TestLocMemResultCache(unittest.IsolatedAsyncioTestCase):
+    async def test_get_and_set(self) -> None:
+        cache = LocMemResultCache()
+        self.assertIs(await cache.get("ns", "key"), MISSING)
+        await cache.set("ns", "key", [1, 2])
+        self.assertEqual(await cache.get("ns", "key"), [1, 2])
+        self.assertIs(await cache.get("other", "key"), MISSING)
+
+    async def test_lru_eviction(self) -> None:
+        cache = LocMemResultCache(maxsize=2)
+        await cache.set("ns", "a", "A")
+        await cache.set("ns", "b", "B")
+        await cache.get("ns", "a")
+        await cache.set("ns", "c", "C")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(await cache.get("ns", "a"), "A")
+        self.assertIs(await cache.get("ns", "b"), MISSING)
+
+    async def test_ttl(self) -> None:
+        cache = LocMemResultCache(ttl=10)
+        with patch("django_tortoise_adapter.cache.time.monotonic", return_value=100):
+            await cache.set("ns", "key", "value")
+        with patch("django_tortoise_adapter.cache.time.monotonic", return_value=109):
+            self.assertEqual(await cache.get("ns", "key"), "value")
+        with patch("django_tortoise_adapter.cache.time.monotonic", return_value=110):
+            self.assertIs(await cache.get("ns", "key"), MISSING)
+        self.assertEqual(len(cache), 0)
+
+    async def test_invalidate(self) -> None:
+        cache = LocMemResultCache()
+        await cache.set("ns", "key", "value")
+        await cache.set("other", "key", "value")
+        await cache.invalidate("ns")
+        self.assertIs(await cache.get("ns", "key"), MISSING)
+        self.assertEqual(await cache.get("other", "key"), "value")
+        await cache.set("ns", "key", "new")
+        self.assertEqual(await cache.get("ns", "key"), "new")
+
+    async def test_set_after_invalidate(self) -> None:
+        cache = LocMemResultCache()
+        generation = await cache.get_generation("ns")
+        await cache.invalidate("ns")
+        # Read before the invalidation, not stored
+        await cache.set("ns", "key", "old", generation)
+        self.assertIs(await cache.get("ns", "key"), MISSING)
+        self.assertEqual(len(cache), 0)
+
+        generation = await cache.get_generation("ns")
+        await cache.set("ns", "key", "new", generation)
+        self.assertEqual(await cache.get("ns", "key", generation), "new")
+
+    def test_invalid_maxsize(self) -> None:
+        with self.assertRaises(ValueError):
+            LocMemResultCache(maxsize=0)
+
+
+class TestDjangoResultCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await caches["default"].aclear()
+
+    async def test_get_set_invalidate(self) -> None:
+        cache = DjangoResultCache(ttl=60)
+        self.assertIs(await cache.get("ns", "key"), MISSING)
+        await cache.set("ns", "key", [1, 2])
+        self.assertEqual(await cache.get("ns", "key"), [1, 2])
+
+        await cache.invalidate("ns")
+        self.assertIs(await cache.get("ns", "key"), MISSING)
+        await cache.set("ns", "key", [3])
+        await cache.invalidate("ns")
+        self.assertIs(await cache.get("ns", "key"), MISSING)
+
+    async def test_set_after_invalidate(self) -> None:
+        cache = DjangoResultCache()
+        generation = await cache.get_generation("ns")
+        await cache.invalidate("ns")
+        await cache.set("ns", "key", "old", generation)
+        self.assertIs(await cache.get("ns", "key"), MISSING)
+        self.assertIs(await cache.get("ns", "key", generation), MISSING)
+
+        generation = await cache.get_generation("ns")
+        await cache.set("ns", "key", "new", generation)
+        self.assertEqual(await cache.get("ns", "key"), "new")
+
+    async def test_invalidate_evicted_generation(self) -> None:
+        cache = DjangoResultCache()
+        with patch.object(
+            type(caches["default"]), "aincr", side_effect=ValueError
+        ) as mock_incr:
+            await cache.invalidate("ns")
+            await cache.invalidate("ns")
+        mock_incr.assert_called_once()
+        self.assertEqual(
+            await caches["default"].aget("django_tortoise_adapter:ns:generation"), 1
+        )
+
+
+class TestHelpers(unittest.TestCase):
+    def test_get_result_cache_key(self) -> None:
+        self.assertEqual(
+            get_result_cache_key("fetch", [("a", 1)]),
+            get_result_cache_key("fetch", [("a", 1)]),
+        )
+        self.assertNotEqual(
+            get_result_cache_key("fetch", [("a", 1)]),
+            get_result_cache_key("fetch", [("a", 2)]),
+        )
+
+    def test_get_result_cache_from_settings(self) -> None:
+        locmem = get_result_cache_from_settings({"maxsize": 10, "ttl": 5})
+        assert isinstance(locmem, LocMemResultCache)
+        self.assertEqual((locmem.maxsize, locmem.ttl), (10, 5))
+
+        django_cache = get_result_cache_from_settings({"cache_alias": "default"})
+        assert isinstance(django_cache, DjangoResultCache)
+        self.assertEqual(django_cache.alias, "default")
+        self.assertIsNone(django_cache.ttl)
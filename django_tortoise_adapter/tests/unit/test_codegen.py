@@ -0,0 +1,218 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+import importlib
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models as django_models
+from tortoise import Tortoise
+from tortoise.utils import get_schema_sql
+
+from django_tortoise_adapter.codegen import (
+    generate_module,
+    get_fingerprint,
+    load_generated_models,
+)
+from django_tortoise_adapter.core import patch_models
+
+MODULE = "codegen_project.tortoise_models"
+
+
+class TestCodegen(unittest.IsolatedAsyncioTestCase):
+    models: list[Any]
+
+    async def asyncSetUp(self) -> None:
+        class CodegenTag(django_models.Model):
+            name: django_models.SlugField = django_models.SlugField(unique=True)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        class CodegenPost(django_models.Model):
+            id: django_models.BigAutoField = django_models.BigAutoField(
+                primary_key=True
+            )
+            tag: django_models.ForeignKey = django_models.ForeignKey(
+                CodegenTag,
+                on_delete=django_models.CASCADE,
+                null=True,
+                db_column="main_tag",
+                related_name="posts",
+            )
+            tags: django_models.ManyToManyField = django_models.ManyToManyField(
+                CodegenTag
+            )
+            uuid: django_models.UUIDField = django_models.UUIDField(default=uuid4)
+            title: django_models.CharField = django_models.CharField(
+                max_length=100, default=""
+            )
+            data: django_models.JSONField = django_models.JSONField(
+                encoder=DjangoJSONEncoder, default=dict
+            )
+            price: django_models.DecimalField = django_models.DecimalField(
+                max_digits=5, decimal_places=2, default=0
+            )
+
+            class Meta:
+                app_label = "unit_tests"
+                unique_together = (("tag", "title"),)
+                indexes = (
+                    django_models.Index(
+                        fields=["uuid"],
+                        name="post_free_uuid",
+                        condition=django_models.Q(price=0),
+                    ),
+                )
+
+        self.Tag = CodegenTag
+        self.Post = CodegenPost
+        self.models = [CodegenPost, CodegenTag]
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        package = Path(directory.name) / "codegen_project"
+        package.mkdir()
+        (package / "__init__.py").touch()
+        self.path = package / "tortoise_models.py"
+        sys.path.insert(0, directory.name)
+        self.addCleanup(sys.path.remove, directory.name)
+        self.addCleanup(sys.modules.pop, "codegen_project", None)
+        self.addCleanup(sys.modules.pop, MODULE, None)
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def get_schema(self) -> str:
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        schema = get_schema_sql(Tortoise.get_connection("default"), safe=False)
+        await Tortoise.close_connections()
+        return schema
+
+    def generate(self) -> Any:
+        self.path.write_text(generate_module(self.models), encoding="utf-8")
+        importlib.invalidate_caches()
+        return importlib.import_module(MODULE)
+
+    async def test_generated_module(self) -> None:
+        module = self.generate()
+        self.assertEqual(module.FINGERPRINT, get_fingerprint(self.models))
+        self.assertEqual(
+            module.MODELS,
+            {
+                "unit_tests.CodegenPost": module.CodegenPost,
+                "unit_tests.CodegenTag": module.CodegenTag,
+            },
+        )
+        # Same schema as the models translated at runtime
+        translated_schema = await self.get_schema()
+        self.assertEqual(
+            load_generated_models(self.models, MODULE),
+            module.MODELS,
+        )
+        self.assertEqual(await self.get_schema(), translated_schema)
+        self.assertIn('"main_tag" INT REFERENCES', translated_schema)
+        self.assertIn('"post_free_uuid"', translated_schema)
+
+    async def test_patch_models(self) -> None:
+        module = self.generate()
+        with (
+            patch.object(
+                settings,
+                "TORTOISE_ADAPTER_MODELS_MODULE",
+                MODULE,
+                create=True,
+            ),
+            patch(
+                "django_tortoise_adapter.core.get_models_to_translate",
+                return_value=self.models,
+            ),
+            patch(
+                "django_tortoise_adapter.core.TortoiseTranslator.translate_model"
+            ) as mock_translate,
+        ):
+            patch_models()
+        mock_translate.assert_not_called()
+        posts: Any = self.Post.objects
+        self.assertIs(posts.tortoise_model, module.CodegenPost)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+        tag = await self.Tag.objects.create(name="news")  # type: ignore[misc]
+        post = await posts.create(tag=tag, data={"a": 1})
+        fetched = await posts.select_related("tag").get(pk=post.pk)
+        self.assertEqual(fetched.tag.name, "news")
+        self.assertEqual(fetched.uuid, post.uuid)
+        self.assertEqual(await tag.posts.all().count(), 1)
+
+    async def test_outdated_module(self) -> None:
+        self.generate()
+        # The fingerprint covers the selection of models and their definition
+        with self.assertLogs("django_tortoise_adapter.codegen", "WARNING"):
+            self.assertEqual(load_generated_models([self.Tag], MODULE), {})
+        with (
+            patch.object(self.Post._meta.get_field("title"), "max_length", 200),
+            self.assertLogs("django_tortoise_adapter.codegen", "WARNING"),
+        ):
+            self.assertEqual(load_generated_models(self.models, MODULE), {})
+
+    async def test_missing_module(self) -> None:
+        self.assertEqual(load_generated_models(self.models), {})
+        with self.assertLogs("django_tortoise_adapter.codegen", "WARNING"):
+            self.assertEqual(load_generated_models(self.models, MODULE), {})
+
+    async def test_command(self) -> None:
+        def run(*args: str) -> str:
+            stdout = StringIO()
+            call_command("tortoise_codegen", *args, stdout=stdout)
+            return stdout.getvalue()
+
+        with patch(
+            "django_tortoise_adapter.management.commands.tortoise_codegen"
+            ".get_models_to_translate",
+            return_value=self.models,
+        ):
+            with self.assertRaises(CommandError):
+                run("--check", f"--output={self.path}")
+            self.assertIn("Wrote", run(f"--output={self.path}"))
+            self.assertEqual(
+                self.path.read_text(encoding="utf-8"), generate_module(self.models)
+            )
+            self.assertIn("up to date", run(f"--output={self.path}"))
+            self.assertIn("up to date", run("--check", f"--output={self.path}"))
+
+            with patch.object(
+                settings,
+                "TORTOISE_ADAPTER_MODELS_MODULE",
+                MODULE,
+                create=True,
+            ):
+                self.assertIn("up to date", run("--check"))
+            with self.assertRaises(CommandError):
+                run()
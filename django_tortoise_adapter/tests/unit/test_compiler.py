@@ -0,0 +1,116 @@
+import unittest
+from typing import Any
+
+import django
+from django.conf import settings
+
+# Configure Django settings before defining models
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+from django.db import models as django_models
+
+from django_tortoise_adapter.compiler import (
+    UNCACHEABLE,
+    CompiledQueryCache,
+    get_filter_params,
+    get_param_order,
+    has_distinct_params,
+)
+from django_tortoise_adapter.translator import TortoiseTranslator
+
+
+class TestCompiledQueryCache(unittest.TestCase):
+    def test_get_and_set(self) -> None:
+        cache = CompiledQueryCache()
+        self.assertIsNone(cache.get("shape"))
+        cache.set("shape", "SELECT ? LIMIT ?", (1, 0))
+        self.assertEqual(cache.get("shape"), ("SELECT ? LIMIT ?", (1, 0)))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 1)
+
+    def test_uncacheable(self) -> None:
+        cache = CompiledQueryCache()
+        cache.set("shape", UNCACHEABLE)
+        self.assertEqual(cache.get("shape"), (UNCACHEABLE, ()))
+        self.assertEqual((cache.hits, cache.misses, cache.uncacheable), (0, 0, 1))
+
+    def test_lru_eviction(self) -> None:
+        cache = CompiledQueryCache(maxsize=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+        self.assertEqual(cache.get("a"), ("A", ()))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), ("C", ()))
+
+    def test_clear(self) -> None:
+        cache = CompiledQueryCache()
+        cache.set("a", "A")
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+
+class TestParamOrder(unittest.TestCase):
+    def test_get_param_order(self) -> None:
+        self.assertEqual(get_param_order(["A", 10, 5], ["A", 10, 5]), (0, 1, 2))
+        # e.g. OFFSET ... FETCH NEXT on MSSQL and Oracle
+        self.assertEqual(get_param_order(["A", 10, 5], ["A", 5, 10]), (0, 2, 1))
+        self.assertEqual(get_param_order([], []), ())
+
+    def test_get_param_order_mismatch(self) -> None:
+        self.assertIsNone(get_param_order(["A"], ["A%"]))
+        self.assertIsNone(get_param_order(["A"], None))
+        self.assertIsNone(get_param_order(["A", 1], ["A"]))
+        self.assertIsNone(get_param_order([1], [True]))
+
+    def test_has_distinct_params(self) -> None:
+        self.assertTrue(has_distinct_params(["A", 1, 2]))
+        self.assertFalse(has_distinct_params([5, 5]))
+        self.assertFalse(has_distinct_params([1, True]))
+
+
+class TestGetFilterParams(unittest.TestCase):
+    tortoise_model: Any
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        class CompiledAuthor(django_models.Model):
+            name: django_models.CharField = django_models.CharField(max_length=50)
+            age: django_models.IntegerField = django_models.IntegerField()
+
+            class Meta:
+                app_label = "unit_tests"
+
+        cls.tortoise_model = TortoiseTranslator.translate_model(CompiledAuthor)
+
+    def test_params(self) -> None:
+        params = get_filter_params(
+            self.tortoise_model, {"name": "A", "age__gte": 3, "pk": 1}
+        )
+        self.assertEqual(params, ["A", 3, 1])
+
+    def test_none_has_no_param(self) -> None:
+        params = get_filter_params(self.tortoise_model, {"name": None, "age": 3})
+        self.assertEqual(params, [3])
+
+    def test_unsupported_filters(self) -> None:
+        cases: list[dict[str, Any]] = [
+            {"name__icontains": "A"},
+            {"age__in": [1, 2]},
+            {"unknown": 1},
+            {"name": object()},
+        ]
+        for filters in cases:
+            with self.subTest(filters=filters):
+                self.assertIsNone(get_filter_params(self.tortoise_model, filters))
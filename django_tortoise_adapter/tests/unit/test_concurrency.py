@@ -0,0 +1,141 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+import asyncio
+import inspect
+from typing import Any
+from unittest.mock import patch
+
+from django.db import models as django_models
+from tortoise import Tortoise
+
+from django_tortoise_adapter.concurrency import gather
+from django_tortoise_adapter.core import patch_model
+
+
+class Failure(Exception):
+    pass
+
+
+class TestGather(unittest.IsolatedAsyncioTestCase):
+    manager: Any
+
+    async def asyncSetUp(self) -> None:
+        class Metric(django_models.Model):
+            name: django_models.CharField = django_models.CharField(max_length=100)
+            value: django_models.IntegerField = django_models.IntegerField()
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.manager = patch_model(Metric)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+        for value in range(3):
+            await self.manager.create(name=f"m{value}", value=value)
+
+        self.running = 0
+        self.max_running = 0
+        self.cancelled: list[int] = []
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def work(self, result: int, delay: float = 0.01, fail: bool = False) -> int:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(delay)
+            if fail:
+                raise Failure
+            return result
+        except asyncio.CancelledError:
+            self.cancelled.append(result)
+            raise
+        finally:
+            self.running -= 1
+
+    async def test_queries(self) -> None:
+        metrics, count, first = await gather(
+            self.manager.filter(value__gte=1).order_by("value"),
+            self.manager.count(),
+            self.manager.order_by("value").first(),
+        )
+        self.assertEqual([metric.name for metric in metrics], ["m1", "m2"])
+        self.assertEqual(count, 3)
+        self.assertEqual(first.name, "m0")
+        self.assertEqual(await gather(), [])
+
+    async def test_concurrency(self) -> None:
+        results = await gather(*(self.work(i) for i in range(6)))
+        self.assertEqual(results, list(range(6)))
+        self.assertEqual(self.max_running, 6)
+
+    async def test_limit(self) -> None:
+        results = await gather(*(self.work(i) for i in range(6)), limit=2)
+        self.assertEqual(results, list(range(6)))
+        self.assertEqual(self.max_running, 2)
+
+    async def test_invalid_limit(self) -> None:
+        for limit in (0, -1):
+            work = self.work(1)
+            with self.assertRaises(ValueError):
+                await gather(work, limit=limit)
+            work.close()
+        self.assertEqual(self.running, 0)
+
+    async def test_shared_semaphore(self) -> None:
+        semaphore = asyncio.Semaphore(3)
+        await asyncio.gather(
+            gather(*(self.work(i) for i in range(4)), semaphore=semaphore),
+            gather(*(self.work(i) for i in range(4)), semaphore=semaphore),
+        )
+        self.assertEqual(self.max_running, 3)
+
+    async def test_global_limit(self) -> None:
+        with patch.object(settings, "TORTOISE_ADAPTER_GATHER_LIMIT", 2, create=True):
+            await asyncio.gather(
+                gather(*(self.work(i) for i in range(3))),
+                gather(*(self.work(i) for i in range(3)), limit=1),
+            )
+        self.assertEqual(self.max_running, 2)
+
+    async def test_failure_cancels_the_others(self) -> None:
+        with self.assertRaises(Failure):
+            await gather(self.work(1, delay=1), self.work(2, fail=True))
+        self.assertEqual(self.cancelled, [1])
+        self.assertEqual(self.running, 0)
+
+        waiting = self.work(3)
+        with self.assertRaises(Failure):
+            await gather(self.work(2, fail=True), waiting, limit=1)
+        # Never started, but closed: no "never awaited" warning
+        self.assertEqual(inspect.getcoroutinestate(waiting), inspect.CORO_CLOSED)
+        self.assertEqual(self.cancelled, [1])
+
+    async def test_cancellation(self) -> None:
+        task = asyncio.ensure_future(
+            gather(self.work(1, delay=1), self.work(2, delay=1))
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(sorted(self.cancelled), [1, 2])
+        self.assertEqual(self.running, 0)
@@ -0,0 +1,171 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+from typing import Any
+from unittest.mock import patch
+
+from tortoise import Tortoise
+
+from django_tortoise_adapter.config import (
+    get_connection_config,
+    get_tortoise_config,
+)
+
+POSTGRES = {
+    "ENGINE": "django.db.backends.postgresql",
+    "NAME": "polls",
+    "USER": "django",
+    "PASSWORD": "secret",
+    "HOST": "db",
+    "PORT": "",
+    "OPTIONS": {"sslmode": "require", "isolation_level": 1},
+}
+
+MYSQL = {
+    "ENGINE": "django.db.backends.mysql",
+    "NAME": "polls",
+    "USER": "django",
+    "PASSWORD": "secret",
+    "HOST": "db",
+    "PORT": "3307",
+    "OPTIONS": {"charset": "utf8"},
+}
+
+POOL = {
+    "min_size": 2,
+    "max_size": 20,
+    "max_lifetime": 300,
+    "statement_cache_size": 0,
+}
+
+
+class TestConnectionConfig(unittest.TestCase):
+    def test_sqlite(self) -> None:
+        config = get_connection_config(
+            {"ENGINE": "django.db.backends.sqlite3", "NAME": "db.sqlite3"}, POOL
+        )
+        self.assertEqual(
+            config,
+            {
+                "engine": "tortoise.backends.sqlite",
+                "credentials": {"file_path": "db.sqlite3"},
+            },
+        )
+
+    def test_postgres(self) -> None:
+        config = get_connection_config(POSTGRES, POOL)
+        self.assertEqual(config["engine"], "tortoise.backends.asyncpg")
+        self.assertEqual(
+            config["credentials"],
+            {
+                "host": "db",
+                "port": 5432,
+                "user": "django",
+                "password": "secret",
+                "database": "polls",
+                "ssl": "require",
+                "minsize": 2,
+                "maxsize": 20,
+                "max_inactive_connection_lifetime": 300,
+                "statement_cache_size": 0,
+            },
+        )
+
+    def test_mysql(self) -> None:
+        config = get_connection_config(MYSQL, {**POOL, "echo": True})
+        self.assertEqual(config["engine"], "tortoise.backends.mysql")
+        # No statement cache in aiomysql, unknown keys are passed through
+        self.assertEqual(
+            config["credentials"],
+            {
+                "host": "db",
+                "port": 3307,
+                "user": "django",
+                "password": "secret",
+                "database": "polls",
+                "charset": "utf8",
+                "minsize": 2,
+                "maxsize": 20,
+                "pool_recycle": 300,
+                "echo": True,
+            },
+        )
+
+    def test_unsupported_engine(self) -> None:
+        with self.assertRaises(ValueError):
+            get_connection_config({"ENGINE": "django.db.backends.oracle"})
+
+
+class TestTortoiseConfig(unittest.IsolatedAsyncioTestCase):
+    def test_from_databases(self) -> None:
+        config = get_tortoise_config(
+            databases={
+                "default": POSTGRES,
+                "replica": {**POSTGRES, "HOST": "replica"},
+                "legacy": {"ENGINE": "django.db.backends.oracle"},
+            },
+            pools={"replica": {"max_size": 50}},
+        )
+        connections = config["connections"]
+        self.assertEqual(list(connections), ["default", "replica"])
+        self.assertNotIn("maxsize", connections["default"]["credentials"])
+        self.assertEqual(connections["replica"]["credentials"]["host"], "replica")
+        self.assertEqual(connections["replica"]["credentials"]["maxsize"], 50)
+        self.assertEqual(
+            config["apps"],
+            {
+                "models": {
+                    "models": ["django_tortoise_adapter.models"],
+                    "default_connection": "default",
+                }
+            },
+        )
+
+    def test_from_settings(self) -> None:
+        with patch.object(
+            settings,
+            "TORTOISE_ADAPTER_POOLS",
+            {"default": {"journal_mode": "DELETE"}},
+            create=True,
+        ):
+            config = get_tortoise_config()
+        self.assertEqual(
+            config["connections"]["default"]["credentials"],
+            {"file_path": ":memory:", "journal_mode": "DELETE"},
+        )
+
+    def test_overrides(self) -> None:
+        with patch.object(
+            settings,
+            "TORTOISE_ORM",
+            {"connections": {"default": "sqlite://other.sqlite3"}},
+            create=True,
+        ):
+            config = get_tortoise_config()
+            self.assertEqual(config["connections"]["default"], "sqlite://other.sqlite3")
+            config = get_tortoise_config(db_url="sqlite://:memory:")
+            self.assertEqual(config["connections"]["default"], "sqlite://:memory:")
+
+    def test_no_default_connection(self) -> None:
+        with self.assertRaises(ValueError):
+            get_tortoise_config(databases={})
+
+    async def test_init(self) -> None:
+        await Tortoise.init(config=get_tortoise_config())
+        try:
+            connection: Any = Tortoise.get_connection("default")
+            self.assertEqual(connection.filename, ":memory:")
+        finally:
+            await Tortoise.close_connections()
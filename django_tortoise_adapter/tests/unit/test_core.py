@@ -14,12 +14,25 @@ if not settings.configured:
     )
     django.setup()
 
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 from django.db import models as django_models
 from tortoise import Tortoise
+from tortoise.exceptions import DoesNotExist, MultipleObjectsReturned
 
-from django_tortoise_adapter.core import activate, patch_model
+from django_tortoise_adapter.cache import LocMemResultCache
+from django_tortoise_adapter.compiler import compiled_query_cache
+from django_tortoise_adapter.core import (
+    LazyTortoiseManager,
+    TortoiseManager,
+    TortoiseQuerySet,
+    activate,
+    get_models_to_translate,
+    install_lazy_manager,
+    patch_model,
+    patch_models,
+)
 
 
 class TestCore(unittest.IsolatedAsyncioTestCase):
@@ -73,6 +86,367 @@ class TestCore(unittest.IsolatedAsyncioTestCase):
             texts.append(getattr(obj, "text"))
         self.assertIn("Iter", texts)
 
+    async def test_iterator_keyset_chunks(self) -> None:
+        for text in ["A", "B", "C", "D", "E"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        texts: list[str] = []
+        async for obj in self.Simple.objects.iterator(  # type: ignore[attr-defined]
+            chunk_size=2
+        ):
+            texts.append(obj.text)
+        self.assertEqual(texts, ["A", "B", "C", "D", "E"])
+
+    async def test_iterator_exact_multiple_of_chunk_size(self) -> None:
+        for text in ["A", "B", "C", "D"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        texts: list[str] = []
+        qs = self.Simple.objects.filter(text__in=["B", "C", "D"])
+        async for obj in qs.iterator(chunk_size=3):  # type: ignore[attr-defined]
+            texts.append(obj.text)
+        self.assertEqual(texts, ["B", "C", "D"])
+
+    async def test_iterator_ordered_chunks(self) -> None:
+        for text in ["B", "E", "A", "D", "C"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        texts: list[str] = []
+        async for obj in (
+            self.Simple.objects.all().order_by("-text").iterator(chunk_size=2)
+        ):
+            texts.append(obj.text)
+        self.assertEqual(texts, ["E", "D", "C", "B", "A"])
+
+    async def test_iterator_ordered_ties(self) -> None:
+        for text in ["B", "A", "B", "A", "B"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        qs: Any = self.Simple.objects.order_by("text")
+        ids = [obj.id async for obj in qs.iterator(chunk_size=2)]
+        # Ties are ordered by primary key, none is skipped or repeated
+        self.assertEqual(ids, [2, 4, 1, 3, 5])
+        self.assertEqual(
+            [row async for row in qs.values_list("id", flat=True).iterator(2)],
+            [2, 4, 1, 3, 5],
+        )
+
+    async def test_iterator_values_keyset(self) -> None:
+        for text in ["A", "B", "C", "D", "E"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        manager: Any = self.Simple.objects
+        rows: list[Any] = []
+        async for row in manager.values("text").iterator(chunk_size=2):
+            if not rows:
+                # Paginated by primary key, not shifted by the deleted rows
+                await manager.filter(text__in=["A", "B"]).delete()
+            rows.append(row)
+        self.assertEqual(rows, [{"text": text} for text in "ABCDE"])
+
+        rows = [row async for row in manager.values_list("text").iterator(2)]
+        self.assertEqual(rows, [("C",), ("D",), ("E",)])
+        qs = manager.values_list("text", named=True)[1:]
+        rows = [row async for row in qs.iterator(chunk_size=1)]
+        self.assertEqual([row.text for row in rows], ["D", "E"])
+        rows = [row async for row in manager.values().iterator(chunk_size=2)]
+        self.assertEqual(rows, await manager.values())
+
+    async def test_iterator_sliced_keyset(self) -> None:
+        for text in ["A", "B", "C", "D", "E", "F"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        qs: Any = self.Simple.objects.all()[1:5]
+        self.assertEqual(
+            [obj.text async for obj in qs.iterator(chunk_size=3)], list("BCDE")
+        )
+        self.assertEqual(
+            [obj.text async for obj in qs[:2].iterator(chunk_size=1)], list("BC")
+        )
+
+    async def test_iterator_invalid_chunk_size(self) -> None:
+        with self.assertRaises(ValueError):
+            self.Simple.objects.iterator(chunk_size=0)
+
+    async def test_values(self) -> None:
+        obj = await self.Simple.objects.create(text="A")  # type: ignore[misc]
+        await self.Simple.objects.create(text="B")  # type: ignore[misc]
+
+        rows = await self.Simple.objects.values("text")  # type: ignore[misc]
+        self.assertEqual(rows, [{"text": "A"}, {"text": "B"}])
+
+        row = await self.Simple.objects.values().get(text="A")  # type: ignore[misc]
+        self.assertEqual(row, {"id": obj.pk, "text": "A"})
+
+        first = (
+            await self.Simple.objects.filter(text="Z")  # type: ignore[misc]
+            .values("text")
+            .first()
+        )
+        self.assertIsNone(first)
+
+    async def test_values_list(self) -> None:
+        obj = await self.Simple.objects.create(text="A")  # type: ignore[misc]
+
+        rows = await self.Simple.objects.values_list()  # type: ignore[misc]
+        self.assertEqual(rows, [(obj.pk, "A")])
+
+        texts = await self.Simple.objects.values_list(  # type: ignore[misc]
+            "text", flat=True
+        )
+        self.assertEqual(texts, ["A"])
+
+        text = await self.Simple.objects.values_list(  # type: ignore[misc]
+            "text", flat=True
+        ).first()
+        self.assertEqual(text, "A")
+
+    async def test_values_list_named(self) -> None:
+        obj = await self.Simple.objects.create(text="A")  # type: ignore[misc]
+
+        rows = await self.Simple.objects.values_list(named=True)  # type: ignore[misc]
+        self.assertEqual(rows[0].id, obj.pk)
+        self.assertEqual(rows[0].text, "A")
+
+        row = await self.Simple.objects.values_list(  # type: ignore[misc]
+            "text", named=True
+        ).get(text="A")
+        self.assertEqual(row.text, "A")
+
+    async def test_values_list_invalid_arguments(self) -> None:
+        with self.assertRaises(TypeError):
+            self.Simple.objects.values_list("id", "text", flat=True)
+        with self.assertRaises(TypeError):
+            self.Simple.objects.values_list("text", flat=True, named=True)
+
+    async def test_values_iteration(self) -> None:
+        for text in ["A", "B", "C"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        qs: Any = self.Simple.objects.values_list("text", flat=True)
+        self.assertEqual(
+            [text async for text in qs.iterator(chunk_size=2)], list("ABC")
+        )
+
+    async def test_values_in_bulk(self) -> None:
+        with self.assertRaises(TypeError):
+            await self.Simple.objects.values().in_bulk()  # type: ignore[misc]
+
+    async def test_slicing(self) -> None:
+        for text in ["A", "B", "C", "D", "E"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        qs: Any = self.Simple.objects.all().order_by("text")
+
+        self.assertEqual([obj.text for obj in await qs[:2]], ["A", "B"])
+        self.assertEqual([obj.text for obj in await qs[1:3]], ["B", "C"])
+        self.assertEqual([obj.text for obj in await qs[3:]], ["D", "E"])
+        self.assertEqual([obj.text for obj in await qs[1:4][1:]], ["C", "D"])
+        self.assertEqual(await qs[2:2], [])
+        self.assertEqual((await qs[4]).text, "E")
+        with self.assertRaises(IndexError):
+            await qs[5]
+        # The original queryset is not limited
+        self.assertEqual(await qs.count(), 5)
+        self.assertEqual(await qs[1:4].count(), 3)
+
+    async def test_slicing_invalid(self) -> None:
+        qs: Any = self.Simple.objects.all()
+        with self.assertRaises(TypeError):
+            qs["a"]
+        with self.assertRaises(ValueError):
+            qs[-1]
+        with self.assertRaises(ValueError):
+            qs[:-1]
+        with self.assertRaises(ValueError):
+            qs[::2]
+        with self.assertRaises(TypeError):
+            await qs[:1].in_bulk()
+
+    async def test_limit_offset(self) -> None:
+        for text in ["A", "B", "C", "D", "E"]:
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        qs: Any = self.Simple.objects.all()
+        window = qs.offset(1).limit(3)
+        self.assertEqual([obj.text for obj in await window], ["B", "C", "D"])
+        self.assertEqual(
+            [obj.text async for obj in window.iterator(chunk_size=2)], list("BCD")
+        )
+        qs = self.Simple.objects.all()
+        self.assertEqual([obj.text for obj in await qs.offset(3)], ["D", "E"])
+        with self.assertRaises(ValueError):
+            self.Simple.objects.all().limit(-1)  # type: ignore[attr-defined]
+        with self.assertRaises(ValueError):
+            self.Simple.objects.all().offset(-1)  # type: ignore[attr-defined]
+
+    async def test_exists(self) -> None:
+        self.assertFalse(await self.Simple.objects.exists())  # type: ignore[misc]
+        await self.Simple.objects.create(text="A")  # type: ignore[misc]
+        await self.Simple.objects.create(text="B")  # type: ignore[misc]
+        self.assertTrue(await self.Simple.objects.exists())  # type: ignore[misc]
+        qs: Any = self.Simple.objects.filter(text="Z")
+        self.assertFalse(await qs.exists())
+
+        qs = self.Simple.objects.all()
+        self.assertTrue(await qs[1:].exists())
+        self.assertFalse(await qs[2:].exists())
+        self.assertFalse(await qs[:0].exists())
+
+    def test_sync_slicing(self) -> None:
+        with patch("django_tortoise_adapter.core.run_async") as mock_run:
+            mock_run.return_value = ["B", "C"]
+            qs: Any = self.Simple.objects.all()
+            self.assertEqual(list(qs[1:3]), ["B", "C"])
+            mock_run.assert_called_once()
+            mock_run.call_args.args[0].close()
+
+    async def test_queryset_is_immutable(self) -> None:
+        await self.Simple.objects.create(text="A")  # type: ignore[misc]
+        await self.Simple.objects.create(text="B")  # type: ignore[misc]
+        base: Any = self.Simple.objects.all()
+
+        self.assertEqual(len(await base.filter(text="A")), 1)
+        self.assertEqual((await base.get(text="B")).text, "B")
+        self.assertEqual(len(await base[:1]), 1)
+        self.assertEqual(await base.values_list("text", flat=True), ["A", "B"])
+        # Django semantics: order_by() replaces the previous ordering
+        ordered = base.order_by("text").order_by("-text")
+        self.assertEqual([obj.text for obj in await ordered], ["B", "A"])
+        self.assertEqual(len(await base), 2)
+
+    async def test_get_errors(self) -> None:
+        await self.Simple.objects.create(text="A")  # type: ignore[misc]
+        await self.Simple.objects.create(text="A")  # type: ignore[misc]
+        with self.assertRaises(DoesNotExist):
+            await self.Simple.objects.get(text="Z")  # type: ignore[misc]
+        with self.assertRaises(MultipleObjectsReturned):
+            await self.Simple.objects.get(text="A")  # type: ignore[misc]
+
+    async def test_compiled_query_cache(self) -> None:
+        compiled_query_cache.clear()
+        await self.Simple.objects.create(text="A")  # type: ignore[misc]
+        await self.Simple.objects.create(text="B")  # type: ignore[misc]
+
+        first = await self.Simple.objects.filter(text="A")  # type: ignore[misc]
+        self.assertEqual(compiled_query_cache.misses, 1)
+        second = await self.Simple.objects.filter(text="B")  # type: ignore[misc]
+        self.assertEqual(compiled_query_cache.hits, 1)
+        self.assertEqual([obj.text for obj in first], ["A"])
+        self.assertEqual([obj.text for obj in second], ["B"])
+        self.assertEqual(second[0].pk, 2)
+
+    async def test_compiled_query_cache_equal_params(self) -> None:
+        compiled_query_cache.clear()
+        for text in "ABCDEFGHIJKL":
+            await self.Simple.objects.create(text=text)  # type: ignore[misc]
+        qs: Any = self.Simple.objects.filter(text__gte="A")
+
+        # LIMIT 5 OFFSET 5: the order of the parameters can't be told
+        self.assertEqual([obj.text for obj in await qs[5:10]], list("FGHIJ"))
+        self.assertEqual(len(compiled_query_cache), 0)
+        self.assertEqual([obj.text for obj in await qs[2:5]], list("CDE"))
+        self.assertEqual(len(compiled_query_cache), 1)
+        self.assertEqual([obj.text for obj in await qs[5:10]], list("FGHIJ"))
+        self.assertEqual(compiled_query_cache.hits, 1)
+
+        # Filter values equal to the limit
+        self.assertEqual(
+            [obj.text for obj in await self.Simple.objects.filter(id=3)[:3]], ["C"]
+        )
+        self.assertEqual(
+            [obj.text for obj in await self.Simple.objects.filter(id=1)[:3]], ["A"]
+        )
+
+    async def test_compiled_query_cache_uncacheable(self) -> None:
+        compiled_query_cache.clear()
+        await self.Simple.objects.create(text="Abc")  # type: ignore[misc]
+        qs: Any = self.Simple.objects.all()
+
+        # Tortoise transforms the LIKE parameter, so the shape is never reused
+        for _ in range(2):
+            objs = await qs.filter(text__startswith="A")
+            self.assertEqual([obj.text for obj in objs], ["Abc"])
+        self.assertEqual(len(compiled_query_cache), 0)
+
+        with patch(
+            "django_tortoise_adapter.core.get_filter_params",
+            return_value=["other"],
+        ):
+            for _ in range(2):
+                objs = await qs.filter(text="Abc")
+                self.assertEqual([obj.text for obj in objs], ["Abc"])
+        self.assertEqual(compiled_query_cache.uncacheable, 1)
+        self.assertEqual(compiled_query_cache.hits, 0)
+
+    async def test_result_cache(self) -> None:
+        manager: Any = self.Simple.objects
+        manager.enable_cache(maxsize=10)
+        await manager.create(text="A")
+
+        with patch(
+            "django_tortoise_adapter.core.TortoiseQuerySet._fetch_uncached",
+            autospec=True,
+            side_effect=lambda qs: [],
+        ) as mock_fetch:
+            self.assertEqual(await manager.filter(text="A"), [])
+            self.assertEqual(await manager.filter(text="A"), [])
+            mock_fetch.assert_called_once()
+
+        self.assertEqual(await manager.count(), 1)
+        self.assertTrue(await manager.filter(text="A").exists())
+        await manager.create(text="A")
+        # The write invalidated the cached count and fetch
+        self.assertEqual(await manager.count(), 2)
+        self.assertEqual(len(await manager.filter(text="A")), 2)
+
+        manager.disable_cache()
+        self.assertIsNone(manager.get_queryset()._result_cache)
+
+    async def test_result_cache_write_during_read(self) -> None:
+        manager: Any = self.Simple.objects
+        manager.enable_cache()
+        await manager.create(text="A")
+        fetch_uncached = TortoiseQuerySet._fetch_uncached
+
+        async def fetch_then_write(qs: TortoiseQuerySet) -> Any:
+            results = await fetch_uncached(qs)
+            # Committed after the read, before its result is stored
+            await manager.create(text="B")
+            return results
+
+        with patch(
+            "django_tortoise_adapter.core.TortoiseQuerySet._fetch_uncached",
+            autospec=True,
+            side_effect=fetch_then_write,
+        ):
+            self.assertEqual(len(await manager.all()), 1)
+        self.assertEqual(len(await manager.all()), 2)
+
+    async def test_iterator_bypasses_result_cache(self) -> None:
+        manager: Any = self.Simple.objects
+        manager.enable_cache()
+        for text in ["A", "B", "C", "D", "E"]:
+            await manager.create(text=text)
+        texts = [obj.text async for obj in manager.iterator(chunk_size=2)]
+        self.assertEqual(texts, list("ABCDE"))
+        texts = [obj.text async for obj in manager.order_by("-text").iterator(2)]
+        self.assertEqual(texts, list("EDCBA"))
+        self.assertEqual(len(manager.result_cache), 0)
+
+    async def test_result_cache_invalidated_by_bulk_writes(self) -> None:
+        manager: Any = self.Simple.objects
+        manager.enable_cache()
+        await manager.bulk_create([self.Simple(text="A")])
+        objs = await manager.all()
+        self.assertEqual(len(objs), 1)
+
+        objs[0].text = "B"
+        await manager.bulk_update(objs, ["text"])
+        self.assertEqual(await manager.values_list("text", flat=True), ["B"])
+
+    def test_patch_model_result_cache_settings(self) -> None:
+        with self.settings_override({"unit_tests.Simple": {"ttl": 30}}):
+            patch_model(self.Simple)
+        manager: Any = self.Simple.objects
+        result_cache = manager.result_cache
+        self.assertIsInstance(result_cache, LocMemResultCache)
+        self.assertEqual(result_cache.ttl, 30)
+
+    def settings_override(self, value: dict[str, Any]) -> Any:
+        return patch.object(settings, "TORTOISE_RESULT_CACHE", value, create=True)
+
     def test_activate(self) -> None:
         # Mocking Tortoise.init to avoid side effects during activate call
         with patch("django_tortoise_adapter.core.Tortoise.init") as mock_init:
@@ -90,3 +464,664 @@ class TestCore(unittest.IsolatedAsyncioTestCase):
 
                 activate([])
                 self.assertTrue(mock_init.called)
+
+    def test_activate_background_loop(self) -> None:
+        with (
+            patch("django_tortoise_adapter.core.start_background_loop") as mock_start,
+            patch("django_tortoise_adapter.core.run_async") as mock_run,
+        ):
+            activate([], background_loop=True)
+            mock_start.assert_called_once_with()
+            self.assertEqual(mock_run.call_count, 1)
+            mock_run.call_args.args[0].close()
+
+
+class TestRelatedModels(unittest.IsolatedAsyncioTestCase):
+    Author: type[django_models.Model]
+    Book: type[django_models.Model]
+
+    async def asyncSetUp(self) -> None:
+        class Author(django_models.Model):
+            name: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        class Book(django_models.Model):
+            author: django_models.ForeignKey = django_models.ForeignKey(
+                Author, on_delete=django_models.CASCADE
+            )
+            title: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.Author = Author
+        self.Book = Book
+        patch_model(Author)
+        patch_model(Book)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def test_bulk_create_django_instances(self) -> None:
+        author = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        books = [self.Book(author_id=author.pk, title=f"T{i}") for i in range(5)]
+        created = await self.Book.objects.bulk_create(  # type: ignore[misc]
+            books, batch_size=2
+        )
+        self.assertEqual(len(created), 5)
+        self.assertEqual(await self.Book.objects.count(), 5)  # type: ignore[misc]
+
+    async def test_bulk_create_default_batch_size(self) -> None:
+        async def async_none(*args: Any, **kwargs: Any) -> None:
+            return None
+
+        manager: Any = self.Author.objects
+        with patch.object(
+            manager.tortoise_model, "bulk_create", side_effect=async_none
+        ) as mock_bulk_create:
+            await manager.bulk_create(
+                [manager.tortoise_model(name="A")], ignore_conflicts=True
+            )
+        mock_bulk_create.assert_called_once()
+        # id + name columns
+        self.assertEqual(mock_bulk_create.call_args.kwargs["batch_size"], 999 // 2)
+        self.assertTrue(mock_bulk_create.call_args.kwargs["ignore_conflicts"])
+
+    async def test_bulk_create_empty(self) -> None:
+        self.assertEqual(
+            await self.Author.objects.bulk_create([]), []  # type: ignore[misc]
+        )
+
+    async def test_bulk_create_invalid_batch_size(self) -> None:
+        with self.assertRaises(ValueError):
+            await self.Author.objects.bulk_create(  # type: ignore[misc]
+                [self.Author(name="A")], batch_size=0
+            )
+
+    async def test_bulk_update(self) -> None:
+        first = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        second = await self.Author.objects.create(name="B")  # type: ignore[misc]
+        await self.Book.objects.bulk_create(  # type: ignore[misc]
+            [self.Book(author_id=first.pk, title=f"T{i}") for i in range(3)]
+        )
+        books = await self.Book.objects.all()  # type: ignore[misc]
+        for book in books:
+            book.author_id = second.pk
+            book.title = "Updated"
+
+        updated = await self.Book.objects.bulk_update(  # type: ignore[misc]
+            books, ["author", "title"], batch_size=2
+        )
+        self.assertEqual(updated, 3)
+        count = await self.Book.objects.filter(  # type: ignore[misc]
+            author_id=second.pk, title="Updated"
+        ).count()
+        self.assertEqual(count, 3)
+
+    async def test_bulk_update_without_fields(self) -> None:
+        with self.assertRaises(ValueError):
+            await self.Author.objects.bulk_update([], [])  # type: ignore[misc]
+
+    async def test_bulk_update_empty(self) -> None:
+        self.assertEqual(
+            await self.Author.objects.bulk_update([], ["name"]),  # type: ignore[misc]
+            0,
+        )
+
+    async def test_in_bulk(self) -> None:
+        first = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        second = await self.Author.objects.create(name="B")  # type: ignore[misc]
+
+        by_pk = await self.Author.objects.in_bulk(  # type: ignore[misc]
+            [first.pk, second.pk]
+        )
+        self.assertEqual(set(by_pk), {first.pk, second.pk})
+
+        by_name = await self.Author.objects.in_bulk(  # type: ignore[misc]
+            ["B"], field_name="name"
+        )
+        self.assertEqual(list(by_name), ["B"])
+
+        everything = await self.Author.objects.filter(  # type: ignore[misc]
+            name="A"
+        ).in_bulk()
+        self.assertEqual(list(everything), [first.pk])
+
+        empty = await self.Author.objects.in_bulk([])  # type: ignore[misc]
+        self.assertEqual(empty, {})
+
+    async def test_select_related(self) -> None:
+        author = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        await self.Book.objects.create(author=author, title="T")  # type: ignore[misc]
+        author_cls = self.Author.objects.tortoise_model  # type: ignore[attr-defined]
+
+        books = await self.Book.objects.select_related("author")  # type: ignore[misc]
+        self.assertIsInstance(books[0].author, author_cls)
+        self.assertEqual(books[0].author.name, "A")
+
+        book = (
+            await self.Book.objects.all()
+            .select_related()
+            .get(title="T")  # type: ignore[misc]
+        )
+        self.assertIsInstance(book.author, author_cls)
+
+    async def test_select_related_none_clears(self) -> None:
+        qs: Any = self.Book.objects.select_related("author")
+        self.assertEqual(qs.select_related(None)._select_related, ())
+
+    async def test_prefetch_related(self) -> None:
+        author = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        await self.Book.objects.create(author=author, title="T1")  # type: ignore[misc]
+        await self.Book.objects.create(author=author, title="T2")  # type: ignore[misc]
+
+        first = await self.Author.objects.prefetch_related(  # type: ignore[misc]
+            "book_set"
+        ).first()
+        self.assertEqual(sorted(book.title for book in first.book_set), ["T1", "T2"])
+
+        qs: Any = self.Book.objects.prefetch_related("author__book_set")
+        books = [book async for book in qs]
+        self.assertEqual(len(books[0].author.book_set), 2)
+
+    async def test_prefetch_related_none_clears(self) -> None:
+        qs: Any = self.Author.objects.prefetch_related("book_set")
+        self.assertEqual(qs.prefetch_related(None)._prefetch_related, ())
+
+    async def test_only(self) -> None:
+        author = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        await self.Book.objects.create(author=author, title="T")  # type: ignore[misc]
+
+        qs: Any = self.Book.objects.only("title")
+        sql = qs._build_queryset().sql()
+        self.assertIn('"title"', sql)
+        self.assertNotIn('"author_id"', sql)
+
+        books = await qs
+        self.assertEqual(books[0].title, "T")
+        self.assertIsNotNone(books[0].pk)
+
+        qs = self.Book.objects.only("author")
+        self.assertEqual(qs._get_only_fields(), ["id", "author_id"])
+
+    async def test_only_none(self) -> None:
+        with self.assertRaises(TypeError):
+            self.Book.objects.only(None)  # type: ignore[arg-type]
+
+    async def test_defer(self) -> None:
+        author = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        await self.Book.objects.create(author=author, title="T")  # type: ignore[misc]
+
+        qs: Any = self.Book.objects.defer("title")
+        sql = qs._build_queryset().sql()
+        self.assertIn('"author_id"', sql)
+        self.assertNotIn('"title"', sql)
+
+        books = await qs
+        self.assertEqual(books[0].author_id, author.pk)
+
+        self.assertIsNone(qs.defer(None)._get_only_fields())
+
+    async def test_only_then_defer(self) -> None:
+        qs: Any = self.Book.objects.only("title", "author").defer("title")
+        self.assertEqual(qs._get_only_fields(), ["id", "author_id"])
+        # values() selects its own columns, only() is ignored
+        author = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        await self.Book.objects.create(author=author, title="T")  # type: ignore[misc]
+        self.assertEqual(await qs.values("title"), [{"title": "T"}])
+
+    async def test_values_foreign_key(self) -> None:
+        first, second = await self._create_books()
+        manager: Any = self.Book.objects
+        qs = manager.filter(title__in=["T1", "T4"]).order_by("title")
+        # Like Django, the primary key of the related object under its name
+        self.assertEqual(
+            await qs.values("title", "author"),
+            [
+                {"title": "T1", "author": first.pk},
+                {"title": "T4", "author": second.pk},
+            ],
+        )
+        self.assertEqual(
+            await qs.values_list("author", flat=True), [first.pk, second.pk]
+        )
+        rows = await qs.values_list("author", "title", named=True)
+        self.assertEqual(rows[0].author, first.pk)
+        self.assertEqual(
+            await qs.values("author_id"),
+            [{"author_id": first.pk}, {"author_id": second.pk}],
+        )
+
+    async def test_update(self) -> None:
+        first, second = await self._create_books()
+        manager: Any = self.Book.objects
+        updated = await manager.filter(author=first, title__in=["T1", "T2"]).update(
+            title="X"
+        )
+        self.assertEqual(updated, 2)
+        self.assertEqual(await manager.filter(title="X").count(), 2)
+        self.assertEqual(await manager.update(author=second), 4)
+        self.assertEqual(await manager.filter(author=second).count(), 4)
+        self.assertEqual(await manager.filter(title="Z").update(title="X"), 0)
+        self.assertEqual(await manager.update(), 0)
+
+    async def test_delete(self) -> None:
+        first, _ = await self._create_books()
+        manager: Any = self.Book.objects
+        self.assertEqual(await manager.filter(author=first).delete(), 3)
+        self.assertEqual(await manager.values_list("title", flat=True), ["T4"])
+        self.assertEqual(await manager.filter(title="T1").delete(), 0)
+        self.assertEqual(await manager.all().delete(), 1)
+        self.assertFalse(await manager.exists())
+
+    async def test_update_delete_sliced_or_annotated(self) -> None:
+        qs: Any = self.Book.objects.order_by("title")
+        with self.assertRaises(TypeError):
+            await qs[:2].update(title="X")
+        with self.assertRaises(TypeError):
+            await qs[1:].delete()
+        with self.assertRaises(TypeError):
+            await qs.annotate(n=django_models.Count("id")).delete()
+
+    async def test_update_delete_invalidate_result_cache(self) -> None:
+        await self._create_books()
+        manager: Any = self.Book.objects
+        manager.enable_cache()
+        try:
+            self.assertEqual(await manager.filter(title="T1").count(), 1)
+            await manager.filter(title="T1").update(title="X")
+            self.assertEqual(await manager.filter(title="T1").count(), 0)
+            self.assertEqual(await manager.count(), 4)
+            await manager.filter(title="X").delete()
+            self.assertEqual(await manager.count(), 3)
+        finally:
+            manager.disable_cache()
+
+    async def test_result_cache_related_models(self) -> None:
+        first, _ = await self._create_books()
+        authors: Any = self.Author.objects
+        books: Any = self.Book.objects
+        authors.enable_cache()
+        books.enable_cache()
+        try:
+            count = authors.annotate(n=django_models.Count("book")).order_by("name")
+            titles = books.select_related("author").filter(author__name="A")
+            self.assertEqual([row.n for row in await count], [3, 1, 0])
+            self.assertEqual(len(await titles), 3)
+            # Written through the other model's manager
+            await books.create(author=first, title="T5")
+            self.assertEqual([row.n for row in await count], [4, 1, 0])
+            self.assertEqual(len(await titles), 4)
+
+            self.assertEqual(await books.count(), 5)
+            # Deleted by the database (on_delete=CASCADE)
+            await authors.filter(name="A").delete()
+            self.assertEqual(await books.count(), 1)
+        finally:
+            authors.disable_cache()
+            books.disable_cache()
+
+    async def test_reads_other_models(self) -> None:
+        authors: Any = self.Author.objects
+        books: Any = self.Book.objects
+        for qs in (
+            authors.annotate(n=django_models.Count("book")),
+            authors.annotate(
+                n=django_models.Count("id", filter=django_models.Q(book__id=1))
+            ),
+            books.filter(author__name="A"),
+            books.order_by("-author__name"),
+            books.values("title", "author__name"),
+            books.select_related("author"),
+            authors.prefetch_related("book_set"),
+        ):
+            self.assertTrue(qs._reads_other_models(), qs)
+        for qs in (
+            authors.annotate(n=django_models.Count("id")),
+            books.filter(author=1, title="T1"),
+            books.order_by("-author", "title"),
+            books.values("author", "title"),
+        ):
+            self.assertFalse(qs._reads_other_models(), qs)
+
+    async def _create_books(self) -> tuple[Any, Any]:
+        first = await self.Author.objects.create(name="A")  # type: ignore[misc]
+        second = await self.Author.objects.create(name="B")  # type: ignore[misc]
+        await self.Author.objects.create(name="C")  # type: ignore[misc]
+        manager: Any = self.Book.objects
+        for title in ("T1", "T2", "T3"):
+            await manager.create(author=first, title=title)
+        await self.Book.objects.create(author=second, title="T4")  # type: ignore[misc]
+        return first, second
+
+    async def test_aggregate(self) -> None:
+        first, _ = await self._create_books()
+        manager: Any = self.Book.objects
+        result = await manager.aggregate(
+            django_models.Count("id"),
+            authors=django_models.Count("author", distinct=True),
+            last=django_models.Max("title"),
+            second=django_models.Min("title", filter=~django_models.Q(title="T1")),
+        )
+        self.assertEqual(
+            result, {"id__count": 4, "authors": 2, "last": "T4", "second": "T2"}
+        )
+        self.assertEqual(
+            await manager.filter(author=first).aggregate(n=django_models.Count("*")),
+            {"n": 3},
+        )
+        self.assertEqual(
+            await manager.filter(title="X").aggregate(last=django_models.Max("title")),
+            {"last": None},
+        )
+        self.assertEqual(await manager.aggregate(), {})
+
+    async def test_aggregate_reverse_relation(self) -> None:
+        await self._create_books()
+        manager: Any = self.Author.objects
+        # A single row over the join, not one per author
+        result = await manager.aggregate(
+            books=django_models.Count("book"), total=django_models.Sum("book__id")
+        )
+        self.assertEqual(result, {"books": 4, "total": 10})
+
+    async def test_aggregate_errors(self) -> None:
+        manager: Any = self.Book.objects
+        with self.assertRaises(TypeError):
+            await manager.all()[:2].aggregate(django_models.Count("id"))
+        with self.assertRaises(TypeError):
+            await manager.annotate(n=django_models.Count("id")).aggregate(
+                django_models.Count("id")
+            )
+        with self.assertRaises(TypeError):
+            await manager.aggregate(django_models.F("id"))
+        with self.assertRaises(TypeError):
+            await manager.aggregate(django_models.Count("id") + 1)
+
+    async def test_annotate_reverse_relation(self) -> None:
+        await self._create_books()
+        qs: Any = self.Author.objects.annotate(
+            django_models.Count("book"), longest=django_models.Max("book__title")
+        ).order_by("name")
+        authors = await qs
+        self.assertEqual(
+            [(a.name, a.book__count, a.longest) for a in authors],
+            [("A", 3, "T3"), ("B", 1, "T4"), ("C", 0, None)],
+        )
+        self.assertEqual(
+            await qs.values("name", "book__count"),
+            [
+                {"name": "A", "book__count": 3},
+                {"name": "B", "book__count": 1},
+                {"name": "C", "book__count": 0},
+            ],
+        )
+        # Filtering on an annotation filters the groups
+        self.assertEqual(
+            await qs.filter(book__count__gt=0).values_list("name", flat=True),
+            ["A", "B"],
+        )
+        self.assertEqual(await qs.filter(book__count__gt=0).count(), 2)
+        with self.assertRaises(ValueError):
+            qs.annotate(longest=django_models.Min("book__title"))
+
+    async def test_annotate_result_cache_key(self) -> None:
+        await self._create_books()
+        manager: Any = self.Author.objects
+        manager.enable_cache()
+        try:
+            count = await manager.annotate(n=django_models.Count("book")).values("n")
+            longest = await manager.annotate(n=django_models.Max("book__id")).values(
+                "n"
+            )
+        finally:
+            manager.disable_cache()
+        self.assertEqual([row["n"] for row in count], [3, 1, 0])
+        self.assertEqual([row["n"] for row in longest], [3, 4, None])
+
+
+class TestUpserts(unittest.IsolatedAsyncioTestCase):
+    Counter: type[django_models.Model]
+
+    async def asyncSetUp(self) -> None:
+        class Counter(django_models.Model):
+            name: django_models.CharField = django_models.CharField(max_length=100)
+            value: django_models.IntegerField = django_models.IntegerField(default=0)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.Counter = Counter
+        patch_model(Counter)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def test_get_or_create(self) -> None:
+        manager: Any = self.Counter.objects
+        obj, created = await manager.get_or_create(name="A", defaults={"value": 1})
+        self.assertTrue(created)
+        self.assertEqual((obj.name, obj.value), ("A", 1))
+
+        same, created = await manager.get_or_create(name="A", defaults={"value": 2})
+        self.assertFalse(created)
+        self.assertEqual((same.pk, same.value), (obj.pk, 1))
+
+        # Lookups are not set on the new object
+        other, created = await manager.get_or_create(
+            name__iexact="b", defaults={"name": "B", "value": lambda: 3}
+        )
+        self.assertTrue(created)
+        self.assertEqual((other.name, other.value), ("B", 3))
+
+        await manager.create(name="B")
+        with self.assertRaises(MultipleObjectsReturned):
+            await manager.get_or_create(name="B")
+
+    async def test_get_or_create_race(self) -> None:
+        manager: Any = self.Counter.objects
+        existing = await manager.create(name="A")
+        found = await manager.get(pk=existing.pk)
+        # A concurrent request inserts the row between the SELECT and INSERT
+        with patch.object(
+            TortoiseQuerySet,
+            "get",
+            side_effect=[DoesNotExist(manager.tortoise_model), found],
+        ):
+            obj, created = await manager.get_or_create(
+                id=existing.pk, defaults={"name": "A"}
+            )
+        self.assertFalse(created)
+        self.assertEqual(obj.pk, existing.pk)
+        self.assertEqual(await manager.count(), 1)
+
+    async def test_update_or_create(self) -> None:
+        manager: Any = self.Counter.objects
+        obj, created = await manager.update_or_create(name="A", defaults={"value": 1})
+        self.assertTrue(created)
+        self.assertEqual(obj.value, 1)
+
+        obj, created = await manager.update_or_create(name="A", defaults={"value": 5})
+        self.assertFalse(created)
+        self.assertEqual(obj.value, 5)
+
+        obj, created = await manager.update_or_create(
+            name="A", defaults={"value": django_models.F("value") + 1}
+        )
+        self.assertFalse(created)
+        self.assertEqual(obj.value, 6)
+
+        obj, created = await manager.update_or_create(
+            name="B", defaults={"value": 1}, create_defaults={"value": 10}
+        )
+        self.assertTrue(created)
+        self.assertEqual(obj.value, 10)
+        values = await manager.order_by("name").values_list("name", "value")
+        self.assertEqual(values, [("A", 6), ("B", 10)])
+
+    async def test_update_or_create_rolls_back(self) -> None:
+        manager: Any = self.Counter.objects
+        await manager.create(name="A")
+        await manager.create(name="A")
+        with self.assertRaises(MultipleObjectsReturned):
+            await manager.update_or_create(name="A", defaults={"value": 1})
+        self.assertEqual(await manager.filter(value=1).count(), 0)
+
+    async def test_bulk_create_update_conflicts(self) -> None:
+        manager: Any = self.Counter.objects
+        first = await manager.create(name="A", value=1)
+        model = manager.tortoise_model
+        await manager.bulk_create(
+            [model(id=first.pk, name="X", value=2), model(name="B", value=3)],
+            update_conflicts=True,
+            update_fields=["value"],
+            unique_fields=["pk"],
+        )
+        values = await manager.order_by("name").values_list("name", "value")
+        self.assertEqual(values, [("A", 2), ("B", 3)])
+
+    async def test_bulk_create_update_conflicts_arguments(self) -> None:
+        manager: Any = self.Counter.objects
+        objs = [manager.tortoise_model(name="A")]
+        with self.assertRaises(ValueError):
+            await manager.bulk_create(
+                objs, ignore_conflicts=True, update_conflicts=True
+            )
+        with self.assertRaises(ValueError):
+            await manager.bulk_create(objs, update_conflicts=True, unique_fields=["id"])
+        with self.assertRaises(ValueError):
+            await manager.bulk_create(
+                objs, update_conflicts=True, update_fields=["value"]
+            )
+        with self.assertRaises(ValueError):
+            await manager.bulk_create(
+                objs,
+                update_conflicts=True,
+                update_fields=["missing"],
+                unique_fields=["id"],
+            )
+
+
+class TestLazyTranslation(unittest.IsolatedAsyncioTestCase):
+    LazyAuthor: type[django_models.Model]
+    LazyBook: type[django_models.Model]
+
+    async def asyncSetUp(self) -> None:
+        class LazyAuthor(django_models.Model):
+            name: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        class LazyBook(django_models.Model):
+            author: django_models.ForeignKey = django_models.ForeignKey(
+                LazyAuthor, on_delete=django_models.CASCADE
+            )
+            title: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.LazyAuthor = LazyAuthor
+        self.LazyBook = LazyBook
+        install_lazy_manager(LazyAuthor)
+        install_lazy_manager(LazyBook)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    def get_app_configs(self) -> list[Any]:
+        return [
+            MagicMock(label="authors", get_models=lambda: [self.LazyAuthor]),
+            MagicMock(label="books", get_models=lambda: [self.LazyBook]),
+        ]
+
+    async def test_translated_on_first_access(self) -> None:
+        self.assertIsInstance(self.LazyBook.__dict__["objects"], LazyTortoiseManager)
+
+        manager = self.LazyBook.objects
+        self.assertIsInstance(manager, TortoiseManager)
+        # The descriptor is replaced, related models are translated too
+        self.assertIs(self.LazyBook.__dict__["objects"], manager)
+        self.assertIsInstance(self.LazyAuthor.__dict__["objects"], TortoiseManager)
+
+        # Registered in the already initialized Tortoise
+        await Tortoise.generate_schemas()
+        author = await self.LazyAuthor.objects.create(name="A")  # type: ignore[misc]
+        book_manager: Any = self.LazyBook.objects
+        await book_manager.create(author=author, title="T")
+        qs: Any = self.LazyBook.objects.values_list("author__name", flat=True)
+        self.assertEqual(await qs, ["A"])
+        books = await self.LazyAuthor.objects.prefetch_related(  # type: ignore[misc]
+            "lazybook_set"
+        ).first()
+        self.assertEqual(len(books.lazybook_set), 1)
+
+    async def test_install_is_idempotent(self) -> None:
+        manager = self.LazyAuthor.objects
+        install_lazy_manager(self.LazyAuthor)
+        self.assertIs(self.LazyAuthor.objects, manager)
+
+    async def test_untranslatable_model_keeps_its_manager(self) -> None:
+        original = self.LazyAuthor.__dict__["objects"].original
+        with patch(
+            "django_tortoise_adapter.core.TortoiseTranslator.translate_model",
+            side_effect=ValueError,
+        ):
+            _ = self.LazyAuthor.objects
+        self.assertIs(self.LazyAuthor.__dict__["objects"], original)
+
+    async def test_get_models_to_translate(self) -> None:
+        with patch(
+            "django_tortoise_adapter.core.django_apps.get_app_configs",
+            side_effect=self.get_app_configs,
+        ):
+            self.assertEqual(
+                get_models_to_translate(), [self.LazyAuthor, self.LazyBook]
+            )
+            self.assertEqual(
+                get_models_to_translate(apps=["authors"]), [self.LazyAuthor]
+            )
+            # Related models are kept so that the relations can be resolved
+            self.assertEqual(
+                get_models_to_translate(exclude_apps=["authors"]),
+                [self.LazyBook, self.LazyAuthor],
+            )
+            with patch.object(
+                settings, "TORTOISE_ADAPTER_EXCLUDE_APPS", ["books"], create=True
+            ):
+                self.assertEqual(get_models_to_translate(), [self.LazyAuthor])
+
+    async def test_patch_models(self) -> None:
+        with (
+            patch(
+                "django_tortoise_adapter.core.django_apps.get_app_configs",
+                side_effect=self.get_app_configs,
+            ),
+            patch("django_tortoise_adapter.core.patch_model") as mock_patch,
+        ):
+            patch_models(apps=["authors"])
+        mock_patch.assert_called_once_with(self.LazyAuthor)
+
+    def test_activate_lazy_requires_no_schema_generation(self) -> None:
+        with self.assertRaises(ValueError):
+            activate([], lazy=True)
@@ -0,0 +1,182 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+from typing import Any
+
+from django.db import models as django_models
+from tortoise import Tortoise
+from tortoise import functions as tortoise_functions
+from tortoise.expressions import CombinedExpression as TortoiseCombinedExpression
+from tortoise.expressions import Connector
+from tortoise.expressions import F as TortoiseF
+
+from django_tortoise_adapter.core import patch_model
+from django_tortoise_adapter.expressions import (
+    get_aggregates,
+    to_insert_value,
+    to_tortoise_aggregate,
+    to_tortoise_expression,
+    to_tortoise_lookup,
+    to_tortoise_q,
+)
+
+
+class TestExpressions(unittest.IsolatedAsyncioTestCase):
+    Poll: Any
+    Vote: Any
+    votes: Any
+
+    async def asyncSetUp(self) -> None:
+        class Poll(django_models.Model):
+            title: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        class Vote(django_models.Model):
+            poll: django_models.ForeignKey = django_models.ForeignKey(
+                Poll, on_delete=django_models.CASCADE
+            )
+            score: django_models.IntegerField = django_models.IntegerField()
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.Poll = patch_model(Poll).tortoise_model  # type: ignore[union-attr]
+        self.votes = patch_model(Vote)
+        self.Vote = self.votes.tortoise_model
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    def test_to_tortoise_lookup(self) -> None:
+        self.assertEqual(to_tortoise_lookup(self.Poll, "vote"), "vote_set")
+        self.assertEqual(
+            to_tortoise_lookup(self.Poll, "vote__score__gt"), "vote_set__score__gt"
+        )
+        self.assertEqual(
+            to_tortoise_lookup(self.Vote, "poll__vote__score"),
+            "poll__vote_set__score",
+        )
+        self.assertEqual(to_tortoise_lookup(self.Vote, "pk__in"), "pk__in")
+        self.assertEqual(to_tortoise_lookup(self.Vote, "poll"), "poll")
+        self.assertEqual(to_tortoise_lookup(self.Vote, "poll", column=True), "poll_id")
+
+    def test_to_tortoise_q(self) -> None:
+        q = to_tortoise_q(
+            self.Poll,
+            django_models.Q(title="A")
+            | ~django_models.Q(vote__score__gte=3, title__startswith="B"),
+        )
+        self.assertEqual(q.join_type, "OR")
+        self.assertFalse(q._is_negated)
+        self.assertEqual(q.children[0].filters, {"title": "A"})
+        negated = q.children[1]
+        self.assertTrue(negated._is_negated)
+        self.assertEqual(
+            [child.filters for child in negated.children],
+            # Django sorts the keyword arguments of Q
+            [{"title__startswith": "B"}, {"vote_set__score__gte": 3}],
+        )
+
+    def test_to_tortoise_aggregate(self) -> None:
+        count = to_tortoise_aggregate(
+            self.Poll, django_models.Count("vote", distinct=True)
+        )
+        self.assertIsInstance(count, tortoise_functions.Count)
+        self.assertEqual(count.field, "vote_set")
+        self.assertTrue(count.distinct)
+
+        star = to_tortoise_aggregate(self.Vote, django_models.Count("*"))
+        self.assertEqual(star.field, "id")
+
+        total = to_tortoise_aggregate(self.Vote, django_models.Sum("score", default=0))
+        self.assertIsInstance(total, tortoise_functions.Coalesce)
+
+        with self.assertRaises(TypeError):
+            to_tortoise_aggregate(self.Vote, django_models.StdDev("score"))
+        with self.assertRaises(TypeError):
+            to_tortoise_aggregate(
+                self.Vote, django_models.Sum(django_models.F("score") * 2)
+            )
+
+    def test_to_tortoise_expression(self) -> None:
+        self.assertEqual(to_tortoise_expression(self.Vote, 3), 3)
+        self.assertEqual(to_tortoise_expression(self.Vote, django_models.Value(3)), 3)
+        f = to_tortoise_expression(self.Vote, django_models.F("poll"))
+        self.assertIsInstance(f, TortoiseF)
+        self.assertEqual(f.name, "poll_id")
+        combined = to_tortoise_expression(self.Vote, 10 - django_models.F("score") * 2)
+        self.assertIsInstance(combined, TortoiseCombinedExpression)
+        self.assertEqual(combined.connector, Connector.sub)
+        self.assertEqual(combined.right.connector, Connector.mul)
+
+        with self.assertRaises(TypeError):
+            to_tortoise_expression(self.Vote, django_models.F("poll__title"))
+        with self.assertRaises(TypeError):
+            to_tortoise_expression(self.Vote, django_models.F("score").bitand(1))
+        with self.assertRaises(TypeError):
+            to_tortoise_expression(self.Vote, django_models.Count("score"))
+
+    def test_to_insert_value(self) -> None:
+        self.assertEqual(to_insert_value(3), 3)
+        self.assertEqual(to_insert_value(django_models.Value(3)), 3)
+        with self.assertRaises(ValueError):
+            to_insert_value(django_models.F("score") + 1)
+
+    async def test_update_with_f(self) -> None:
+        poll = await self.Poll.create(title="A")
+        vote = await self.votes.create(poll=poll, score=1)
+        other = await self.votes.create(poll=poll, score=5)
+
+        updated = await self.votes.filter(pk=vote.pk).update(
+            score=django_models.F("score") + 1
+        )
+        self.assertEqual(updated, 1)
+        await self.votes.update(score=django_models.F("score") * 10 % 7)
+        scores = await self.votes.order_by("id").values_list("score", flat=True)
+        self.assertEqual(scores, [6, 1])
+
+        self.assertEqual(
+            await self.votes.filter(score__gt=django_models.F("poll")).count(), 1
+        )
+        self.assertEqual(
+            (await self.votes.get(score=django_models.F("poll"))).pk, other.pk
+        )
+
+    async def test_create_with_expressions(self) -> None:
+        poll = await self.Poll.create(title="A")
+        vote = await self.votes.create(poll=poll, score=django_models.Value(2))
+        self.assertEqual(vote.score, 2)
+        with self.assertRaises(ValueError):
+            await self.votes.create(poll=poll, score=django_models.F("id"))
+
+    def test_get_aggregates(self) -> None:
+        count = django_models.Count("vote")
+        average = django_models.Avg("vote__score")
+        self.assertEqual(
+            get_aggregates((count,), {"average": average}),
+            {"vote__count": count, "average": average},
+        )
+        with self.assertRaises(TypeError):
+            get_aggregates((django_models.Count("vote") + 1,), {})
+        with self.assertRaises(ValueError):
+            get_aggregates((count,), {"vote__count": average})
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+import unittest
+
+import django_tortoise_adapter
+
+
+class TestPackage(unittest.TestCase):
+    def test_import_does_not_import_tortoise(self) -> None:
+        code = (
+            "import sys, django_tortoise_adapter; " "print('tortoise' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_exports(self) -> None:
+        from django_tortoise_adapter.core import TortoiseManager
+
+        self.assertIs(django_tortoise_adapter.TortoiseManager, TortoiseManager)
+        for name in django_tortoise_adapter.__all__:
+            self.assertTrue(callable(getattr(django_tortoise_adapter, name)))
+
+    def test_unknown_attribute(self) -> None:
+        with self.assertRaises(AttributeError):
+            _ = django_tortoise_adapter.unknown  # type: ignore[attr-defined]
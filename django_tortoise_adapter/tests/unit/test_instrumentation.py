@@ -0,0 +1,231 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+from django.db import models as django_models
+from tortoise import Tortoise
+from tortoise.exceptions import OperationalError
+
+from django_tortoise_adapter.asgi import TortoiseASGIWrapper
+from django_tortoise_adapter.core import patch_model
+from django_tortoise_adapter.instrumentation import (
+    QUERY_STATS_SCOPE_KEY,
+    QueryEvent,
+    add_query_listener,
+    disable_slow_query_log,
+    enable_slow_query_log,
+    get_query_stats,
+    instrument,
+    remove_query_listener,
+    track_queries,
+)
+
+
+class TestInstrumentation(unittest.IsolatedAsyncioTestCase):
+    Measured: type[django_models.Model]
+
+    async def asyncSetUp(self) -> None:
+        class Measured(django_models.Model):
+            text: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.Measured = Measured
+        patch_model(Measured)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+
+        self.events: list[QueryEvent] = []
+        add_query_listener(self.events.append)
+
+    async def asyncTearDown(self) -> None:
+        remove_query_listener(self.events.append)
+        disable_slow_query_log()
+        await Tortoise.close_connections()
+
+    async def test_events(self) -> None:
+        manager: Any = self.Measured.objects
+        await manager.create(text="A")
+        await manager.bulk_create([manager.tortoise_model(text="B")])
+        self.assertEqual(await manager.filter(text="A").count(), 1)
+        self.assertEqual(len(await manager.all()), 2)
+
+        operations = [event.operation for event in self.events]
+        self.assertEqual(operations, ["create", "bulk_create", "count", "fetch"])
+        for event in self.events:
+            self.assertIs(event.model, manager.tortoise_model)
+            self.assertEqual(event.connection, "default")
+            self.assertGreaterEqual(event.duration, 0)
+
+        create, bulk_create, count, fetch = self.events
+        self.assertEqual(create.rows, 1)
+        self.assertIsNone(create.sql)
+        self.assertEqual(bulk_create.rows, 1)
+        self.assertIn("INSERT", bulk_create.sql or "")
+        self.assertIsNone(count.rows)
+        self.assertIn("COUNT", count.sql or "")
+        self.assertEqual(count.params_shape, ("str",))
+        self.assertEqual(fetch.rows, 2)
+        self.assertIn('FROM "unit_tests_measured"', fetch.sql or "")
+        self.assertEqual(fetch.params_shape, ())
+
+    async def test_values_and_exists(self) -> None:
+        manager: Any = self.Measured.objects
+        await manager.values_list("text", flat=True)
+        await manager.all()[1:3].exists()
+        values, exists = self.events
+        self.assertIn('"text"', values.sql or "")
+        self.assertIn("LIMIT", exists.sql or "")
+
+    async def test_update_and_delete(self) -> None:
+        manager: Any = self.Measured.objects
+        await manager.bulk_create([manager.tortoise_model(text=t) for t in "AB"])
+        await manager.filter(text="A").update(text="C")
+        await manager.all().delete()
+        _, update, delete = self.events
+        self.assertEqual((update.operation, update.rows), ("update", 1))
+        self.assertIn("UPDATE", update.sql or "")
+        self.assertEqual((delete.operation, delete.rows), ("delete", 2))
+        self.assertIn("DELETE", delete.sql or "")
+
+    async def test_result_cache_hits_are_not_queries(self) -> None:
+        manager: Any = self.Measured.objects
+        manager.enable_cache()
+        await manager.count()
+        await manager.count()
+        self.assertEqual(len(self.events), 1)
+
+    async def test_track_queries(self) -> None:
+        manager: Any = self.Measured.objects
+        self.assertIsNone(get_query_stats())
+        with track_queries() as stats:
+            self.assertIs(get_query_stats(), stats)
+            await manager.create(text="A")
+            await manager.first()
+        self.assertEqual(stats.count, 2)
+        self.assertGreater(stats.duration, 0)
+        self.assertIsNone(get_query_stats())
+
+    async def test_disabled(self) -> None:
+        remove_query_listener(self.events.append)
+
+        async def query() -> list[int]:
+            return [1]
+
+        with patch("django_tortoise_adapter.instrumentation.time") as mock_time:
+            self.assertEqual(await instrument(query(), object, "fetch"), [1])
+        mock_time.perf_counter.assert_not_called()
+
+    async def test_failed_queries(self) -> None:
+        manager: Any = self.Measured.objects
+        await Tortoise.get_connection("default").execute_script(
+            'DROP TABLE "unit_tests_measured"'
+        )
+        enable_slow_query_log(0)
+        with (
+            track_queries() as stats,
+            self.assertLogs(
+                "django_tortoise_adapter.instrumentation", "WARNING"
+            ) as logs,
+            self.assertRaises(OperationalError),
+        ):
+            await manager.count()
+        (event,) = self.events
+        self.assertEqual(event.operation, "count")
+        self.assertIsInstance(event.exception, OperationalError)
+        self.assertIsNone(event.rows)
+        self.assertEqual(stats.count, 1)
+        self.assertIn("Measured.count failed with OperationalError", logs.output[0])
+
+    async def test_cancelled_queries(self) -> None:
+        async def query() -> list[int]:
+            await asyncio.sleep(1)
+            return [1]
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(instrument(query(), object, "fetch"), 0.01)
+        (event,) = self.events
+        self.assertIsInstance(event.exception, asyncio.CancelledError)
+        self.assertGreater(event.duration, 0)
+
+    async def test_failing_listener(self) -> None:
+        def fail(event: QueryEvent) -> None:
+            raise ValueError("boom")
+
+        add_query_listener(fail)
+        try:
+            with self.assertLogs("django_tortoise_adapter.instrumentation", "ERROR"):
+                await self.Measured.objects.count()  # type: ignore[misc]
+        finally:
+            remove_query_listener(fail)
+        self.assertEqual(len(self.events), 1)
+
+    async def test_slow_query_log(self) -> None:
+        enable_slow_query_log(0)
+        with self.assertLogs(
+            "django_tortoise_adapter.instrumentation", "WARNING"
+        ) as logs:
+            await self.Measured.objects.count()  # type: ignore[misc]
+        self.assertIn("Measured.count", logs.output[0])
+        self.assertIn("COUNT", logs.output[0])
+
+        disable_slow_query_log()
+        enable_slow_query_log(3600)
+        with self.assertNoLogs("django_tortoise_adapter.instrumentation"):
+            await self.Measured.objects.count()  # type: ignore[misc]
+
+
+class TestASGIQueryStats(unittest.IsolatedAsyncioTestCase):
+    async def test_headers_and_scope(self) -> None:
+        scopes: list[dict[str, Any]] = []
+        sent: list[dict[str, Any]] = []
+
+        async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+            scopes.append(scope)
+            stats = scope[QUERY_STATS_SCOPE_KEY]
+            self.assertIs(get_query_stats(), stats)
+            stats.count = 3
+            await send({"type": "http.response.start", "status": 200})
+
+        async def send(message: dict[str, Any]) -> None:
+            sent.append(message)
+
+        wrapper = TortoiseASGIWrapper(app)
+        with patch.object(settings, "TORTOISE_ADAPTER_QUERY_STATS", True, create=True):
+            await wrapper({"type": "http"}, None, send)
+
+        self.assertIn(QUERY_STATS_SCOPE_KEY, scopes[0])
+        headers = dict(sent[0]["headers"])
+        self.assertEqual(headers[b"x-tortoise-query-count"], b"3")
+        self.assertIn(b"x-tortoise-query-time", headers)
+
+    async def test_disabled(self) -> None:
+        scopes: list[dict[str, Any]] = []
+
+        async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+            scopes.append(scope)
+            self.assertIsNone(get_query_stats())
+
+        scope = {"type": "http"}
+        await TortoiseASGIWrapper(app)(scope, None, None)
+        self.assertIs(scopes[0], scope)
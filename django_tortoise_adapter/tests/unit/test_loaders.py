@@ -0,0 +1,161 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+from django.db import models as django_models
+from tortoise import Tortoise
+from tortoise.exceptions import DoesNotExist
+
+from django_tortoise_adapter.asgi import TortoiseASGIWrapper
+from django_tortoise_adapter.core import patch_model
+from django_tortoise_adapter.instrumentation import (
+    QueryEvent,
+    add_query_listener,
+    remove_query_listener,
+)
+from django_tortoise_adapter.loaders import get_dataloader, use_dataloader
+from django_tortoise_adapter.transactions import atomic
+
+
+class TestDataLoader(unittest.IsolatedAsyncioTestCase):
+    manager: Any
+
+    async def asyncSetUp(self) -> None:
+        class Loaded(django_models.Model):
+            text: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.manager = patch_model(Loaded)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+        self.objs = [await self.manager.create(text=text) for text in "ABC"]
+
+        self.events: list[QueryEvent] = []
+        add_query_listener(self.events.append)
+
+    async def asyncTearDown(self) -> None:
+        remove_query_listener(self.events.append)
+        await Tortoise.close_connections()
+
+    def operations(self) -> list[str]:
+        return [event.operation for event in self.events]
+
+    async def test_coalesces_concurrent_lookups(self) -> None:
+        first, second, third = self.objs
+        with use_dataloader():
+            results = await asyncio.gather(
+                self.manager.get(pk=first.pk),
+                self.manager.get(id=second.pk),
+                self.manager.all().get(pk__exact=str(third.pk)),
+                self.manager.get(pk=first.pk),
+            )
+        self.assertEqual([obj.text for obj in results], ["A", "B", "C", "A"])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(self.operations(), ["load"])
+        self.assertIn(" IN (", self.events[0].sql or "")
+
+    async def test_identity_map(self) -> None:
+        first = self.objs[0]
+        with use_dataloader():
+            obj = await self.manager.get(pk=first.pk)
+            self.assertIs(await self.manager.get(pk=first.pk), obj)
+            self.assertEqual(self.operations(), ["load"])
+
+            # Writes drop the loaded objects of the model
+            await self.manager.filter(pk=first.pk).update(text="Z")
+            self.assertEqual((await self.manager.get(pk=first.pk)).text, "Z")
+            self.assertEqual(self.operations(), ["load", "update", "load"])
+
+    async def test_missing(self) -> None:
+        with use_dataloader():
+            results = await asyncio.gather(
+                self.manager.get(pk=self.objs[0].pk),
+                self.manager.get(pk=0),
+                return_exceptions=True,
+            )
+            self.assertEqual(results[0].text, "A")  # type: ignore[union-attr]
+            self.assertIsInstance(results[1], DoesNotExist)
+            with self.assertRaises(DoesNotExist):
+                await self.manager.get(pk=0)
+        self.assertEqual(self.operations(), ["load"])
+
+    async def test_other_lookups_are_not_batched(self) -> None:
+        first = self.objs[0]
+        with use_dataloader():
+            await asyncio.gather(
+                self.manager.get(text="A"),
+                self.manager.filter(text="A").get(pk=first.pk),
+                self.manager.values().get(pk=first.pk),
+                self.manager.using("default").get(pk=first.pk),
+            )
+            async with atomic():
+                await self.manager.get(pk=first.pk)
+        self.assertEqual(self.operations(), ["fetch"] * 5)
+
+    async def test_disabled(self) -> None:
+        self.assertIsNone(get_dataloader())
+        await asyncio.gather(*(self.manager.get(pk=obj.pk) for obj in self.objs))
+        self.assertEqual(self.operations(), ["fetch"] * 3)
+
+    async def test_failed_batch(self) -> None:
+        with (
+            use_dataloader(),
+            patch(
+                "django_tortoise_adapter.loaders.instrument",
+                side_effect=RuntimeError("down"),
+            ),
+        ):
+            results = await asyncio.gather(
+                self.manager.get(pk=self.objs[0].pk),
+                self.manager.get(pk=self.objs[1].pk),
+                return_exceptions=True,
+            )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    async def test_cancelled_waiter(self) -> None:
+        pk = self.objs[0].pk
+        with use_dataloader():
+            cancelled = asyncio.ensure_future(self.manager.get(pk=pk))
+            other = asyncio.ensure_future(self.manager.get(pk=pk))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            self.assertEqual((await other).text, "A")
+        self.assertTrue(cancelled.cancelled())
+
+    async def test_asgi(self) -> None:
+        loaders: list[Any] = []
+
+        async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+            loaders.append(get_dataloader())
+
+        wrapper = TortoiseASGIWrapper(app)
+        await wrapper({"type": "http"}, None, None)
+        with patch.object(settings, "TORTOISE_ADAPTER_DATALOADER", True, create=True):
+            await wrapper({"type": "http"}, None, None)
+            await wrapper({"type": "http"}, None, None)
+            await wrapper({"type": "websocket"}, None, None)
+        self.assertIsNone(loaders[0])
+        self.assertIsNotNone(loaders[1])
+        self.assertIsNot(loaders[1], loaders[2])
+        self.assertIsNone(loaders[3])
@@ -0,0 +1,170 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+from typing import Any
+from unittest.mock import patch
+
+from django.db import models as django_models
+from tortoise import Tortoise, connections
+
+from django_tortoise_adapter.core import patch_model
+from django_tortoise_adapter.routers import (
+    db_for_read,
+    db_for_write,
+    mark_written,
+    sticky_after_write,
+)
+from django_tortoise_adapter.transactions import atomic
+
+ROUTERS = ["django_tortoise_adapter.routers.PrimaryReplicaRouter"]
+
+
+def replica_settings() -> Any:
+    return patch.multiple(
+        settings,
+        TORTOISE_ADAPTER_ROUTERS=ROUTERS,
+        TORTOISE_ADAPTER_REPLICAS=["replica"],
+        create=True,
+    )
+
+
+class TestRouting(unittest.TestCase):
+    def test_default(self) -> None:
+        self.assertEqual(db_for_read(None), "default")
+        self.assertEqual(db_for_write(None), "default")
+
+    def test_primary_replica_router(self) -> None:
+        with replica_settings():
+            self.assertEqual(db_for_read(None), "replica")
+            self.assertEqual(db_for_write(None), "default")
+
+    def test_sticky_after_write(self) -> None:
+        with replica_settings():
+            # Outside of a sticky block writes are not tracked
+            mark_written()
+            self.assertEqual(db_for_read(None), "replica")
+
+            with sticky_after_write():
+                self.assertEqual(db_for_read(None), "replica")
+                with sticky_after_write():
+                    mark_written()
+                # Nested blocks share the state
+                self.assertEqual(db_for_read(None), "default")
+
+            self.assertEqual(db_for_read(None), "replica")
+
+
+class TestRoutedQueries(unittest.IsolatedAsyncioTestCase):
+    Routed: type[django_models.Model]
+
+    async def asyncSetUp(self) -> None:
+        class Routed(django_models.Model):
+            text: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.Routed = Routed
+        patch_model(Routed)
+
+        # Two independent databases, so reads show where they were routed
+        await Tortoise.init(
+            config={
+                "connections": {
+                    "default": "sqlite://:memory:",
+                    "replica": "sqlite://:memory:",
+                },
+                "apps": {
+                    "models": {
+                        "models": ["django_tortoise_adapter.models"],
+                        "default_connection": "default",
+                    }
+                },
+            }
+        )
+        await Tortoise.generate_schemas()
+        await connections.get("replica").execute_script(
+            'CREATE TABLE "unit_tests_routed" '
+            '("id" INTEGER PRIMARY KEY AUTOINCREMENT, "text" VARCHAR(100))'
+        )
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def test_reads_go_to_replica(self) -> None:
+        manager: Any = self.Routed.objects
+        with replica_settings():
+            await manager.create(text="A")
+            self.assertEqual(await manager.count(), 0)
+            self.assertIsNone(await manager.first())
+            self.assertEqual(await manager.all(), [])
+            self.assertEqual(await manager.using("default").count(), 1)
+            texts = await manager.using("default").values_list("text", flat=True)
+            self.assertEqual(texts, ["A"])
+
+    async def test_result_cache(self) -> None:
+        manager: Any = self.Routed.objects
+        manager.enable_cache()
+        try:
+            await connections.get("replica").execute_script(
+                'INSERT INTO "unit_tests_routed" ("text") VALUES (\'A\')'
+            )
+            self.assertEqual(await manager.using("replica").count(), 1)
+            # Not served the result of the replica
+            self.assertEqual(await manager.count(), 0)
+            self.assertEqual(len(manager.result_cache), 1)
+            with replica_settings():
+                # Replicas may lag behind the writes: not cached
+                self.assertEqual(await manager.count(), 1)
+                self.assertEqual(len(manager.result_cache), 1)
+                with sticky_after_write():
+                    mark_written()
+                    self.assertEqual(await manager.count(), 0)
+        finally:
+            manager.disable_cache()
+
+    async def test_sticky_after_write(self) -> None:
+        manager: Any = self.Routed.objects
+        with replica_settings(), sticky_after_write():
+            self.assertFalse(await manager.exists())
+            await manager.bulk_create([manager.tortoise_model(text="A")])
+            self.assertTrue(await manager.exists())
+            self.assertEqual((await manager.get(text="A")).text, "A")
+
+    async def test_updates_go_to_primary(self) -> None:
+        manager: Any = self.Routed.objects
+        with replica_settings():
+            await manager.create(text="A")
+            self.assertEqual(await manager.filter(text="A").update(text="B"), 1)
+            self.assertEqual(await manager.all().delete(), 1)
+            self.assertEqual(await manager.using("replica").update(text="C"), 0)
+            self.assertFalse(await manager.using("default").exists())
+
+    async def test_reads_inside_atomic_go_to_primary(self) -> None:
+        manager: Any = self.Routed.objects
+        with replica_settings():
+            async with atomic():
+                await manager.create(text="A")
+                self.assertEqual(await manager.count(), 1)
+            self.assertEqual(await manager.count(), 0)
+            async with atomic(using="replica"):
+                # Not a transaction on the write database
+                self.assertEqual(await manager.count(), 0)
+
+    async def test_without_routers(self) -> None:
+        manager: Any = self.Routed.objects
+        await manager.create(text="A")
+        self.assertEqual(await manager.count(), 1)
+        self.assertEqual(await manager.using("replica").count(), 0)
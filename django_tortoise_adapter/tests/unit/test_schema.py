@@ -0,0 +1,160 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+from typing import Any
+from unittest.mock import patch
+
+from django.db import models as django_models
+from django.db.migrations.state import ModelState, ProjectState
+from tortoise import Tortoise, connections
+from tortoise.utils import generate_schema_for_client
+
+from django_tortoise_adapter.core import activate_async, patch_model
+from django_tortoise_adapter.schema import (
+    SCHEMA_TABLE,
+    check_schemas,
+    generate_schemas_if_changed,
+    get_schema_drift,
+)
+
+
+async def async_none(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+class TestSchema(unittest.IsolatedAsyncioTestCase):
+    manager: Any
+
+    async def asyncSetUp(self) -> None:
+        class Sheet(django_models.Model):
+            title: django_models.CharField = django_models.CharField(
+                max_length=100, db_index=True
+            )
+            rows: django_models.IntegerField = django_models.IntegerField(default=0)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.Sheet = Sheet
+        self.manager = patch_model(Sheet)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def test_generate_schemas_if_changed(self) -> None:
+        with patch(
+            "django_tortoise_adapter.schema.generate_schema_for_client",
+            wraps=generate_schema_for_client,
+        ) as mock_generate:
+            self.assertEqual(await generate_schemas_if_changed(), ["default"])
+            await self.manager.create(title="A")
+            self.assertEqual(mock_generate.call_count, 1)
+
+            # Warm start: the schema is unchanged
+            self.assertEqual(await generate_schemas_if_changed(), [])
+            self.assertEqual(mock_generate.call_count, 1)
+
+            # Changed schema: generated again, safely
+            connection = connections.get("default")
+            await connection.execute_query(
+                f"UPDATE {SCHEMA_TABLE} SET fingerprint = 'outdated'"
+            )
+            self.assertEqual(await generate_schemas_if_changed(), ["default"])
+            self.assertEqual(mock_generate.call_count, 2)
+            self.assertEqual(await self.manager.count(), 1)
+            _, rows = await connection.execute_query(f"SELECT * FROM {SCHEMA_TABLE}")
+            self.assertEqual(len(rows), 1)
+
+    async def test_generate_schemas_skips_replicas(self) -> None:
+        await Tortoise.close_connections()
+        await Tortoise.init(
+            config={
+                "connections": {
+                    "default": "sqlite://:memory:",
+                    "replica": "sqlite://:memory:",
+                },
+                "apps": {
+                    "models": {
+                        "models": ["django_tortoise_adapter.models"],
+                        "default_connection": "default",
+                    }
+                },
+            }
+        )
+        self.assertEqual(await generate_schemas_if_changed(), ["default"])
+        # The replica (possibly read-only) owns no models and isn't written
+        _, rows = await connections.get("replica").execute_query(
+            "SELECT name FROM sqlite_master"
+        )
+        self.assertEqual(rows, [])
+
+    def get_drift(self, state: ProjectState) -> list[str]:
+        return [
+            message
+            for message in get_schema_drift(state)
+            if "unit_tests_sheet" in message
+        ]
+
+    async def test_schema_drift(self) -> None:
+        state = ProjectState()
+        self.assertEqual(
+            self.get_drift(state),
+            ["Table unit_tests_sheet of Sheet is not in the migrations."],
+        )
+
+        state.add_model(ModelState.from_model(self.Sheet))
+        self.assertEqual(self.get_drift(state), [])
+
+        # A field added to the model without a migration
+        state.remove_model("unit_tests", "sheet")
+        model_state = ModelState.from_model(self.Sheet)
+        del model_state.fields["rows"]
+        state.add_model(model_state)
+        self.assertEqual(
+            self.get_drift(state),
+            ["Column unit_tests_sheet.rows of Sheet is not in the migrations."],
+        )
+        with self.assertLogs("django_tortoise_adapter.schema", "WARNING") as logs:
+            drift = check_schemas(state)
+        self.assertIn(
+            "Column unit_tests_sheet.rows of Sheet is not in the migrations.", drift
+        )
+        self.assertEqual(len(logs.records), len(drift))
+
+    async def test_activate_modes(self) -> None:
+        with (
+            patch("django_tortoise_adapter.core.patch_models"),
+            patch("django_tortoise_adapter.core.init_tortoise", side_effect=async_none),
+            patch(
+                "django_tortoise_adapter.core.generate_schemas_if_changed",
+                side_effect=async_none,
+            ) as mock_if_changed,
+            patch("django_tortoise_adapter.core.check_schemas") as mock_check,
+        ):
+            await activate_async([], generate_schemas="if_changed")
+            mock_if_changed.assert_called_once_with()
+            mock_check.assert_not_called()
+
+            await activate_async([], generate_schemas="check")
+            mock_check.assert_called_once_with()
+            self.assertEqual(mock_if_changed.call_count, 1)
+
+            with self.assertRaises(ValueError):
+                await activate_async([], generate_schemas="sometimes")
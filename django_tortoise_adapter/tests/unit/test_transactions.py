@@ -0,0 +1,197 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_tortoise_adapter"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        SECRET_KEY="test-key",
+    )
+    django.setup()
+
+import asyncio
+import os
+import tempfile
+from typing import Any
+
+from django.db import models as django_models
+from django.db.transaction import TransactionManagementError
+from tortoise import Tortoise, connections
+
+from django_tortoise_adapter.core import patch_model
+from django_tortoise_adapter.transactions import (
+    atomic,
+    get_atomic_aliases,
+    on_commit,
+)
+
+
+class Rollback(Exception):
+    pass
+
+
+class TestAtomic(unittest.IsolatedAsyncioTestCase):
+    manager: Any
+
+    async def asyncSetUp(self) -> None:
+        class Entry(django_models.Model):
+            text: django_models.CharField = django_models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        self.manager = patch_model(Entry)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    async def texts(self) -> list[str]:
+        qs = self.manager.order_by("text").values_list("text", flat=True)
+        return await qs  # type: ignore[no-any-return]
+
+    async def test_commit(self) -> None:
+        async with atomic():
+            self.assertEqual(get_atomic_aliases(), {"default"})
+            await self.manager.create(text="A")
+            await self.manager.bulk_create([self.manager.tortoise_model(text="B")])
+            self.assertEqual(await self.manager.count(), 2)
+        self.assertEqual(get_atomic_aliases(), frozenset())
+        self.assertEqual(await self.texts(), ["A", "B"])
+
+    async def test_rollback(self) -> None:
+        with self.assertRaises(Rollback):
+            async with atomic():
+                await self.manager.create(text="A")
+                await self.manager.filter(text="A").update(text="B")
+                raise Rollback
+        self.assertEqual(await self.texts(), [])
+
+    async def test_queries_use_the_transaction(self) -> None:
+        base = connections.get("default")
+        async with atomic():
+            transaction = connections.get("default")
+            self.assertIsNot(transaction, base)
+            self.assertIs(self.manager.get_queryset()._get_db(), transaction)
+            self.assertIs(self.manager._get_write_db(), transaction)
+
+    async def test_savepoints(self) -> None:
+        async with atomic():
+            await self.manager.create(text="A")
+            with self.assertRaises(Rollback):
+                async with atomic():
+                    await self.manager.create(text="B")
+                    raise Rollback
+            async with atomic():
+                await self.manager.create(text="C")
+        self.assertEqual(await self.texts(), ["A", "C"])
+
+    async def test_without_savepoint(self) -> None:
+        with self.assertRaises(Rollback):
+            async with atomic():
+                await self.manager.create(text="A")
+                async with atomic(savepoint=False):
+                    await self.manager.create(text="B")
+                raise Rollback
+        self.assertEqual(await self.texts(), [])
+
+    async def test_decorator(self) -> None:
+        @atomic
+        async def create(text: str, fail: bool = False) -> Any:
+            obj = await self.manager.create(text=text)
+            if fail:
+                raise Rollback
+            return obj
+
+        @atomic(using="default")
+        async def create_two() -> None:
+            await create("B")
+            await create("C", fail=True)
+
+        self.assertEqual((await create("A")).text, "A")
+        with self.assertRaises(Rollback):
+            await create_two()
+        self.assertEqual(await self.texts(), ["A"])
+
+    async def test_result_cache_is_bypassed(self) -> None:
+        self.manager.enable_cache()
+        try:
+            with self.assertRaises(Rollback):
+                async with atomic():
+                    await self.manager.create(text="A")
+                    self.assertEqual(await self.manager.count(), 1)
+                    raise Rollback
+            self.assertEqual(await self.manager.count(), 0)
+        finally:
+            self.manager.disable_cache()
+
+    async def test_result_cache_is_invalidated_on_commit(self) -> None:
+        # Two connections to the same database: "default" reads the
+        # committed rows while the transaction of "other" is open
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        db_url = "sqlite://" + os.path.join(directory.name, "db.sqlite3")
+        await Tortoise.close_connections()
+        await Tortoise.init(
+            config={
+                "connections": {"default": db_url, "other": db_url},
+                "apps": {
+                    "models": {
+                        "models": ["django_tortoise_adapter.models"],
+                        "default_connection": "default",
+                    }
+                },
+            }
+        )
+        await Tortoise.generate_schemas()
+        await self.manager.create(text="A")
+
+        async def read(started: asyncio.Event | None = None) -> int:
+            if started is not None:
+                await started.wait()
+            count = await self.manager.filter(text="B").count()
+            return count  # type: ignore[no-any-return]
+
+        self.manager.enable_cache()
+        try:
+            # A reader outside of the block (e.g. another request)
+            started = asyncio.Event()
+            reader = asyncio.ensure_future(read(started))
+            async with atomic(using="other"):
+                await self.manager.using("other").update(text="B")
+                started.set()
+                self.assertEqual(await reader, 0)
+            self.assertEqual(await read(), 1)
+        finally:
+            self.manager.disable_cache()
+
+    async def test_on_commit(self) -> None:
+        calls: list[str] = []
+
+        async def callback(name: str) -> None:
+            calls.append(name)
+
+        async with atomic():
+            on_commit(lambda: callback("A"))
+            async with atomic():
+                on_commit(lambda: callback("B"))
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, ["A", "B"])
+
+        with self.assertRaises(Rollback):
+            async with atomic():
+                on_commit(lambda: callback("C"))
+                raise Rollback
+        self.assertEqual(calls, ["A", "B"])
+
+        with self.assertRaises(TransactionManagementError):
+            on_commit(lambda: callback("D"))
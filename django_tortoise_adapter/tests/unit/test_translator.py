@@ -1,5 +1,9 @@
+import datetime
+import sqlite3
 import unittest
 from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
 
 import django
 from django.conf import settings
@@ -15,10 +19,16 @@ if not settings.configured:
     )
     django.setup()
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models as django_models
+from django.db.models.functions import Lower
+from tortoise import Tortoise
 from tortoise import fields as tortoise_fields
 from tortoise import models as tortoise_models
+from tortoise.exceptions import IntegrityError
+from tortoise.utils import get_schema_sql
 
+from django_tortoise_adapter.fields import HexUUIDField, IntervalField, NaiveTimeField
 from django_tortoise_adapter.translator import TortoiseTranslator
 
 
@@ -135,3 +145,254 @@ class TestTranslator(unittest.TestCase):
 
         t_field: Any = t_pet._meta.fields_map["owner"]
         self.assertEqual(t_field.related_name, "pets")
+
+
+class TestTranslatorIndexes(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        class IndexedAuthor(django_models.Model):
+            email: django_models.CharField = django_models.CharField(
+                max_length=100, unique=True
+            )
+            bio: django_models.TextField = django_models.TextField(unique=True)
+
+            class Meta:
+                app_label = "unit_tests"
+
+        class IndexedBook(django_models.Model):
+            author: django_models.ForeignKey = django_models.ForeignKey(
+                IndexedAuthor, on_delete=django_models.CASCADE, db_column="writer"
+            )
+            editor: django_models.OneToOneField = django_models.OneToOneField(
+                IndexedAuthor, on_delete=django_models.CASCADE, related_name="edited"
+            )
+            title: django_models.CharField = django_models.CharField(
+                max_length=100, db_index=True, db_column="book_title"
+            )
+            isbn: django_models.CharField = django_models.CharField(max_length=13)
+            published: django_models.BooleanField = django_models.BooleanField(
+                default=False
+            )
+
+            class Meta:
+                app_label = "unit_tests"
+                unique_together = (("author", "title"),)
+                indexes = (
+                    django_models.Index(fields=["-title", "isbn"], name="book_ti_is"),
+                    django_models.Index(
+                        fields=["isbn"],
+                        name="book_pub_is",
+                        condition=django_models.Q(published=True),
+                    ),
+                    # Not translatable
+                    django_models.Index(
+                        fields=["isbn"],
+                        name="book_recent",
+                        condition=django_models.Q(id__gt=100),
+                    ),
+                    django_models.Index(Lower("title"), name="book_lower"),
+                )
+                constraints = (
+                    django_models.UniqueConstraint(fields=["isbn"], name="book_isbn"),
+                    django_models.UniqueConstraint(
+                        fields=["title"],
+                        condition=django_models.Q(published=True),
+                        name="book_pub_title",
+                    ),
+                )
+
+        TortoiseTranslator.translate_model(IndexedAuthor)
+        self.t_book: Any = TortoiseTranslator.translate_model(IndexedBook)
+
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        await Tortoise.generate_schemas()
+        self.schema = get_schema_sql(Tortoise.get_connection("default"), safe=False)
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+
+    def get_table_sql(self, table: str) -> str:
+        start = self.schema.index(f'CREATE TABLE "{table}"')
+        end = self.schema.find("CREATE TABLE", start + 1)
+        return self.schema[start : end if end != -1 else None]
+
+    def test_field_options(self) -> None:
+        author_sql = self.get_table_sql("unit_tests_indexedauthor")
+        self.assertIn('"email" VARCHAR(100) NOT NULL UNIQUE', author_sql)
+        # Tortoise can't index TEXT columns
+        self.assertIn('"bio" TEXT NOT NULL\n', author_sql)
+
+        book_sql = self.get_table_sql("unit_tests_indexedbook")
+        self.assertIn('"book_title" VARCHAR(100) NOT NULL', book_sql)
+        self.assertIn('"writer" INT NOT NULL REFERENCES', book_sql)
+        self.assertIn('"editor_id" INT NOT NULL REFERENCES', book_sql)
+        self.assertRegex(book_sql, r'CREATE INDEX "\w+" ON "\w+" \("book_title"\);')
+        # Foreign keys are indexed like Django's
+        self.assertRegex(book_sql, r'CREATE INDEX "\w+" ON "\w+" \("writer"\);')
+        self.assertNotRegex(book_sql, r'CREATE INDEX "\w+" ON "\w+" \("editor_id"\);')
+
+    def test_unique_together(self) -> None:
+        self.assertEqual(
+            self.t_book._meta.unique_together,
+            (("editor_id",), ("author_id", "title"), ("isbn",)),
+        )
+        book_sql = self.get_table_sql("unit_tests_indexedbook")
+        self.assertRegex(book_sql, r'CONSTRAINT "\w+" UNIQUE \("editor_id"\)')
+        self.assertRegex(
+            book_sql, r'CONSTRAINT "\w+" UNIQUE \("writer", "book_title"\)'
+        )
+        self.assertRegex(book_sql, r'CONSTRAINT "\w+" UNIQUE \("isbn"\)')
+
+    def test_indexes(self) -> None:
+        self.assertEqual(
+            [index.name for index in self.t_book._meta.indexes],
+            ["book_ti_is", "book_pub_is"],
+        )
+        book_sql = self.get_table_sql("unit_tests_indexedbook")
+        self.assertIn(
+            'CREATE INDEX "book_ti_is" ON "unit_tests_indexedbook" '
+            '("book_title", "isbn");',
+            book_sql,
+        )
+        self.assertIn(
+            'CREATE INDEX "book_pub_is" ON "unit_tests_indexedbook" ("isbn") '
+            "WHERE published = true;",
+            book_sql,
+        )
+
+    async def test_constraints_are_enforced(self) -> None:
+        t_author = self.t_book._meta.fields_map["author"].related_model
+        author = await t_author.create(email="a@example.com", bio="")
+        await self.t_book.create(
+            author=author, editor=author, title="A", isbn="1", published=True
+        )
+        with self.assertRaises(IntegrityError):
+            await t_author.create(email="a@example.com", bio="")
+        with self.assertRaises(IntegrityError):
+            await self.t_book.create(author=author, editor=author, title="B", isbn="2")
+
+
+class TestTranslatorFieldTypes(unittest.IsolatedAsyncioTestCase):
+    def test_field_types(self) -> None:
+        expected = [
+            (django_models.BigAutoField(primary_key=True), tortoise_fields.BigIntField),
+            (
+                django_models.SmallAutoField(primary_key=True),
+                tortoise_fields.SmallIntField,
+            ),
+            (django_models.BigIntegerField(), tortoise_fields.BigIntField),
+            (django_models.SmallIntegerField(), tortoise_fields.SmallIntField),
+            (django_models.PositiveIntegerField(), tortoise_fields.IntField),
+            (django_models.PositiveBigIntegerField(), tortoise_fields.BigIntField),
+            (django_models.PositiveSmallIntegerField(), tortoise_fields.SmallIntField),
+            (django_models.UUIDField(), HexUUIDField),
+            (django_models.JSONField(), tortoise_fields.JSONField),
+            (django_models.BinaryField(), tortoise_fields.BinaryField),
+            (django_models.DurationField(), IntervalField),
+            (django_models.TimeField(), NaiveTimeField),
+            (django_models.EmailField(), tortoise_fields.CharField),
+            (django_models.URLField(), tortoise_fields.CharField),
+            (django_models.SlugField(), tortoise_fields.CharField),
+        ]
+        for d_field, t_type in expected:
+            with self.subTest(field=type(d_field).__name__):
+                t_field = TortoiseTranslator.translate_field(d_field)
+                self.assertIs(type(t_field), t_type)
+
+    def test_field_options(self) -> None:
+        t_field: Any = TortoiseTranslator.translate_field(
+            django_models.BigAutoField(primary_key=True)
+        )
+        self.assertTrue(t_field.pk)
+        self.assertTrue(t_field.generated)
+
+        t_field = TortoiseTranslator.translate_field(django_models.SlugField())
+        self.assertEqual(t_field.max_length, 50)
+        self.assertTrue(t_field.index)
+
+        t_field = TortoiseTranslator.translate_field(
+            django_models.TimeField(auto_now=True)
+        )
+        self.assertTrue(t_field.auto_now)
+
+    def test_postgres_values(self) -> None:
+        t_model: Any = MagicMock()
+        interval = IntervalField()
+        time = NaiveTimeField()
+        for field in (interval, time):
+            field.model = t_model
+        self.assertEqual(interval.get_for_dialect("postgres", "SQL_TYPE"), "INTERVAL")
+        self.assertEqual(time.get_for_dialect("postgres", "SQL_TYPE"), "TIME")
+
+        t_model._meta.db.capabilities.dialect = "postgres"
+        duration = datetime.timedelta(seconds=1)
+        self.assertEqual(interval.to_db_value(duration, t_model), duration)
+        self.assertEqual(time.to_db_value(datetime.time(1), t_model), datetime.time(1))
+        t_model._meta.db.capabilities.dialect = "sqlite"
+        self.assertEqual(interval.to_db_value(duration, t_model), 1000000)
+        self.assertEqual(time.to_db_value(datetime.time(1), t_model), "01:00:00")
+        # No process-wide sqlite3 adapter
+        self.assertNotIn((datetime.time, sqlite3.PrepareProtocol), sqlite3.adapters)
+
+    async def test_round_trip(self) -> None:
+        class Document(django_models.Model):
+            id: django_models.BigAutoField = django_models.BigAutoField(
+                primary_key=True
+            )
+            uuid: django_models.UUIDField = django_models.UUIDField(default=uuid4)
+            data: django_models.JSONField = django_models.JSONField(
+                encoder=DjangoJSONEncoder
+            )
+            blob: django_models.BinaryField = django_models.BinaryField()
+            duration: django_models.DurationField = django_models.DurationField()
+            time: django_models.TimeField = django_models.TimeField()
+
+            class Meta:
+                app_label = "unit_tests"
+
+        t_document: Any = TortoiseTranslator.translate_model(Document)
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["django_tortoise_adapter.models"]},
+        )
+        try:
+            await Tortoise.generate_schemas()
+            schema = get_schema_sql(Tortoise.get_connection("default"), safe=False)
+            self.assertIn('"uuid" CHAR(32) NOT NULL', schema)
+
+            doc = await t_document.create(
+                data={"at": datetime.date(2024, 1, 2), "tags": ["a"]},
+                blob=b"\x00\x01",
+                duration=datetime.timedelta(days=1, microseconds=5),
+                time=datetime.time(12, 30),
+            )
+            self.assertIsInstance(doc.id, int)
+
+            # Stored like Django, as 32 hex digits
+            conn = Tortoise.get_connection("default")
+            rows = await conn.execute_query_dict(
+                'SELECT "uuid", "duration", "time" FROM "unit_tests_document"'
+            )
+            self.assertEqual(rows[0]["uuid"], doc.uuid.hex)
+            self.assertEqual(rows[0]["duration"], 86400000005)
+            self.assertEqual(rows[0]["time"], "12:30:00")
+
+            fetched = await t_document.get(uuid=str(doc.uuid))
+            self.assertEqual(fetched.uuid, doc.uuid)
+            self.assertEqual(fetched.data, {"at": "2024-01-02", "tags": ["a"]})
+            self.assertEqual(fetched.blob, b"\x00\x01")
+            self.assertEqual(
+                fetched.duration, datetime.timedelta(days=1, microseconds=5)
+            )
+            self.assertEqual(fetched.time, datetime.time(12, 30))
+            self.assertEqual(
+                await t_document.filter(
+                    time=datetime.time(12, 30),
+                    duration=datetime.timedelta(days=1, microseconds=5),
+                ).count(),
+                1,
+            )
+        finally:
+            await Tortoise.close_connections()
@@ -0,0 +1,140 @@
+"""
+Transactions spanning TortoiseManager and TortoiseQuerySet calls.
+
+Inside atomic(), Tortoise's connections.get() returns the transaction's
+connection, so every query on that alias runs in the transaction. Reads
+that the routers would send elsewhere (e.g. to a replica) are pinned to it
+too, so they see the writes of the block (see routers.db_for_read).
+
+Callbacks registered with on_commit() run once the outermost block of
+their alias commits, e.g. to invalidate the results that other connections
+cached while the transaction was open.
+"""
+
+import functools
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, TypeVar
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.transaction import TransactionManagementError
+from tortoise.transactions import in_transaction
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# Aliases with an open atomic() block in the current context
+_atomic_aliases: ContextVar[frozenset[str]] = ContextVar(
+    "django_tortoise_adapter_atomic_aliases", default=frozenset()
+)
+
+_CommitCallbacks = dict[str, list[Callable[[], Awaitable[Any]]]]
+
+# Callbacks to run after the outermost block of each alias commits. Each
+# outermost block sets a new dict with its own list, which the tasks started
+# in the block share (they copy the context)
+_commit_callbacks: ContextVar[_CommitCallbacks | None] = ContextVar(
+    "django_tortoise_adapter_commit_callbacks", default=None
+)
+
+
+def get_atomic_aliases() -> frozenset[str]:
+    return _atomic_aliases.get()
+
+
+def on_commit(func: Callable[[], Awaitable[Any]], using: str | None = None) -> None:
+    """
+    Awaits func() once the outermost atomic() block of the using alias
+    ("default" by default) commits. Nothing is run if it rolls back.
+
+    :raises TransactionManagementError: Outside of an atomic() block of
+        the alias.
+    """
+    callbacks = _commit_callbacks.get()
+    using = using or DEFAULT_DB_ALIAS
+    if callbacks is None or using not in callbacks:
+        raise TransactionManagementError(
+            f"on_commit() called outside of an atomic() block of {using!r}."
+        )
+    callbacks[using].append(func)
+
+
+class Atomic:
+    """
+    Async context manager and decorator running its block in a
+    transaction on the given connection.
+
+    Nested blocks create savepoints: an exception rolls back to the
+    savepoint of the innermost block, leaving the outer transaction usable.
+    With savepoint=False, nested blocks join the outer transaction instead.
+    """
+
+    def __init__(self, using: str, savepoint: bool) -> None:
+        self.using = using
+        self.savepoint = savepoint
+        # One entry per (possibly nested) entry of this instance
+        self._stack: list[
+            tuple[Any, Token[frozenset[str]], Token[_CommitCallbacks | None] | None]
+        ] = []
+
+    async def __aenter__(self) -> Any:
+        aliases = _atomic_aliases.get()
+        context = None
+        if self.using not in aliases or self.savepoint:
+            context = in_transaction(self.using)
+            await context.__aenter__()
+        callbacks_token = None
+        if self.using not in aliases:
+            callbacks = {**(_commit_callbacks.get() or {}), self.using: []}
+            callbacks_token = _commit_callbacks.set(callbacks)
+        token = _atomic_aliases.set(aliases | {self.using})
+        self._stack.append((context, token, callbacks_token))
+        return None
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        context, token, callbacks_token = self._stack.pop()
+        _atomic_aliases.reset(token)
+        callbacks: list[Callable[[], Awaitable[Any]]] = []
+        if callbacks_token is not None:
+            callbacks = _commit_callbacks.get()[self.using]  # type: ignore[index]
+            _commit_callbacks.reset(callbacks_token)
+        if context is not None:
+            await context.__aexit__(exc_type, exc_val, exc_tb)
+        # Committed (the outermost block of the alias)
+        if exc_type is None:
+            for func in callbacks:
+                await func()
+
+    def __call__(self, func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            async with Atomic(self.using, self.savepoint):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+def atomic(using: Any = None, savepoint: bool = True) -> Any:
+    """
+    Like Django's transaction.atomic, for async code:
+
+        async with atomic():
+            question = await Question.objects.create(...)
+            await Choice.objects.bulk_create(...)
+
+        @atomic
+        async def vote(...): ...
+
+    :param using: Alias of the connection (DATABASES key), "default" by
+        default.
+    :param savepoint: Whether nested blocks create a savepoint.
+    """
+    # Used as @atomic, without parentheses
+    if callable(using):
+        return Atomic(DEFAULT_DB_ALIAS, savepoint)(using)
+    return Atomic(using or DEFAULT_DB_ALIAS, savepoint)
@@ -1,8 +1,34 @@
+import json
+from functools import partial
 from typing import Any
 
 from django.db import models as django_models
 from tortoise import fields as tortoise_fields
 from tortoise import models as tortoise_models
+from tortoise.indexes import PartialIndex
+
+from django_tortoise_adapter.fields import HexUUIDField, IntervalField, NaiveTimeField
+
+
+class ColumnIndex(PartialIndex):
+    """
+    Named (and possibly partial) index of a translated model.
+
+    Tortoise uses the field names of a named index as its column names, so
+    this maps them to the columns of the fields (e.g. their db_column).
+    """
+
+    def get_sql(self, schema_generator: Any, model: Any, safe: bool) -> str:
+        columns = [model._meta.fields_db_projection[field] for field in self.fields]
+        # pylint: disable=protected-access
+        return schema_generator._get_index_sql(  # type: ignore[no-any-return]
+            model,
+            columns,
+            safe,
+            index_name=self.name,
+            index_type=self.INDEX_TYPE,
+            extra=self.extra,
+        )
 
 
 class TortoiseTranslator:  # pylint: disable=too-few-public-methods
@@ -12,14 +38,31 @@ class TortoiseTranslator:  # pylint: disable=too-few-public-methods
 
     FIELD_MAPPING = {
         django_models.CharField: tortoise_fields.CharField,
+        django_models.EmailField: tortoise_fields.CharField,
+        django_models.URLField: tortoise_fields.CharField,
+        django_models.SlugField: tortoise_fields.CharField,
         django_models.IntegerField: tortoise_fields.IntField,
+        django_models.BigIntegerField: tortoise_fields.BigIntField,
+        django_models.SmallIntegerField: tortoise_fields.SmallIntField,
+        django_models.PositiveIntegerField: tortoise_fields.IntField,
+        django_models.PositiveBigIntegerField: tortoise_fields.BigIntField,
+        django_models.PositiveSmallIntegerField: tortoise_fields.SmallIntField,
         django_models.BooleanField: tortoise_fields.BooleanField,
         django_models.TextField: tortoise_fields.TextField,
         django_models.FloatField: tortoise_fields.FloatField,
         django_models.DecimalField: tortoise_fields.DecimalField,
         django_models.DateTimeField: tortoise_fields.DatetimeField,
         django_models.DateField: tortoise_fields.DateField,
-        django_models.AutoField: tortoise_fields.IntField,  # ID
+        django_models.TimeField: NaiveTimeField,
+        # Microseconds in a BIGINT, like Django on all backends but PostgreSQL
+        django_models.DurationField: IntervalField,
+        django_models.UUIDField: HexUUIDField,
+        django_models.JSONField: tortoise_fields.JSONField,
+        django_models.BinaryField: tortoise_fields.BinaryField,
+        # IDs
+        django_models.AutoField: tortoise_fields.IntField,
+        django_models.BigAutoField: tortoise_fields.BigIntField,
+        django_models.SmallAutoField: tortoise_fields.SmallIntField,
     }
 
     @classmethod
@@ -57,7 +100,12 @@ class TortoiseTranslator:  # pylint: disable=too-few-public-methods
             kwargs["default"] = django_field.default
 
         if isinstance(
-            django_field, (django_models.DateField, django_models.DateTimeField)
+            django_field,
+            (
+                django_models.DateField,
+                django_models.DateTimeField,
+                django_models.TimeField,
+            ),
         ):
             if getattr(django_field, "auto_now", False):
                 kwargs["auto_now"] = True
@@ -71,11 +119,134 @@ class TortoiseTranslator:  # pylint: disable=too-few-public-methods
             kwargs["max_digits"] = django_field.max_digits
             kwargs["decimal_places"] = django_field.decimal_places
 
-        if isinstance(django_field, django_models.AutoField):
+        if isinstance(django_field, django_models.JSONField):
+            # Django's encoder/decoder are JSONEncoder/JSONDecoder classes
+            if django_field.encoder:
+                kwargs["encoder"] = partial(json.dumps, cls=django_field.encoder)
+            if django_field.decoder:
+                kwargs["decoder"] = partial(json.loads, cls=django_field.decoder)
+
+        # AutoField, BigAutoField and SmallAutoField
+        if isinstance(django_field, django_models.fields.AutoFieldMixin):
             kwargs["primary_key"] = True
 
+        if django_field.db_column:
+            kwargs["source_field"] = django_field.db_column
+
+        # Tortoise refuses to index some types (e.g. TEXT, for MySQL)
+        indexable = getattr(tortoise_type, "indexable", True)
+        if indexable and not django_field.primary_key:
+            # A unique column is indexed already
+            if django_field.unique:
+                kwargs["unique"] = True
+            elif django_field.db_index:  # type: ignore[attr-defined]
+                kwargs["db_index"] = True
+
         return tortoise_type(**kwargs)  # type: ignore[no-any-return]
 
+    @classmethod
+    def translate_unique_together(
+        cls, django_model: type[django_models.Model]
+    ) -> tuple[tuple[str, ...], ...]:
+        """
+        Translates Meta.unique_together, the unconditional UniqueConstraints
+        on fields, and unique foreign keys (e.g. OneToOneFields) to Tortoise's
+        unique_together, with the Tortoise field names of the columns.
+        """
+        meta = django_model._meta  # pylint: disable=protected-access
+        unique_together: list[tuple[str, ...]] = [
+            (field.attname,)
+            for field in meta.fields
+            if isinstance(field, django_models.ForeignKey) and field.unique
+        ]
+        unique_together.extend(
+            cls._get_attnames(django_model, field_names)
+            for field_names in meta.unique_together
+        )
+        for constraint in meta.constraints:
+            # Conditional and expression constraints can't be expressed
+            if (
+                isinstance(constraint, django_models.UniqueConstraint)
+                and constraint.fields
+                and constraint.condition is None
+            ):
+                unique_together.append(
+                    cls._get_attnames(django_model, constraint.fields)
+                )
+        return tuple(dict.fromkeys(unique_together))
+
+    @classmethod
+    def translate_indexes(
+        cls, django_model: type[django_models.Model]
+    ) -> tuple[ColumnIndex, ...]:
+        """
+        Translates Meta.indexes to named Tortoise indexes. Expression indexes,
+        and partial indexes whose condition isn't a conjunction of equalities,
+        are left out. The field order (e.g. "-pub_date") is ignored.
+        """
+        meta = django_model._meta  # pylint: disable=protected-access
+        indexes = []
+        for index in meta.indexes:
+            if not index.fields:
+                continue
+            condition = None
+            if index.condition is not None:
+                condition = cls._translate_index_condition(
+                    django_model, index.condition
+                )
+                if condition is None:
+                    continue
+            indexes.append(
+                ColumnIndex(
+                    fields=list(
+                        cls._get_attnames(
+                            django_model, [name.lstrip("-") for name in index.fields]
+                        )
+                    ),
+                    name=index.name,
+                    condition=condition,
+                )
+            )
+        return tuple(indexes)
+
+    @staticmethod
+    def _translate_index_condition(
+        django_model: type[django_models.Model], condition: django_models.Q
+    ) -> dict[str, Any] | None:
+        """
+        Translates a Q(a=1, b=2) condition to Tortoise's {column: value} form,
+        or returns None if it can't be.
+        """
+        meta = django_model._meta  # pylint: disable=protected-access
+        if condition.connector != django_models.Q.AND or condition.negated:
+            return None
+        columns: dict[str, Any] = {}
+        for child in condition.children:
+            if not isinstance(child, tuple):
+                return None
+            lookup, value = child
+            name = lookup.removesuffix("__exact")
+            if "__" in name or hasattr(value, "resolve_expression"):
+                return None
+            field: Any = meta.get_field(name)
+            columns[field.column] = field.get_prep_value(value)
+        return columns
+
+    @staticmethod
+    def _get_attnames(
+        django_model: type[django_models.Model], field_names: Any
+    ) -> tuple[str, ...]:
+        """
+        Returns the Tortoise names of the columns of the given fields (e.g.
+        "author_id" for the "author" foreign key).
+        """
+        meta = django_model._meta  # pylint: disable=protected-access
+        # Concrete fields (of indexes and constraints), never reverse relations
+        return tuple(
+            meta.get_field(name).attname  # type: ignore[union-attr]
+            for name in field_names
+        )
+
     @classmethod
     def translate_model(
         cls, django_model: type[django_models.Model]
@@ -91,6 +262,8 @@ class TortoiseTranslator:  # pylint: disable=too-few-public-methods
         # Internal class Meta for Tortoise
         class Meta:
             table = meta.db_table
+            unique_together = cls.translate_unique_together(django_model)
+            indexes = cls.translate_indexes(django_model)
 
         attrs["Meta"] = Meta
 
@@ -118,6 +291,12 @@ class TortoiseTranslator:  # pylint: disable=too-few-public-methods
                         f"models.{relation_name}",
                         related_name=related_name,
                         null=field.null,
+                        source_field=field.db_column,
+                        # Unique foreign keys are in unique_together
+                        db_index=(
+                            field.db_index  # type: ignore[attr-defined]
+                            and not field.unique
+                        ),
                     )  # type: ignore[call-overload]
                     attrs[field.name] = t_field
                 continue
@@ -151,13 +330,19 @@ class TortoiseTranslator:  # pylint: disable=too-few-public-methods
 
         # Create the Tortoise model class
         tortoise_cls = type(django_model.__name__, (tortoise_models.Model,), attrs)
+        # Update __module__ to point to the registry
+        tortoise_cls.__module__ = "django_tortoise_adapter.models"
+        cls.register_model(tortoise_cls)
+
+        return tortoise_cls
 
-        # Inject into our internal registry module so Tortoise can find it
+    @staticmethod
+    def register_model(tortoise_cls: type[tortoise_models.Model]) -> None:
+        """
+        Injects the Tortoise model into our internal registry module so
+        Tortoise can find it.
+        """
         # pylint: disable=import-outside-toplevel
         import django_tortoise_adapter.models
 
-        setattr(django_tortoise_adapter.models, django_model.__name__, tortoise_cls)
-        # Update __module__ to point there
-        tortoise_cls.__module__ = "django_tortoise_adapter.models"
-
-        return tortoise_cls
+        setattr(django_tortoise_adapter.models, tortoise_cls.__name__, tortoise_cls)